@@ -0,0 +1,11 @@
+"""
+Backtest module for trading bot.
+Contains parallel and coarse-to-fine parameter search over BACKTEST_SETTINGS ranges.
+"""
+
+from .coarse_to_fine import refine
+from .feed_cache import FeedCache
+from .grid_runner import GridRunner, Pruner, expand_grid
+from .trial_store import TrialStore
+
+__all__ = ['FeedCache', 'GridRunner', 'Pruner', 'TrialStore', 'expand_grid', 'refine']
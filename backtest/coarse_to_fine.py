@@ -0,0 +1,105 @@
+"""
+Coarse-to-Fine - Multi-resolution parameter search.
+Samples the outer corners of an optimization grid first, then repeatedly
+searches shrinking windows around the best combinations instead of running
+the full Cartesian sweep.
+"""
+
+import itertools
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _nearest(values: List, target: float):
+    """Return the configured value closest to target."""
+    return min(values, key=lambda v: abs(v - target))
+
+
+def _window(values: List, center, radius: float, points: int) -> List:
+    """
+    Build a local axis of equidistant points around center.
+    
+    Points are snapped to the configured values, so refinement never leaves
+    the ranges the user declared in BACKTEST_SETTINGS.
+    """
+    if points < 2 or radius <= 0:
+        return [center]
+    step = 2 * radius / (points - 1)
+    targets = [center - radius + i * step for i in range(points)]
+    return sorted({_nearest(values, t) for t in targets})
+
+
+def refine(grid_dict: Dict, evaluate_fn: Callable[[Dict], Optional[float]], levels: int = 2,
+           window_shrink: float = 0.5, top_k: int = 3, points: int = 3,
+           cache: Optional[Dict[tuple, Optional[float]]] = None) -> Tuple[Optional[Dict], Dict[tuple, Optional[float]]]:
+    """
+    Coarse-to-fine search over an optimization grid.
+    
+    The first pass evaluates only the minimum and maximum of every parameter.
+    Each following level takes the top_k combinations by score and evaluates
+    a local grid of `points` values per parameter centered on them, with the
+    window radius multiplied by window_shrink every level.
+    
+    Args:
+        grid_dict: One of the *_optimization dicts from BACKTEST_SETTINGS
+        evaluate_fn: Callable taking {param: value} and returning a score
+                     (e.g. Sharpe ratio), or None if the combo made no trades
+        levels: Number of refinement passes after the coarse pass
+        window_shrink: Factor applied to the window radius per level
+        top_k: Number of best combinations refined per level
+        points: Values per parameter in each local grid
+        cache: Optional dict of already evaluated {param tuple: score};
+               updated in place so re-runs skip finished combos
+    
+    Returns:
+        Tuple of (best parameters dict or None, cache of all scores)
+    """
+    cache = {} if cache is None else cache
+    names = [key for key, values in grid_dict.items() if isinstance(values, (list, tuple))]
+    axes = [sorted(grid_dict[name]) for name in names]
+    
+    def evaluate(combos) -> None:
+        evaluated = 0
+        for combo in combos:
+            if combo in cache:
+                continue
+            try:
+                cache[combo] = evaluate_fn(dict(zip(names, combo)))
+            except Exception as e:
+                logger.error(f"Coarse-to-fine: Error evaluating {combo}: {e}")
+                cache[combo] = None
+            evaluated += 1
+        logger.debug(f"Coarse-to-fine: Evaluated {evaluated} new combinations")
+    
+    def ranked() -> List[tuple]:
+        scored = [combo for combo, score in cache.items() if score is not None]
+        return sorted(scored, key=lambda combo: cache[combo], reverse=True)
+    
+    # Coarse pass - outermost values of every axis
+    evaluate(itertools.product(*({axis[0], axis[-1]} for axis in axes)))
+    
+    radii = [(axis[-1] - axis[0]) * window_shrink for axis in axes]
+    for _ in range(levels):
+        winners = ranked()[:top_k]
+        if not winners:
+            break
+        
+        for winner in winners:
+            local_axes = [
+                _window(axis, center, radius, points)
+                for axis, center, radius in zip(axes, winner, radii)
+            ]
+            evaluate(itertools.product(*local_axes))
+        
+        radii = [radius * window_shrink for radius in radii]
+    
+    best = ranked()
+    if not best:
+        return None, cache
+    
+    logger.info(f"Coarse-to-fine: Best {dict(zip(names, best[0]))} "
+                f"(score {cache[best[0]]:.3f}, {len(cache)} combinations evaluated)")
+    return dict(zip(names, best[0])), cache
@@ -0,0 +1,199 @@
+"""
+Feed Cache - Shared OHLCV history for backtest workers.
+Fetches each (coin, interval) candle series once and publishes it in shared
+memory so every grid-search worker reads the same read-only buffer.
+"""
+
+import time
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import requests
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Candle array column layout (float64, one row per candle)
+OPEN, HIGH, LOW, CLOSE, VOLUME, TS = range(6)
+CANDLE_COLUMNS = ('open', 'high', 'low', 'close', 'volume', 'ts')
+CANDLE_DTYPE = np.dtype([(name, np.float64) for name in CANDLE_COLUMNS])
+
+# Minutes per Binance interval
+INTERVAL_MINUTES = {
+    '1m': 1,
+    '5m': 5,
+    '15m': 15,
+    '1h': 60,
+    '4h': 240,
+    '1d': 1440
+}
+
+
+def fetch_candles(coin: str, interval: str, minutes: int) -> Optional[np.ndarray]:
+    """
+    Fetch historical candles from Binance as a float64 array.
+    
+    Args:
+        coin: Coin symbol (e.g., "BTC", "ETH")
+        interval: Binance interval (e.g., "1m", "5m")
+        minutes: Time range to fetch in minutes
+    
+    Returns:
+        Array of shape (n, 6) with CANDLE_COLUMNS or None if failed
+    """
+    try:
+        candles_needed = minutes // INTERVAL_MINUTES.get(interval, 1)
+        end_time = int(datetime.now().timestamp() * 1000)
+        start_time = end_time - (minutes * 60 * 1000)
+        
+        response = requests.get(
+            "https://api.binance.com/api/v3/klines",
+            params={
+                'symbol': f"{coin}USDT",
+                'interval': interval,
+                'startTime': start_time,
+                'endTime': end_time,
+                'limit': min(candles_needed, 1000)  # Binance max is 1000
+            },
+            timeout=30
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        # Binance kline rows: [open_time, open, high, low, close, volume, ...]
+        candles = np.array([row[1:6] + [row[0]] for row in data], dtype=np.float64)
+        return candles.reshape(-1, len(CANDLE_COLUMNS))
+        
+    except Exception as e:
+        logger.error(f"Failed to fetch candles for {coin}: {e}")
+        return None
+
+
+def attach(name: str, shape: Tuple[int, int]) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    Attach to a published candle buffer from a worker process.
+    
+    The caller must drop the array before calling shm.close().
+    
+    Args:
+        name: Shared memory block name from FeedCache.share()
+        shape: Array shape from FeedCache.share()
+    
+    Returns:
+        Tuple of (shared memory handle, read-only candle array)
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    candles = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    candles.flags.writeable = False
+    return shm, candles
+
+
+class FeedCache:
+    """
+    One shared-memory candle buffer per (coin, interval).
+    
+    Entries younger than max_age seconds are reused; older ones are fetched
+    again, which only matters for live grid searches (historical sweeps
+    finish each coin well inside the window). Use as a context manager or
+    call close() to release the shared memory blocks.
+    """
+    
+    def __init__(self, minutes: int = 1440, max_age: float = 5.0):
+        """
+        Initialize feed cache.
+        
+        Args:
+            minutes: Historical time range to fetch in minutes
+            max_age: Seconds before a cached series is refreshed
+        """
+        self.minutes = minutes
+        self.max_age = max_age
+        
+        # (coin, interval) -> (shared memory, shape, fetched_at)
+        self._entries: Dict[Tuple[str, str], Tuple[shared_memory.SharedMemory, Tuple[int, int], float]] = {}
+    
+    def put(self, coin: str, interval: str, candles: np.ndarray) -> Tuple[str, Tuple[int, int]]:
+        """
+        Publish a candle array, replacing any existing entry.
+        
+        Args:
+            coin: Coin symbol
+            interval: Binance interval
+            candles: Array of shape (n, 6) with CANDLE_COLUMNS
+        
+        Returns:
+            Tuple of (shared memory name, shape) for attach()
+        """
+        candles = np.ascontiguousarray(candles, dtype=np.float64).reshape(-1, len(CANDLE_COLUMNS))
+        self._release((coin, interval))
+        
+        shm = shared_memory.SharedMemory(create=True, size=max(candles.nbytes, 1))
+        np.ndarray(candles.shape, dtype=np.float64, buffer=shm.buf)[:] = candles
+        self._entries[(coin, interval)] = (shm, candles.shape, time.monotonic())
+        return shm.name, candles.shape
+    
+    def share(self, coin: str, interval: str) -> Optional[Tuple[str, Tuple[int, int]]]:
+        """
+        Get the shared buffer for a series, fetching it if missing or stale.
+        
+        Args:
+            coin: Coin symbol
+            interval: Binance interval
+        
+        Returns:
+            Tuple of (shared memory name, shape) for attach() or None if failed
+        """
+        entry = self._entries.get((coin, interval))
+        if entry and time.monotonic() - entry[2] < self.max_age:
+            return entry[0].name, entry[1]
+        
+        candles = fetch_candles(coin, interval, self.minutes)
+        if candles is None:
+            # Keep serving the previous series rather than failing a live search
+            return (entry[0].name, entry[1]) if entry else None
+        
+        return self.put(coin, interval, candles)
+    
+    def get(self, coin: str, interval: str) -> Optional[np.recarray]:
+        """
+        Get a series as a read-only record array (open, high, low, close, volume, ts).
+        
+        Args:
+            coin: Coin symbol
+            interval: Binance interval
+        
+        Returns:
+            Record array view of the shared buffer or None if failed
+        """
+        if self.share(coin, interval) is None:
+            return None
+        
+        shm, shape, _ = self._entries[(coin, interval)]
+        candles = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        candles.flags.writeable = False
+        return candles.view(CANDLE_DTYPE).reshape(-1).view(np.recarray)
+    
+    def _release(self, key: Tuple[str, str]):
+        """Close and unlink one shared memory block."""
+        entry = self._entries.pop(key, None)
+        if entry:
+            try:
+                entry[0].close()
+            except BufferError:
+                # A get() view is still alive; the mapping goes away with it
+                logger.debug(f"FeedCache: {key} still referenced, unlinking only")
+            entry[0].unlink()
+    
+    def close(self):
+        """Release all shared memory blocks."""
+        for key in list(self._entries):
+            self._release(key)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
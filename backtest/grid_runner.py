@@ -0,0 +1,523 @@
+"""
+Grid Runner - Parallel hyperparameter grid search for backtests.
+Expands the *_optimization ranges from BACKTEST_SETTINGS and evaluates every
+combination with vectorized NumPy indicators across a process pool.
+"""
+
+import itertools
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import BACKTEST_SETTINGS
+from utils.logger import get_logger
+from . import indicators_nb
+from .feed_cache import CLOSE, LOW, VOLUME, FeedCache, attach
+from .trial_store import TrialStore
+
+logger = get_logger(__name__)
+
+
+def expand_grid(optimization: Dict) -> Tuple[List[str], List[tuple]]:
+    """
+    Expand an optimization dict into its Cartesian product.
+    
+    Args:
+        optimization: One of the *_optimization dicts from BACKTEST_SETTINGS
+    
+    Returns:
+        Tuple of (parameter names, list of parameter tuples)
+    """
+    names = [key for key, values in optimization.items() if isinstance(values, (list, tuple))]
+    combos = list(itertools.product(*(optimization[name] for name in names)))
+    return names, combos
+
+
+# ---------------------------------------------------------------------------
+# Vectorized indicators - each computes every period/span in one call
+# (Numba kernels from indicators_nb when numba is installed)
+# ---------------------------------------------------------------------------
+
+def rolling_mean_batch(values: np.ndarray, periods) -> np.ndarray:
+    """
+    Rolling mean for several window sizes at once using cumulative sums.
+    
+    Args:
+        values: 1-D input series
+        periods: Iterable of window sizes
+    
+    Returns:
+        Array of shape (len(periods), len(values)), NaN before each window fills
+    """
+    periods = np.asarray(periods, dtype=np.int64)
+    if indicators_nb.NUMBA_AVAILABLE:
+        return indicators_nb.sma_batch(np.ascontiguousarray(values, dtype=np.float64), periods)
+    
+    n = values.shape[0]
+    cumsum = np.concatenate(([0.0], np.cumsum(values)))
+    out = np.full((periods.size, n), np.nan)
+    for row, period in enumerate(periods):
+        if period <= n:
+            out[row, period - 1:] = (cumsum[period:] - cumsum[:n - period + 1]) / period
+    return out
+
+
+def rsi_batch(closes: np.ndarray, periods) -> np.ndarray:
+    """
+    RSI for several periods at once (same simple-average RSI as the signals).
+    
+    Args:
+        closes: 1-D closing prices
+        periods: Iterable of RSI periods
+    
+    Returns:
+        Array of shape (len(periods), len(closes))
+    """
+    if indicators_nb.NUMBA_AVAILABLE:
+        return indicators_nb.rsi_batch(
+            np.ascontiguousarray(closes, dtype=np.float64),
+            np.asarray(periods, dtype=np.int64)
+        )
+    
+    deltas = np.diff(closes, prepend=closes[0])
+    gains = rolling_mean_batch(np.maximum(deltas, 0.0), periods)
+    losses = rolling_mean_batch(np.maximum(-deltas, 0.0), periods)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100.0 - (100.0 / (1.0 + gains / losses))
+
+
+def ema_batch(values: np.ndarray, spans) -> np.ndarray:
+    """
+    Exponential moving average (pandas ewm adjust=False) for several spans.
+    
+    Args:
+        values: 1-D series shared by all spans, or 2-D with one row per span
+        spans: Iterable of EMA spans
+    
+    Returns:
+        Array of shape (len(spans), n)
+    """
+    spans = np.asarray(spans, dtype=np.float64)
+    values = np.broadcast_to(values, (spans.size, values.shape[-1]))
+    if indicators_nb.NUMBA_AVAILABLE:
+        return indicators_nb.ema_batch(np.ascontiguousarray(values, dtype=np.float64), spans)
+    
+    alpha = 2.0 / (spans + 1.0)
+    
+    out = np.empty(values.shape)
+    out[:, 0] = values[:, 0]
+    decay = 1.0 - alpha
+    # Recurrence runs over time once; all spans advance together per step
+    for t in range(1, values.shape[1]):
+        out[:, t] = alpha * values[:, t] + decay * out[:, t - 1]
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Trade simulation, pruning and per-strategy signals
+# ---------------------------------------------------------------------------
+
+class Pruner:
+    """
+    Percentile pruner for early stopping of weak trials.
+    
+    The candle history is walked in segments; at every checkpoint the
+    cumulative PnL (realized plus open position) of each living trial is
+    compared to the others and trials below the given percentile stop.
+    Pruned trials are reported as having no result.
+    """
+    
+    def __init__(self, checkpoints: Tuple[float, ...] = (0.2, 0.4, 0.6, 0.8),
+                 percentile: float = 25.0, min_trials: int = 8):
+        """
+        Initialize pruner.
+        
+        Args:
+            checkpoints: Fractions of the history after which to prune
+            percentile: Trials below this PnL percentile are dropped
+            min_trials: Never prune when fewer trials are still alive
+        """
+        self.checkpoints = checkpoints
+        self.percentile = percentile
+        self.min_trials = min_trials
+    
+    @property
+    def key(self) -> str:
+        """Settings identifying this pruner in a TrialStore."""
+        return json.dumps([list(self.checkpoints), self.percentile, self.min_trials])
+    
+    def bounds(self, n: int) -> List[int]:
+        """Segment end indices for a history of n candles."""
+        cuts = {int(n * fraction) for fraction in self.checkpoints}
+        return sorted(cut for cut in cuts if 0 < cut < n) + [n]
+    
+    def keep(self, pnl: np.ndarray) -> np.ndarray:
+        """
+        Decide which trials survive a checkpoint.
+        
+        Args:
+            pnl: Cumulative PnL of the living trials
+        
+        Returns:
+            Boolean mask of trials to keep
+        """
+        if pnl.size < self.min_trials:
+            return np.ones(pnl.size, dtype=bool)
+        return pnl >= np.percentile(pnl, self.percentile)
+
+
+class _Trial:
+    """Long-only trade walk for one parameter combination, segment by segment."""
+    
+    __slots__ = ('buy', 'sell', 'events', 'cursor', 'entry_price', 'profits')
+    
+    def __init__(self, buy: np.ndarray, sell: np.ndarray):
+        self.buy = buy
+        self.sell = sell & ~buy
+        self.events = np.flatnonzero(buy | self.sell)
+        self.cursor = 0
+        self.entry_price = None
+        self.profits = []
+    
+    def advance(self, end: int, closes: np.ndarray, position_size: float):
+        """
+        Process signals before index end.
+        
+        Mirrors BacktestPage._simulate_trades: a BUY opens when flat and the
+        next SELL closes it.
+        """
+        events = self.events
+        cursor = self.cursor
+        while cursor < events.size and events[cursor] < end:
+            i = events[cursor]
+            if self.entry_price is None:
+                if self.buy[i]:
+                    self.entry_price = closes[i]
+            elif self.sell[i]:
+                self.profits.append((closes[i] - self.entry_price) / self.entry_price * position_size)
+                self.entry_price = None
+            cursor += 1
+        self.cursor = cursor
+    
+    def pnl(self, price: float, position_size: float) -> float:
+        """Realized PnL plus the open position marked at price."""
+        open_pnl = 0.0
+        if self.entry_price is not None:
+            open_pnl = (price - self.entry_price) / self.entry_price * position_size
+        return sum(self.profits) + open_pnl
+    
+    def summary(self) -> Optional[Dict]:
+        """Backtest metrics, or None if no trade was completed."""
+        if not self.profits:
+            return None
+        
+        profits = np.asarray(self.profits)
+        total_trades = profits.size
+        winning_trades = int((profits > 0).sum())
+        total_profit = float(profits.sum())
+        std = profits.std()
+        
+        return {
+            'total_trades': total_trades,
+            'winning_trades': winning_trades,
+            'losing_trades': total_trades - winning_trades,
+            'win_rate': winning_trades / total_trades * 100,
+            'total_profit_usd': total_profit,
+            'avg_profit': total_profit / total_trades,
+            'sharpe': float(profits.mean() / std * math.sqrt(total_trades)) if std > 0 else 0.0,
+            'signals_generated': int(self.events.size)
+        }
+
+
+def _run_trials(signals: Callable[[int], Tuple[np.ndarray, np.ndarray]], count: int,
+                closes: np.ndarray, position_size: float,
+                pruner: Optional[Pruner] = None) -> Tuple[List, List[int]]:
+    """
+    Walk every trial through the history, pruning at checkpoints.
+    
+    Args:
+        signals: Returns the (buy, sell) masks of the trial at an index
+        count: Number of trials
+        closes: Closing prices
+        position_size: USD per trade
+        pruner: Optional Pruner for early stopping
+    
+    Returns:
+        (metrics dict or None per trial in order, indexes of pruned trials).
+        Pruned trials also report None, so the index list is what tells
+        them apart from trials that completed without a trade.
+    """
+    n = closes.size
+    bounds = pruner.bounds(n) if pruner else [n]
+    trials = [_Trial(*signals(i)) for i in range(count)]
+    alive = np.arange(count)
+    
+    for end in bounds:
+        for i in alive:
+            trials[i].advance(end, closes, position_size)
+        
+        if pruner and end < n:
+            pnl = np.array([trials[i].pnl(closes[end - 1], position_size) for i in alive])
+            alive = alive[pruner.keep(pnl)]
+    
+    finished = set(alive.tolist())
+    results = [trial.summary() if i in finished else None for i, trial in enumerate(trials)]
+    return results, [i for i in range(count) if i not in finished]
+
+
+def _crosses(fast: np.ndarray, slow: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (bullish, bearish) crossover masks of fast vs slow."""
+    up = np.zeros(fast.shape, dtype=bool)
+    down = np.zeros(fast.shape, dtype=bool)
+    up[1:] = (fast[:-1] <= slow[:-1]) & (fast[1:] > slow[1:])
+    down[1:] = (fast[:-1] >= slow[:-1]) & (fast[1:] < slow[1:])
+    return up, down
+
+
+def _signals_rsi(candles: np.ndarray, combos: List[tuple]) -> Callable:
+    """Signal masks for (period, oversold, overbought) combos."""
+    closes = candles[:, CLOSE]
+    periods = sorted({c[0] for c in combos})
+    rsi = dict(zip(periods, rsi_batch(closes, periods)))
+    
+    def signals(i: int):
+        period, oversold, overbought = combos[i]
+        values = rsi[period]
+        return values <= oversold, values >= overbought
+    return signals
+
+
+def _signals_sma(candles: np.ndarray, combos: List[tuple]) -> Callable:
+    """Signal masks for (short_period, long_period) combos."""
+    closes = candles[:, CLOSE]
+    periods = sorted({p for combo in combos for p in combo})
+    sma = dict(zip(periods, rolling_mean_batch(closes, periods)))
+    
+    def signals(i: int):
+        short_period, long_period = combos[i]
+        return _crosses(sma[short_period], sma[long_period])
+    return signals
+
+
+def _signals_range(candles: np.ndarray, combos: List[tuple]) -> Callable:
+    """Signal masks for (long_offset, tolerance) combos."""
+    closes = candles[:, CLOSE]
+    period_low = candles[:, LOW].min()
+    
+    def signals(i: int):
+        long_offset, tolerance = combos[i]
+        range_low = period_low * (1 + long_offset / 100)
+        range_high = period_low * (1 + long_offset / 100 + tolerance / 100)
+        
+        # The in-range state after each candle equals "close is inside the range",
+        # so entries/exits are simply the edges of that mask
+        inside = (closes >= range_low) & (closes <= range_high)
+        was_inside = np.concatenate(([False], inside[:-1]))
+        return inside & ~was_inside, ~inside & was_inside
+    return signals
+
+
+def _signals_scalping(candles: np.ndarray, combos: List[tuple]) -> Callable:
+    """Signal masks for (fast_ema, slow_ema, rsi_period, rsi_oversold, rsi_overbought, volume_multiplier) combos."""
+    closes = candles[:, CLOSE]
+    volumes = candles[:, VOLUME]
+    
+    spans = sorted({c[0] for c in combos} | {c[1] for c in combos})
+    ema = dict(zip(spans, ema_batch(closes, spans)))
+    rsi_periods = sorted({c[2] for c in combos})
+    rsi = dict(zip(rsi_periods, rsi_batch(closes, rsi_periods)))
+    avg_volume = rolling_mean_batch(volumes, [20])[0]
+    
+    def signals(i: int):
+        fast, slow, rsi_period, rsi_os, rsi_ob, vol_mult = combos[i]
+        up, down = _crosses(ema[fast], ema[slow])
+        values = rsi[rsi_period]
+        confirmed = (values > rsi_os) & (values < rsi_ob) & (volumes > avg_volume * vol_mult)
+        return up & confirmed, down & confirmed
+    return signals
+
+
+def _signals_macd(candles: np.ndarray, combos: List[tuple]) -> Callable:
+    """Signal masks for (fast, slow, signal) combos."""
+    closes = candles[:, CLOSE]
+    spans = sorted({c[0] for c in combos} | {c[1] for c in combos})
+    ema = dict(zip(spans, ema_batch(closes, spans)))
+    
+    macd = np.array([ema[fast] - ema[slow] for fast, slow, _ in combos])
+    histogram = macd - ema_batch(macd, [c[2] for c in combos])
+    zeros = np.zeros(closes.shape)
+    
+    def signals(i: int):
+        return _crosses(histogram[i], zeros)
+    return signals
+
+
+_SIGNALS = {
+    'rsi': _signals_rsi,
+    'sma': _signals_sma,
+    'range': _signals_range,
+    'scalping': _signals_scalping,
+    'macd': _signals_macd,
+}
+
+# Families whose grids are large enough that pruning pays off by default
+_PRUNED_FAMILIES = {'scalping', 'macd'}
+
+
+def _evaluate_chunk(shm_name: str, shape: Tuple[int, int], family: str, combos: List[tuple],
+                    position_size: float, pruner: Optional[Pruner] = None) -> Tuple[List, List[int]]:
+    """
+    Worker entry point - attach to the shared candle buffer and evaluate combos.
+    
+    Runs inside a pool process, so it must stay a module-level function.
+    Pruning compares trials within the chunk.
+    
+    Returns:
+        (metrics dict or None per combo, indexes of pruned combos)
+    """
+    shm, candles = attach(shm_name, shape)
+    try:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            signals = _SIGNALS[family](candles, combos)
+            results = _run_trials(signals, len(combos), candles[:, CLOSE], position_size, pruner)
+        del candles, signals  # Release the buffer views before closing
+        return results
+    finally:
+        shm.close()
+
+
+class GridRunner:
+    """
+    Parallel grid search for one algorithm over its BACKTEST_SETTINGS ranges.
+    
+    Candles for each coin come from a FeedCache (fetched once, shared memory)
+    and are evaluated by a process pool in contiguous chunks of the parameter grid.
+    """
+    
+    def __init__(self, algo: str, minutes: int = 1440, position_size: Optional[float] = None,
+                 max_workers: Optional[int] = None, pruner: Optional[Pruner] = None,
+                 store: Optional[TrialStore] = None):
+        """
+        Initialize grid runner.
+        
+        Args:
+            algo: Algorithm name (e.g., "rsi_1min", "macd_15min")
+            minutes: Historical time range in minutes (default: 24 hours)
+            position_size: USD per trade (default: BACKTEST_SETTINGS value)
+            max_workers: Worker processes (default: os.cpu_count())
+            pruner: Early-stopping pruner (default: Pruner() for scalping/MACD)
+            store: Optional TrialStore; combos with a stored result are not re-run
+        """
+        config_key = f"{algo}_optimization"
+        if config_key not in BACKTEST_SETTINGS:
+            raise ValueError(f"No optimization ranges configured for {algo}")
+        
+        self.algo = algo
+        self.family = algo.split('_', 1)[0]
+        if self.family not in _SIGNALS:
+            raise ValueError(f"No backtest evaluator for {algo}")
+        
+        self.optimization = BACKTEST_SETTINGS[config_key]
+        self.interval = self.optimization.get('interval', '1m')
+        self.names, self.combos = expand_grid(self.optimization)
+        self.minutes = minutes
+        self.position_size = position_size or BACKTEST_SETTINGS.get('position_size_usd', 100)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.pruner = pruner or (Pruner() if self.family in _PRUNED_FAMILIES else None)
+        self.store = store
+        
+        logger.info(f"GridRunner {algo}: {len(self.combos)} combinations of {', '.join(self.names)}")
+    
+    def _chunks(self, combos: List[tuple]) -> List[List[tuple]]:
+        """Split combos into contiguous chunks (a few per worker)."""
+        size = max(1, math.ceil(len(combos) / (self.max_workers * 4)))
+        return [combos[i:i + size] for i in range(0, len(combos), size)]
+    
+    def _run_coin(self, pool: ProcessPoolExecutor, coin: str, shared: Tuple[str, Tuple[int, int]]) -> List[Dict]:
+        """
+        Evaluate the whole grid for one coin.
+        
+        Args:
+            pool: Process pool to dispatch chunks to
+            coin: Coin symbol
+            shared: (shared memory name, shape) of the coin's candles
+        
+        Returns:
+            List of result rows (parameters + metrics) for combos with trades
+        """
+        shm_name, shape = shared
+        pruner_key = self.pruner.key if self.pruner else None
+        done = self.store.completed(coin, self.algo, pruner_key) if self.store else {}
+        pending = [combo for combo in self.combos if combo not in done]
+        if done:
+            logger.info(f"GridRunner {self.algo}: {coin} resuming, "
+                        f"{len(self.combos) - len(pending)} combinations already stored")
+        
+        chunks = self._chunks(pending)
+        futures = [
+            pool.submit(_evaluate_chunk, shm_name, shape, self.family, chunk, self.position_size, self.pruner)
+            for chunk in chunks
+        ]
+        
+        results = {combo: done[combo] for combo in self.combos if combo in done}
+        for chunk, future in zip(chunks, futures):
+            stats, pruned = future.result()
+            chunk_results = list(zip(chunk, stats))
+            if self.store:
+                # Checkpoint per chunk. Pruned trials are marked with the
+                # pruner's key so only a run with the same pruner skips them
+                pruned = set(pruned)
+                self.store.record(coin, self.algo,
+                                  [result for i, result in enumerate(chunk_results) if i not in pruned])
+                if pruned:
+                    self.store.record_pruned(coin, self.algo, [chunk[i] for i in sorted(pruned)], pruner_key)
+            results.update(chunk_results)
+        
+        return [
+            {'coin': coin, **dict(zip(self.names, combo)), **stats}
+            for combo, stats in results.items() if stats
+        ]
+    
+    def run(self, coins: List[str], candles: Optional[Dict[str, np.ndarray]] = None,
+            feed: Optional[FeedCache] = None) -> pd.DataFrame:
+        """
+        Run the grid search for several coins.
+        
+        Args:
+            coins: Coin symbols to test
+            candles: Optional pre-fetched candle arrays by coin
+            feed: Optional FeedCache to reuse across runners (closed by the caller)
+        
+        Returns:
+            DataFrame indexed by (coin, *parameter names), one row per combo
+        """
+        candles = candles or {}
+        own_feed = feed is None
+        feed = feed or FeedCache(minutes=self.minutes)
+        rows = []
+        
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                for coin in coins:
+                    if coin in candles:
+                        shared = feed.put(coin, self.interval, candles[coin])
+                    else:
+                        shared = feed.share(coin, self.interval)
+                    if shared is None or shared[1][0] < 2:
+                        logger.warning(f"GridRunner {self.algo}: Insufficient data for {coin}")
+                        continue
+                    
+                    rows.extend(self._run_coin(pool, coin, shared))
+                    logger.info(f"GridRunner {self.algo}: {coin} done")
+        finally:
+            if own_feed:
+                feed.close()
+        
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(rows).set_index(['coin'] + self.names).sort_index()
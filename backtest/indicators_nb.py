@@ -0,0 +1,129 @@
+"""
+Indicators NB - Numba-compiled indicator kernels for grid searches.
+Same formulas as the live signal generators (simple-average RSI, rolling
+SMA, pandas-style EMA with adjust=False), computed for many periods at once.
+Falls back to plain Python when numba is not installed; the grid runner
+then uses its NumPy implementations instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+
+# fastmath is left off: the kernels emit NaN during warm-up and compare
+# against it, which fastmath is allowed to assume never happens.
+
+@njit(cache=True)
+def rsi(close, period):
+    """
+    RSI for one period (rolling-mean gains/losses, as in the RSI signals).
+    
+    Args:
+        close: 1-D float64 closing prices
+        period: RSI period
+    
+    Returns:
+        float64 array, NaN until the first full window
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    gain_sum = 0.0
+    loss_sum = 0.0
+    
+    for t in range(n):
+        delta = close[t] - close[t - 1] if t > 0 else 0.0
+        gain_sum += max(delta, 0.0)
+        loss_sum += max(-delta, 0.0)
+        
+        # Drop the delta leaving the window
+        if t >= period:
+            old = t - period
+            old_delta = close[old] - close[old - 1] if old > 0 else 0.0
+            gain_sum -= max(old_delta, 0.0)
+            loss_sum -= max(-old_delta, 0.0)
+        
+        if t >= period - 1:
+            if loss_sum > 0.0:
+                out[t] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+            elif gain_sum > 0.0:
+                out[t] = 100.0
+    return out
+
+
+@njit(cache=True, parallel=True)
+def rsi_batch(close, periods):
+    """
+    RSI for every period in one call.
+    
+    Args:
+        close: 1-D float64 closing prices
+        periods: 1-D integer array of RSI periods
+    
+    Returns:
+        Array of shape (len(periods), len(close))
+    """
+    out = np.empty((periods.size, close.size))
+    for i in prange(periods.size):
+        out[i] = rsi(close, periods[i])
+    return out
+
+
+@njit(cache=True, parallel=True)
+def sma_batch(values, periods):
+    """
+    Rolling mean for every period in one call.
+    
+    Args:
+        values: 1-D float64 series
+        periods: 1-D integer array of window sizes
+    
+    Returns:
+        Array of shape (len(periods), len(values)), NaN before each window fills
+    """
+    n = values.size
+    out = np.full((periods.size, n), np.nan)
+    for i in prange(periods.size):
+        period = periods[i]
+        total = 0.0
+        for t in range(n):
+            total += values[t]
+            if t >= period:
+                total -= values[t - period]
+            if t >= period - 1:
+                out[i, t] = total / period
+    return out
+
+
+@njit(cache=True, parallel=True)
+def ema_batch(values, spans):
+    """
+    EMA (pandas ewm adjust=False) for every span in one call.
+    
+    Args:
+        values: 2-D float64 array with one row per span
+        spans: 1-D array of EMA spans
+    
+    Returns:
+        Array with the same shape as values
+    """
+    rows, n = values.shape
+    out = np.empty((rows, n))
+    for i in prange(rows):
+        alpha = 2.0 / (spans[i] + 1.0)
+        out[i, 0] = values[i, 0]
+        for t in range(1, n):
+            out[i, t] = alpha * values[i, t] + (1.0 - alpha) * out[i, t - 1]
+    return out
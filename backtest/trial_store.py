@@ -0,0 +1,158 @@
+"""
+Trial Store - SQLite checkpoint of evaluated grid-search combinations.
+Lets a GridRunner resume an interrupted sweep, skipping parameter tuples
+that already have a stored result.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trials (
+    coin TEXT,
+    algo TEXT,
+    params BLOB,
+    metric REAL,
+    stats TEXT,
+    ts REAL,
+    pruned TEXT,
+    PRIMARY KEY (coin, algo, params)
+)
+"""
+
+_COLUMNS = "coin, algo, params, metric, stats, ts, pruned"
+
+
+def _encode(params: tuple) -> bytes:
+    """Encode a parameter tuple as the params key."""
+    return json.dumps(list(params)).encode()
+
+
+def _decode(blob: bytes) -> tuple:
+    """Decode a params key back into a parameter tuple."""
+    return tuple(json.loads(blob))
+
+
+class TrialStore:
+    """
+    Evaluated (coin, algo, params) results in a SQLite table.
+    
+    Results are keyed only by parameters, not by the candles they were
+    computed on - use a separate file (or clear()) for a fresh sweep.
+    
+    Trials cut by a pruner are stored with the pruner's key in the pruned
+    column, and only count as done for a run using that same pruner.
+    """
+    
+    def __init__(self, path: str = "results/trials.db"):
+        """
+        Initialize trial store.
+        
+        Args:
+            path: SQLite database file (created if missing)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        # WAL lets several runners write the same file concurrently
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        # Files written before pruned markers existed lack the column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(trials)")}
+        if 'pruned' not in columns:
+            self._conn.execute("ALTER TABLE trials ADD COLUMN pruned TEXT")
+        self._conn.commit()
+    
+    def completed(self, coin: str, algo: str, pruner_key: Optional[str] = None) -> Dict[tuple, Optional[Dict]]:
+        """
+        Load every stored result for a coin and algorithm.
+        
+        Pruned trials are included only when they were pruned under
+        pruner_key; with another pruner (or none) they must be re-run.
+        
+        Args:
+            coin: Coin symbol
+            algo: Algorithm name (e.g., "rsi_1min")
+            pruner_key: Pruner.key of the current run, or None if unpruned
+        
+        Returns:
+            Dictionary of parameter tuple -> metrics dict (None if no trades
+            or pruned)
+        """
+        rows = self._conn.execute(
+            "SELECT params, stats FROM trials WHERE coin = ? AND algo = ? "
+            "AND (pruned IS NULL OR pruned = ?)", (coin, algo, pruner_key)
+        )
+        return {_decode(params): json.loads(stats) for params, stats in rows}
+    
+    def record(self, coin: str, algo: str, results: Iterable[Tuple[tuple, Optional[Dict]]]):
+        """
+        Store results for a batch of parameter tuples in one transaction.
+        
+        Args:
+            coin: Coin symbol
+            algo: Algorithm name
+            results: (parameter tuple, metrics dict or None) pairs
+        """
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO trials ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, NULL)",
+                [
+                    (coin, algo, _encode(params),
+                     stats['total_profit_usd'] if stats else None,
+                     json.dumps(stats), now)
+                    for params, stats in results
+                ]
+            )
+    
+    def record_pruned(self, coin: str, algo: str, combos: Iterable[tuple], pruner_key: str):
+        """
+        Mark parameter tuples as cut by a pruner, in one transaction.
+        
+        Args:
+            coin: Coin symbol
+            algo: Algorithm name
+            combos: Pruned parameter tuples
+            pruner_key: Pruner.key of the pruner that cut them
+        """
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO trials ({_COLUMNS}) VALUES (?, ?, ?, NULL, 'null', ?, ?)",
+                [(coin, algo, _encode(params), now, pruner_key) for params in combos]
+            )
+    
+    def clear(self, algo: str, coin: Optional[str] = None):
+        """
+        Delete stored results for an algorithm (optionally one coin only).
+        
+        Args:
+            algo: Algorithm name
+            coin: Coin symbol, or None for all coins
+        """
+        with self._conn:
+            if coin is None:
+                self._conn.execute("DELETE FROM trials WHERE algo = ?", (algo,))
+            else:
+                self._conn.execute("DELETE FROM trials WHERE coin = ? AND algo = ?", (coin, algo))
+    
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -7,10 +7,25 @@ NOTE: Algorithm-specific settings will be loaded from backtested configurations
       backtesting results rather than static configuration files.
 """
 
-from .system_settings import SYSTEM_SETTINGS
-from .trading_settings import TRADING_SETTINGS, SIGNAL_SETTINGS
-from .debug_settings import DEBUG_SETTINGS, get_debug_setting, set_debug_setting
-from .backtest_settings import BACKTEST_SETTINGS
+import importlib
+
+# Exported name -> submodule that defines it. Submodules are imported on
+# first access (PEP 562), so importing one section does not load the rest.
+_ATTR_TO_MODULE = {
+    'SYSTEM_SETTINGS': 'system_settings',
+    'TRADING_SETTINGS': 'trading_settings',
+    'SIGNAL_SETTINGS': 'trading_settings',
+    'DEBUG_SETTINGS': 'debug_settings',
+    'BACKTEST_SETTINGS': 'backtest_settings',
+    'BACKTEST_SETTINGS_ARRAYS': 'backtest_settings',
+    'POSITION_CHECK_DEBUG': 'debug_settings',
+    'BALANCE_DEBUG': 'debug_settings',
+    'get_debug_setting': 'debug_settings',
+    'set_debug_setting': 'debug_settings',
+}
+
+# Rebound at runtime by set_debug_setting(), so always read from the submodule
+_MUTABLE_ATTRS = frozenset({'POSITION_CHECK_DEBUG', 'BALANCE_DEBUG'})
 
 __all__ = [
     'SYSTEM_SETTINGS',
@@ -18,6 +33,25 @@ __all__ = [
     'SIGNAL_SETTINGS',
     'DEBUG_SETTINGS',
     'BACKTEST_SETTINGS',
+    'BACKTEST_SETTINGS_ARRAYS',
+    'POSITION_CHECK_DEBUG',
+    'BALANCE_DEBUG',
     'get_debug_setting',
     'set_debug_setting'
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining name on first access and cache it."""
+    module_name = _ATTR_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    if name not in _MUTABLE_ATTRS:
+        globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
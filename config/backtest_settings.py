@@ -2,7 +2,12 @@
 Backtest-specific settings
 """
 
-BACKTEST_SETTINGS = {
+from types import MappingProxyType
+
+import numpy as np
+
+# Read-only at runtime - the backtest page and grid runner only read these
+BACKTEST_SETTINGS = MappingProxyType({
     # Trade Settings
     'position_size_usd': 100,  # Default position size for backtesting
     
@@ -87,4 +92,36 @@ BACKTEST_SETTINGS = {
     
     # Coins to backtest (loaded from trading_settings.py)
     'enabled_coins': [],  # Will be populated from TRADING_SETTINGS['monitored_coins']
-}
+})
+
+
+def _expand_arrays(settings) -> MappingProxyType:
+    """
+    Copy the list fields of every *_optimization dict into NumPy arrays.
+    
+    Integer ranges (periods, thresholds) become contiguous int16 arrays;
+    fractional ones (offsets, multipliers) stay float64.
+    
+    Args:
+        settings: BACKTEST_SETTINGS mapping
+    
+    Returns:
+        Read-only mapping of optimization key -> {parameter: array}
+    """
+    arrays = {}
+    for key, ranges in settings.items():
+        if not key.endswith('_optimization'):
+            continue
+        grid = {}
+        for name, values in ranges.items():
+            if not isinstance(values, list):
+                continue
+            dtype = np.int16 if all(isinstance(v, int) for v in values) else np.float64
+            grid[name] = np.asarray(values, dtype=dtype)
+            grid[name].flags.writeable = False
+        arrays[key] = MappingProxyType(grid)
+    return MappingProxyType(arrays)
+
+
+# Parameter grids as arrays for vectorized backtests (e.g. all RSI periods at once)
+BACKTEST_SETTINGS_ARRAYS = _expand_arrays(BACKTEST_SETTINGS)
@@ -3,16 +3,31 @@ Debug settings for the trading bot.
 Controls console output and debugging features.
 """
 
+from types import MappingProxyType
+from typing import Mapping
+
 DEBUG_SETTINGS = {
     # Position Monitoring Debug
     'position_check_debug': True,      # Show detailed position check info in console
     
+    # Order Execution Debug
+    'balance_debug': False,            # Show balance check details before each order
+    
     # Future debug options can be added here
     # 'signal_debug': False,           # Show signal generation details
     # 'api_debug': False,              # Show API request/response details
     # 'order_debug': False,            # Show order execution details
 }
 
+# Hot-path flags, kept in sync by set_debug_setting(). Read them as
+# debug_settings.POSITION_CHECK_DEBUG - a `from ... import` would copy the
+# value at import time and miss later toggles.
+POSITION_CHECK_DEBUG = DEBUG_SETTINGS['position_check_debug']
+BALANCE_DEBUG = DEBUG_SETTINGS['balance_debug']
+
+# Read-only copy handed out by get_all_debug_settings(), rebuilt on change
+_snapshot = MappingProxyType(dict(DEBUG_SETTINGS))
+
 
 def get_debug_setting(key: str, default=False) -> bool:
     """
@@ -36,17 +51,26 @@ def set_debug_setting(key: str, value: bool):
         key: Setting key
         value: Boolean value to set
     """
+    global POSITION_CHECK_DEBUG, BALANCE_DEBUG, _snapshot
     if key in DEBUG_SETTINGS:
-        DEBUG_SETTINGS[key] = value
+        if DEBUG_SETTINGS[key] != value:
+            DEBUG_SETTINGS[key] = value
+            _snapshot = MappingProxyType(dict(DEBUG_SETTINGS))
+        if key == 'position_check_debug':
+            POSITION_CHECK_DEBUG = value
+        elif key == 'balance_debug':
+            BALANCE_DEBUG = value
         return True
     return False
 
 
-def get_all_debug_settings() -> dict:
+def get_all_debug_settings() -> Mapping:
     """
     Get all debug settings.
     
+    Returns the cached snapshot; it only changes when a setting does.
+    
     Returns:
-        Dictionary of all debug settings
+        Read-only mapping of all debug settings
     """
-    return DEBUG_SETTINGS.copy()
+    return _snapshot
@@ -3,7 +3,10 @@ System-level settings for the trading bot.
 Based on DEV_PLAN.md requirements only.
 """
 
-SYSTEM_SETTINGS = {
+from types import MappingProxyType
+
+# Read-only at runtime - nothing edits system settings after startup
+SYSTEM_SETTINGS = MappingProxyType({
     # Bot Behavior
     'ask_on_start': True,             # Ask user confirmation before starting
     'autopilot': False,               # Manual approval mode
@@ -16,7 +19,7 @@ SYSTEM_SETTINGS = {
     
     # Signal Check Intervals - Smart timing based on timeframe
     # Each signal generator checks at appropriate intervals for its timeframe
-    'signal_check_intervals': {
+    'signal_check_intervals': MappingProxyType({
         'rsi_1min': 60,               # Check every 60s (1 minute) - new candle every minute
         'rsi_5min': 300,              # Check every 300s (5 minutes) - new candle every 5 minutes
         'rsi_1h': 3600,               # Check every 3600s (1 hour) - new candle every hour
@@ -25,9 +28,9 @@ SYSTEM_SETTINGS = {
         'range_7days_low': 3600,      # Check every 3600s (1 hour) - daily data doesn't change often
         'range_24h_low': 1800,        # Check every 1800s (30 min) - 24h data changes more frequently
         'macd_15min': 900,            # Check every 900s (15 minutes) - new candle every 15 minutes
-    },
+    }),
     
     # Logging
     'log_level': 'INFO',
     'log_file': 'logs/trading_bot.log',
-}
+})
@@ -3,6 +3,6 @@ Core module for trading bot.
 Contains signal data structures and core functionality.
 """
 
-from .signal import Signal
+from .signal import Action, Signal
 
-__all__ = ['Signal']
+__all__ = ['Action', 'Signal']
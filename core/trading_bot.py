@@ -3,8 +3,11 @@ Trading Bot Core Engine - Main orchestrator.
 Coordinates signal generators, order manager, and position manager.
 """
 
+import heapq
+import logging
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict
 from signals import (
@@ -17,6 +20,7 @@ from signals import (
     Range24HLowSignalGenerator,
     MACD15MinSignalGenerator
 )
+from signals.candles import fetch_candles
 from managers import OrderManager, PositionManager
 from utils.api_client import APIClient
 from utils.logger import get_logger
@@ -25,6 +29,43 @@ from config.signal_settings import SIGNAL_GENERATOR_SETTINGS
 
 logger = get_logger(__name__)
 
+# (settings key, generator class, constructor kwargs) in start-up order.
+# Defaults are the parameters from backtesting.
+_GEN_FACTORIES = [
+    ('rsi_1min', RSI1MinSignalGenerator, dict(period=14, oversold=30, overbought=70)),
+    ('rsi_5min', RSI5MinSignalGenerator, dict(period=14, oversold=30, overbought=70)),
+    ('rsi_1h', RSI1HSignalGenerator, dict(period=14, oversold=30, overbought=70)),
+    ('rsi_4h', RSI4HSignalGenerator, dict(period=14, oversold=30, overbought=70)),
+    ('sma_5min', SMA5MinSignalGenerator, dict(short_period=10, long_period=20)),
+    # Buy when price is near the 7-day / 24h low
+    ('range_7days_low', Range7DaysLowSignalGenerator, dict(long_offset_percent=-1.0, tolerance_percent=2.0)),
+    ('range_24h_low', Range24HLowSignalGenerator, dict(long_offset_percent=-1.0, tolerance_percent=2.0)),
+    ('macd_15min', MACD15MinSignalGenerator, dict(fast=12, slow=26, signal=9)),
+]
+
+
+def _safe_gen(generator, coin: str, candles):
+    """
+    Generate one signal from shared candles, logging instead of raising.
+    
+    Args:
+        generator: Signal generator
+        coin: Coin symbol
+        candles: Candle DataFrame from fetch_candles() (may be None)
+    
+    Returns:
+        Signal object or None if generation failed
+    """
+    try:
+        # Generators keep coin-specific parameters on the instance,
+        # so (re)load them and generate under the generator's lock
+        with generator._lock:
+            generator.candles_needed(coin)
+            return generator.generate_signal_from(coin, candles)
+    except Exception as e:
+        logger.error(f"Error generating signal from {generator.name} for {coin}: {e}")
+        return None
+
 
 class TradingBot:
     """
@@ -46,6 +87,8 @@ class TradingBot:
         self.execute_orders = execute_orders
         self.running = False
         self.signal_thread: threading.Thread = None
+        # Set by stop() to wake the signal loop; a fresh event per start()
+        self._stop_event = threading.Event()
         
         # Initialize API client
         logger.info("Initializing API client...")
@@ -61,23 +104,43 @@ class TradingBot:
         logger.info("Initializing signal generators...")
         self.signal_generators = self._init_signal_generators()
         
-        # Track last check time for each signal generator
+        # Track last check time for each signal generator (time.monotonic() seconds)
         self.last_check_times = {gen.name: 0 for gen in self.signal_generators}
         
+        # Min-heap of (next_due, index, generator) on the monotonic clock, built when the loop starts
+        self._schedule: List = []
+        
         # Get monitored coins from settings
         self.monitored_coins = TRADING_SETTINGS['monitored_coins']
         
+        # Per-coin signal checks are I/O-bound, so run them concurrently
+        self._io_pool = self._create_io_pool()
+        # Orders are placed one at a time so position/limit checks don't race
+        self._order_lock = threading.Lock()
+        
         logger.info(f"TradingBot initialized (execute_orders={execute_orders})")
         logger.info(f"Monitoring {len(self.monitored_coins)} coins: {', '.join(self.monitored_coins)}")
         logger.info(f"Active signal generators: {len(self.signal_generators)}")
         
+        # Plain-dict copy of the (read-only) configured intervals
+        self._intervals = dict(SYSTEM_SETTINGS['signal_check_intervals'])
+        self._intervals_get = self._intervals.get
+        
         # Log signal check intervals
-        intervals = SYSTEM_SETTINGS['signal_check_intervals']
         logger.info("Signal check intervals:")
         for gen in self.signal_generators:
-            interval = intervals.get(gen.name, 60)
+            interval = self._intervals_get(gen.name, 60)
+            gen._interval = interval  # Read by the scheduler instead of a dict lookup per run
+            gen._lock = threading.Lock()  # Guards per-coin parameters across coin threads
             logger.info(f"  - {gen.name}: every {interval}s ({interval/60:.1f} min)")
     
+    def _create_io_pool(self) -> ThreadPoolExecutor:
+        """Create the thread pool used for concurrent per-coin signal checks."""
+        return ThreadPoolExecutor(
+            max_workers=max(1, min(16, len(self.monitored_coins))),
+            thread_name_prefix="coin-signals"
+        )
+    
     def _init_signal_generators(self) -> List:
         """
         Initialize enabled signal generators only.
@@ -87,45 +150,11 @@ class TradingBot:
         """
         generators = []
         
-        # RSI 1-minute (default parameters from backtesting)
-        if SIGNAL_GENERATOR_SETTINGS['rsi_1min']['enabled']:
-            generators.append(RSI1MinSignalGenerator(period=14, oversold=30, overbought=70))
-            logger.info("  ✓ RSI 1-Minute signal generator enabled")
-        
-        # RSI 5-minute (default parameters from backtesting)
-        if SIGNAL_GENERATOR_SETTINGS['rsi_5min']['enabled']:
-            generators.append(RSI5MinSignalGenerator(period=14, oversold=30, overbought=70))
-            logger.info("  ✓ RSI 5-Minute signal generator enabled")
-        
-        # RSI 1-hour (default parameters from backtesting)
-        if SIGNAL_GENERATOR_SETTINGS['rsi_1h']['enabled']:
-            generators.append(RSI1HSignalGenerator(period=14, oversold=30, overbought=70))
-            logger.info("  ✓ RSI 1-Hour signal generator enabled")
-        
-        # RSI 4-hour (default parameters from backtesting)
-        if SIGNAL_GENERATOR_SETTINGS['rsi_4h']['enabled']:
-            generators.append(RSI4HSignalGenerator(period=14, oversold=30, overbought=70))
-            logger.info("  ✓ RSI 4-Hour signal generator enabled")
-        
-        # SMA 5-minute (default parameters from backtesting)
-        if SIGNAL_GENERATOR_SETTINGS['sma_5min']['enabled']:
-            generators.append(SMA5MinSignalGenerator(short_period=10, long_period=20))
-            logger.info("  ✓ SMA 5-Minute signal generator enabled")
-        
-        # 7 Days Low Range (buy when price is near 7-day low)
-        if SIGNAL_GENERATOR_SETTINGS['range_7days_low']['enabled']:
-            generators.append(Range7DaysLowSignalGenerator(long_offset_percent=-1.0, tolerance_percent=2.0))
-            logger.info("  ✓ 7-Day Low Range signal generator enabled")
-        
-        # 24 Hours Low Range (buy when price is near 24h low)
-        if SIGNAL_GENERATOR_SETTINGS['range_24h_low']['enabled']:
-            generators.append(Range24HLowSignalGenerator(long_offset_percent=-1.0, tolerance_percent=2.0))
-            logger.info("  ✓ 24-Hour Low Range signal generator enabled")
-        
-        # MACD 15-minute (default parameters from backtesting)
-        if SIGNAL_GENERATOR_SETTINGS['macd_15min']['enabled']:
-            generators.append(MACD15MinSignalGenerator(fast=12, slow=26, signal=9))
-            logger.info("  ✓ MACD 15-Minute signal generator enabled")
+        for key, generator_class, kwargs in _GEN_FACTORIES:
+            settings = SIGNAL_GENERATOR_SETTINGS[key]
+            if settings['enabled']:
+                generators.append(generator_class(**kwargs))
+                logger.info(f"  ✓ {settings['name']} signal generator enabled")
         
         if not generators:
             logger.warning("  ⚠️  No signal generators enabled! Check config/signal_settings.py")
@@ -149,13 +178,21 @@ class TradingBot:
         
         self.running = True
         
+        if self._io_pool is None:
+            self._io_pool = self._create_io_pool()
+        
+        # Pick up settings edited in the panel since the last start
+        self.order_manager.reload_settings()
+        
         # Start position monitoring with configured interval
         if self.execute_orders:
             position_interval = SYSTEM_SETTINGS['position_check_interval']
             self.position_manager.start_monitoring(interval=position_interval)
         
-        # Start signal generation loop
-        self.signal_thread = threading.Thread(target=self._signal_loop, daemon=True)
+        # Start signal generation loop. Each run gets its own stop event, so a
+        # loop left over from a previous run can never resume after a restart
+        self._stop_event = threading.Event()
+        self.signal_thread = threading.Thread(target=self._signal_loop, args=(self._stop_event,), daemon=True)
         self.signal_thread.start()
         
         logger.info("Trading bot started successfully")
@@ -170,6 +207,7 @@ class TradingBot:
         logger.info("=" * 60)
         
         self.running = False
+        self._stop_event.set()
         
         # Stop position monitoring
         self.position_manager.stop_monitoring()
@@ -178,55 +216,81 @@ class TradingBot:
         if self.signal_thread:
             self.signal_thread.join(timeout=10)
         
+        # Stop coin check workers
+        if self._io_pool:
+            self._io_pool.shutdown(wait=False)
+            self._io_pool = None
+        
         # Disconnect API
         self.api.disconnect()
         
         logger.info("Trading bot stopped")
     
-    def _signal_loop(self):
+    def _signal_loop(self, stop_event: threading.Event):
         """
         Main signal generation loop with smart per-timeframe checking.
         Runs in background thread.
+        
+        Generators are kept in a heap ordered by their next due time, so the
+        loop sleeps until the earliest one is due instead of polling. The
+        sleep is a wait on stop_event, so stop() wakes it immediately.
+        
+        Args:
+            stop_event: Event set by stop() for this run of the loop
         """
-        # Use shortest interval as base loop interval (1 minute)
-        base_interval = 60  # Check every minute
+        # The index breaks ties so generators themselves are never compared
+        self._schedule = [(0.0, index, gen) for index, gen in enumerate(self.signal_generators)]
+        heapq.heapify(self._schedule)
         
-        logger.info(f"Signal loop started (base interval={base_interval}s)")
+        logger.info("Signal loop started (sleeping until the next generator is due)")
         logger.info("Smart timeframe-based checking enabled")
         
-        while self.running:
+        while not stop_event.is_set():
             try:
+                if not self._schedule:
+                    stop_event.wait(60)  # No generators enabled
+                    continue
+                
                 self._check_signals()
-                time.sleep(base_interval)
+                stop_event.wait(max(0.0, self._schedule[0][0] - time.monotonic()))
             except Exception as e:
                 logger.error(f"Error in signal loop: {e}")
-                time.sleep(base_interval)
+                stop_event.wait(60)
     
     def _check_signals(self):
         """Check signals for all monitored coins with smart timeframe-based intervals."""
-        current_time = time.time()
-        intervals = SYSTEM_SETTINGS['signal_check_intervals']
+        # Monotonic clock: due times must not jump with NTP/wall-clock changes
+        _monotonic = time.monotonic
+        current_time = _monotonic()
+        schedule = self._schedule
         
-        # Determine which generators should run this cycle
+        # Pop every generator that is due and reschedule it one interval ahead
         generators_to_run = []
-        for generator in self.signal_generators:
-            interval = intervals.get(generator.name, 60)
-            last_check = self.last_check_times[generator.name]
-            
-            if current_time - last_check >= interval:
-                generators_to_run.append(generator)
-                self.last_check_times[generator.name] = current_time
+        while schedule and schedule[0][0] <= current_time:
+            _, index, generator = heapq.heappop(schedule)
+            generators_to_run.append(generator)
+            self.last_check_times[generator.name] = current_time
+            heapq.heappush(schedule, (current_time + generator._interval, index, generator))
         
         if not generators_to_run:
             return  # No generators need to run this cycle
         
-        logger.info("-" * 60)
-        logger.info(f"Checking signals at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info(f"Active generators: {', '.join([g.name for g in generators_to_run])}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("-" * 60)
+            logger.info("Checking signals at %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            logger.info("Active generators: %s", ", ".join(g.name for g in generators_to_run))
         
-        for coin in self.monitored_coins:
+        pool = self._io_pool
+        if pool is None:
+            return  # Bot is stopping
+        
+        futures = {
+            coin: pool.submit(self._check_coin_signals, coin, generators_to_run)
+            for coin in self.monitored_coins
+        }
+        for coin, future in futures.items():
             try:
-                self._check_coin_signals(coin, generators_to_run)
+                future.result()
             except Exception as e:
                 logger.error(f"Error checking signals for {coin}: {e}")
     
@@ -240,14 +304,29 @@ class TradingBot:
         """
         signals = []
         
-        # Generate signals from specified generators only
+        # Generators sharing a candle interval get one fetch per coin
+        by_interval: Dict[str, List] = {}
         for generator in generators_to_run:
-            try:
-                signal = generator.generate_signal(coin)
-                if signal and signal.action != "HOLD":
-                    signals.append(signal)
-            except Exception as e:
-                logger.error(f"Error generating signal from {generator.name} for {coin}: {e}")
+            by_interval.setdefault(generator.interval, []).append(generator)
+        
+        for interval, generators in by_interval.items():
+            ready = []
+            limit = 0
+            for generator in generators:
+                try:
+                    with generator._lock:
+                        limit = max(limit, generator.candles_needed(coin))
+                    ready.append(generator)
+                except Exception as e:
+                    logger.error(f"Error generating signal from {generator.name} for {coin}: {e}")
+            
+            if not ready:
+                continue
+            
+            candles = fetch_candles(coin, interval, limit)
+            signals.extend(
+                s for s in (_safe_gen(g, coin, candles) for g in ready) if s and s.action
+            )
         
         # Process signals
         if signals:
@@ -258,7 +337,8 @@ class TradingBot:
                 
                 # Execute order if enabled
                 if self.execute_orders:
-                    executed = self.order_manager.process_signal(signal)
+                    with self._order_lock:
+                        executed = self.order_manager.process_signal(signal)
                     if executed:
                         logger.info(f"     ✓ Order executed")
                     else:
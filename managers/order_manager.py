@@ -3,12 +3,17 @@ Order Manager - Central order execution and validation system.
 Handles signal processing, risk validation, and order execution.
 """
 
-from datetime import datetime, timedelta
+import heapq
+import json
+import os
+import time
+from datetime import date, datetime
 from typing import Optional, Dict, List
-from core.signal import Signal
+from core.signal import Action, Signal
 from utils.api_client import APIClient
 from utils.logger import get_logger
 from config import TRADING_SETTINGS
+from config import debug_settings
 
 logger = get_logger(__name__)
 
@@ -25,6 +30,11 @@ class OrderManager:
     - Track order history and cooldowns
     """
     
+    __slots__ = (
+        'api', 'settings', '_multipliers', 'cooldowns', '_cooldown_heap', 'daily_reset_file',
+        'daily_trades', 'total_daily_trades', 'last_reset_date'
+    )
+    
     def __init__(self, api_client: APIClient):
         """
         Initialize Order Manager.
@@ -34,17 +44,66 @@ class OrderManager:
         """
         self.api = api_client
         self.settings = TRADING_SETTINGS
+        self.reload_settings()
         
-        # Track cooldowns per coin (coin -> last order timestamp)
-        self.cooldowns: Dict[str, datetime] = {}
+        # Track cooldowns per coin (coin -> time.monotonic() of last order)
+        self.cooldowns: Dict[str, float] = {}
+        self._cooldown_heap: List[tuple] = []  # (expiry, coin) min-heap for get_stats()
         
-        # Track daily trade counts
+        # Track daily trade counts (persisted so restarts keep today's counts)
+        self.daily_reset_file = "daily_reset.json"
         self.daily_trades: Dict[str, int] = {}  # coin -> count
         self.total_daily_trades = 0
         self.last_reset_date = datetime.now().date()
+        self._load_daily_counters()
         
         logger.info("OrderManager initialized")
     
+    def reload_settings(self):
+        """
+        Precompute the SL/TP price multipliers from the current settings.
+        
+        Called at init and whenever the bot starts.
+        """
+        sl_pct = self.settings['stop_loss_percent'] / 100
+        tp_pct = self.settings['take_profit_percent'] / 100
+        
+        # side -> (stop-loss multiplier, take-profit multiplier)
+        self._multipliers = {
+            'buy': (1 - sl_pct, 1 + tp_pct),   # Long position
+            'sell': (1 + sl_pct, 1 - tp_pct)   # Short position
+        }
+    
+    def _load_daily_counters(self):
+        """Restore the last reset date and daily trade counts from disk."""
+        if not os.path.exists(self.daily_reset_file):
+            return
+        
+        try:
+            with open(self.daily_reset_file, 'r') as f:
+                data = json.load(f)
+            
+            self.last_reset_date = date.fromisoformat(data['date'])
+            self.daily_trades = {coin: int(count) for coin, count in data.get('daily_trades', {}).items()}
+            self.total_daily_trades = int(data.get('total_daily_trades', 0))
+            logger.info(f"Loaded daily trade counters for {self.last_reset_date}: {self.total_daily_trades} trades")
+        except Exception as e:
+            logger.error(f"Error loading daily trade counters: {e}")
+    
+    def _save_daily_counters(self):
+        """Save the last reset date and daily trade counts (temp file, then swapped in)."""
+        try:
+            tmp_file = f"{self.daily_reset_file}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump({
+                    'date': self.last_reset_date.isoformat(),
+                    'daily_trades': self.daily_trades,
+                    'total_daily_trades': self.total_daily_trades
+                }, f, indent=2)
+            os.replace(tmp_file, self.daily_reset_file)
+        except Exception as e:
+            logger.error(f"Error saving daily trade counters: {e}")
+    
     def _reset_daily_counters_if_needed(self):
         """Reset daily trade counters if it's a new day."""
         current_date = datetime.now().date()
@@ -52,23 +111,28 @@ class OrderManager:
             self.daily_trades.clear()
             self.total_daily_trades = 0
             self.last_reset_date = current_date
+            self._save_daily_counters()
             logger.info("Daily trade counters reset")
     
-    def _check_position_limit(self) -> bool:
+    def _check_position_limit(self, positions: Optional[Dict] = None) -> bool:
         """
         Check if we can open a new position.
         
+        Args:
+            positions: Positions snapshot to check against (fetched if None)
+        
         Returns:
             True if under position limit, False otherwise
         """
         try:
             # get_positions() returns {coin: position_data} dict
-            positions = self.api.get_positions()
+            if positions is None:
+                positions = self.api.get_cached_positions()
             current_positions = len(positions)
             max_positions = self.settings['max_positions']
             
             if current_positions >= max_positions:
-                logger.warning(f"Position limit reached: {current_positions}/{max_positions}")
+                logger.warning("Position limit reached: %s/%s", current_positions, max_positions)
                 return False
             
             return True
@@ -77,23 +141,25 @@ class OrderManager:
             logger.error(f"Error checking position limit: {e}")
             return False
     
-    def _check_duplicate_position(self, coin: str) -> bool:
+    def _check_duplicate_position(self, coin: str, positions: Optional[Dict] = None) -> bool:
         """
         Check if we already have a position for this coin.
         
         Args:
             coin: Coin symbol
+            positions: Positions snapshot to check against (fetched if None)
             
         Returns:
             True if no duplicate, False if position exists
         """
         try:
             # get_positions() returns {coin: position_data} dict
-            positions = self.api.get_positions()
+            if positions is None:
+                positions = self.api.get_cached_positions()
             
             # Check if coin exists in positions dict
             if coin in positions:
-                logger.warning(f"Position already exists for {coin}: size={positions[coin].get('size', 0)}")
+                logger.warning("Position already exists for %s: size=%s", coin, positions[coin].get('size', 0))
                 return False
             
             return True
@@ -116,11 +182,11 @@ class OrderManager:
             return True
         
         cooldown_period = self.settings.get('cooldown_period', 300)  # Default 5 minutes
-        elapsed = (datetime.now() - self.cooldowns[coin]).total_seconds()
+        elapsed = time.monotonic() - self.cooldowns[coin]
         
         if elapsed < cooldown_period:
             remaining = int(cooldown_period - elapsed)
-            logger.info(f"{coin} in cooldown: {remaining}s remaining")
+            logger.info("%s in cooldown: %ss remaining", coin, remaining)
             return False
         
         return True
@@ -137,32 +203,33 @@ class OrderManager:
         """
         try:
             balance_info = self.api.get_account_balance()
+            debug = debug_settings.BALANCE_DEBUG
             
-            # DEBUG: Print to console
-            print("=" * 60)
-            print("BALANCE CHECK DEBUG:")
-            print(f"Full balance_info: {balance_info}")
-            print(f"API connected: {self.api.connected}")
-            print(f"API address: {self.api.address}")
-            print("=" * 60)
+            # DEBUG: Print to console (controlled by debug settings)
+            if debug:
+                print("=" * 60)
+                print("BALANCE CHECK DEBUG:")
+                print(f"Full balance_info: {balance_info}")
+                print(f"API connected: {self.api.connected}")
+                print(f"API address: {self.api.address}")
+                print("=" * 60)
             
             available = float(balance_info.get('withdrawable', 0))
             total = float(balance_info.get('total', 0))
             
-            print(f"Balance check: Total=${total:.2f}, Available=${available:.2f}, Required=${position_size:.2f}")
+            if debug:
+                print(f"Balance check: Total=${total:.2f}, Available=${available:.2f}, Required=${position_size:.2f}")
             
             if available < position_size:
-                logger.warning(f"Insufficient balance: ${available:.2f} < ${position_size:.2f}")
+                logger.warning("Insufficient balance: $%.2f < $%.2f", available, position_size)
                 return False
             
-            print(f"✓ Sufficient balance for ${position_size:.2f} order")
+            if debug:
+                print(f"✓ Sufficient balance for ${position_size:.2f} order")
             return True
             
         except Exception as e:
-            print(f"ERROR in balance check: {e}")
-            import traceback
-            traceback.print_exc()
-            logger.error(f"Error checking balance: {e}")
+            logger.exception("Error checking balance: %s", e)
             return False
     
     def process_signal(self, signal: Signal) -> bool:
@@ -183,24 +250,27 @@ class OrderManager:
             self._reset_daily_counters_if_needed()
             
             # Only process BUY/SELL signals
-            if signal.action == "HOLD":
+            if not signal.action:
                 return False
             
             # Check signal strength
             min_strength = self.settings.get('min_signal_strength', 0.7)
             if not signal.is_actionable(min_strength):
-                logger.info(f"Signal too weak: {signal.strength:.2f} < {min_strength}")
+                logger.info("Signal too weak: %.2f < %s", signal.strength, min_strength)
                 return False
             
+            # Validate against one positions snapshot
+            positions = self.api.get_cached_positions()
+            
             # CRITICAL: Check if position already exists
             # If position exists, Position Manager handles it (SL/TP/Trailing)
             # Order Manager only opens NEW positions
-            if not self._check_duplicate_position(signal.coin):
-                logger.info(f"Position already exists for {signal.coin} - Position Manager will handle exits")
+            if not self._check_duplicate_position(signal.coin, positions):
+                logger.info("Position already exists for %s - Position Manager will handle exits", signal.coin)
                 return False
             
             # Check position limit
-            if not self._check_position_limit():
+            if not self._check_position_limit(positions):
                 return False
             
             # Check cooldown
@@ -217,11 +287,14 @@ class OrderManager:
             
             if success:
                 # Update cooldown
-                self.cooldowns[signal.coin] = datetime.now()
+                now = time.monotonic()
+                self.cooldowns[signal.coin] = now
+                heapq.heappush(self._cooldown_heap, (now + self.settings.get('cooldown_period', 300), signal.coin))
                 
                 # Update daily counters
                 self.daily_trades[signal.coin] = self.daily_trades.get(signal.coin, 0) + 1
                 self.total_daily_trades += 1
+                self._save_daily_counters()
                 
                 logger.info(f"Order executed: {signal}")
             
@@ -261,7 +334,7 @@ class OrderManager:
             size = round(raw_size, 5)
             
             # Determine side for API
-            side = "buy" if action == "BUY" else "sell"
+            side = "buy" if action == Action.BUY else "sell"
             
             # Place market order
             logger.info(f"Placing {side} order: {coin} size={size} (raw={raw_size}) @ ${current_price:.2f}")
@@ -292,17 +365,9 @@ class OrderManager:
             side: "buy" or "sell"
         """
         try:
-            sl_pct = self.settings['stop_loss_percent'] / 100
-            tp_pct = self.settings['take_profit_percent'] / 100
-            
-            if side == "buy":
-                # Long position
-                stop_loss_price = entry_price * (1 - sl_pct)
-                take_profit_price = entry_price * (1 + tp_pct)
-            else:
-                # Short position
-                stop_loss_price = entry_price * (1 + sl_pct)
-                take_profit_price = entry_price * (1 - tp_pct)
+            sl_mul, tp_mul = self._multipliers[side]
+            stop_loss_price = entry_price * sl_mul
+            take_profit_price = entry_price * tp_mul
             
             logger.info(f"SL/TP for {coin}: SL=${stop_loss_price:.2f}, TP=${take_profit_price:.2f}")
             
@@ -320,9 +385,14 @@ class OrderManager:
         Returns:
             Dictionary with stats
         """
+        # Drop expired cooldowns; the rest of the heap is still active
+        now = time.monotonic()
+        heap = self._cooldown_heap
+        while heap and heap[0][0] <= now:
+            heapq.heappop(heap)
+        
         return {
             'total_daily_trades': self.total_daily_trades,
             'trades_by_coin': dict(self.daily_trades),
-            'coins_in_cooldown': len([c for c, t in self.cooldowns.items() 
-                                     if (datetime.now() - t).total_seconds() < 300])
+            'coins_in_cooldown': len(heap)
         }
@@ -7,16 +7,37 @@ import threading
 import time
 import json
 import os
-from datetime import datetime
+import queue
 from typing import Dict, List, Optional
+import numpy as np
 from utils.api_client import APIClient
 from utils.logger import get_logger
 from config import TRADING_SETTINGS
-from config.debug_settings import get_debug_setting
+from config import debug_settings
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = get_logger(__name__)
 
 
+def _dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class PositionManager:
     """
     Manages position monitoring and exit logic.
@@ -28,6 +49,14 @@ class PositionManager:
     - Tracks highest PnL% for each position
     """
     
+    __slots__ = (
+        'api', 'settings', '_sl_pct', '_tp_pct', '_debug',
+        'position_states_file', 'position_states', '_states_lock', '_states_dirty',
+        '_write_q', '_writer_thread',
+        'monitoring', 'monitor_thread', '_monitor_interval',
+        '_pending_exits', '_pending_exits_ts'
+    )
+    
     def __init__(self, api_client: APIClient):
         """
         Initialize Position Manager.
@@ -37,20 +66,44 @@ class PositionManager:
         """
         self.api = api_client
         self.settings = TRADING_SETTINGS
+        self.reload_settings()
         
         # Position state tracking (highest values, etc.)
         self.position_states_file = "position_states.json"
         self.position_states: Dict[str, Dict] = self._load_position_states()
+        self._states_lock = threading.Lock()  # Monitor thread writes, UI thread reads
+        self._states_dirty = False  # Unsaved state changes, flushed once per monitoring tick
+        
+        # Background writer; holds at most one pending snapshot (newer ones replace it)
+        self._write_q: queue.Queue = queue.Queue(maxsize=1)
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
         
         # Monitoring control
         self.monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
+        self._monitor_interval = 2
+        
+        # Latest exit evaluation from the monitor loop, for get_positions_to_sell()
+        self._pending_exits: List[tuple[str, str]] = []
+        self._pending_exits_ts = 0.0
         
         logger.info("PositionManager initialized (SIMPLIFIED - NO TRAILING)")
         logger.info(f"Stop Loss: {self.settings['stop_loss_percent']}%")
         logger.info(f"Take Profit: {self.settings['take_profit_percent']}%")
         logger.info(f"Position states loaded: {len(self.position_states)} positions")
     
+    def reload_settings(self):
+        """
+        Cache the exit thresholds and debug flag used by _check_exit_conditions().
+        
+        Called at the start of every position check, so settings edited in
+        the panel apply from the next tick.
+        """
+        self._sl_pct = float(self.settings['stop_loss_percent'])
+        self._tp_pct = float(self.settings['take_profit_percent'])
+        self._debug = debug_settings.POSITION_CHECK_DEBUG
+    
     def _load_position_states(self) -> Dict[str, Dict]:
         """
         Load position states from JSON file.
@@ -60,8 +113,8 @@ class PositionManager:
         """
         if os.path.exists(self.position_states_file):
             try:
-                with open(self.position_states_file, 'r') as f:
-                    states = json.load(f)
+                with open(self.position_states_file, 'rb') as f:
+                    states = _loads(f.read())
                     logger.info(f"Loaded position states for {len(states)} positions")
                     return states
             except Exception as e:
@@ -70,12 +123,42 @@ class PositionManager:
         return {}
     
     def _save_position_states(self):
-        """Save position states to JSON file."""
-        try:
-            with open(self.position_states_file, 'w') as f:
-                json.dump(self.position_states, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving position states: {e}")
+        """Queue a snapshot of the position states for the background writer."""
+        with self._states_lock:
+            snapshot = {coin: dict(state) for coin, state in self.position_states.items()}
+        
+        # Replace a snapshot the writer hasn't picked up yet
+        while True:
+            try:
+                self._write_q.put_nowait(snapshot)
+                return
+            except queue.Full:
+                try:
+                    self._write_q.get_nowait()
+                    self._write_q.task_done()
+                except queue.Empty:
+                    pass
+    
+    def _writer_loop(self):
+        """Write queued snapshots to the JSON file (runs in background thread)."""
+        while True:
+            snapshot = self._write_q.get()
+            try:
+                # Written to a temp file, then swapped in
+                tmp_file = f"{self.position_states_file}.tmp"
+                with open(tmp_file, 'wb') as f:
+                    f.write(_dumps(snapshot))
+                os.replace(tmp_file, self.position_states_file)
+            except Exception as e:
+                logger.error(f"Error saving position states: {e}")
+            finally:
+                self._write_q.task_done()
+    
+    def _flush_position_states(self):
+        """Save position states if anything changed since the last save."""
+        if self._states_dirty:
+            self._states_dirty = False
+            self._save_position_states()
     
     def _update_position_state(self, coin: str, profit_pct: float):
         """
@@ -85,26 +168,32 @@ class PositionManager:
             coin: Coin symbol
             profit_pct: Current profit percentage
         """
-        # Initialize state if new position
-        if coin not in self.position_states:
-            self.position_states[coin] = {
-                'highest_pnl_pct': profit_pct,
-                'trailing_stop_activated': False,
-                'first_seen': datetime.now().isoformat(),
-                'last_updated': datetime.now().isoformat()
-            }
-            logger.info(f"New position state created for {coin}: {profit_pct:.2f}%")
-        else:
-            # Update highest PnL if current is higher
-            current_highest = self.position_states[coin].get('highest_pnl_pct', profit_pct)
-            if profit_pct > current_highest:
-                self.position_states[coin]['highest_pnl_pct'] = profit_pct
-                logger.info(f"New highest PnL for {coin}: {profit_pct:.2f}% (was {current_highest:.2f}%)")
-            
-            self.position_states[coin]['last_updated'] = datetime.now().isoformat()
+        # Epoch seconds
+        now = time.time()
         
-        # Save to file after each update
-        self._save_position_states()
+        with self._states_lock:
+            state = self.position_states.get(coin)
+            
+            # Initialize state if new position
+            if state is None:
+                self.position_states[coin] = {
+                    'highest_pnl_pct': profit_pct,
+                    'trailing_stop_activated': False,
+                    'first_seen': now,
+                    'last_updated': now
+                }
+                logger.info(f"New position state created for {coin}: {profit_pct:.2f}%")
+            else:
+                # Update highest PnL if current is higher
+                current_highest = state.get('highest_pnl_pct', profit_pct)
+                if profit_pct > current_highest:
+                    state['highest_pnl_pct'] = profit_pct
+                    logger.info(f"New highest PnL for {coin}: {profit_pct:.2f}% (was {current_highest:.2f}%)")
+                
+                state['last_updated'] = now
+            
+            # Saved by the next _flush_position_states()
+            self._states_dirty = True
     
     def _cleanup_closed_positions(self, open_coins: List[str]):
         """
@@ -113,15 +202,15 @@ class PositionManager:
         Args:
             open_coins: List of currently open coin symbols
         """
-        closed_coins = [coin for coin in self.position_states.keys() if coin not in open_coins]
-        
-        if closed_coins:
-            for coin in closed_coins:
-                logger.info(f"Removing state for closed position: {coin}")
-                del self.position_states[coin]
+        with self._states_lock:
+            closed_coins = [coin for coin in self.position_states.keys() if coin not in open_coins]
             
-            # Save after cleanup
-            self._save_position_states()
+            if closed_coins:
+                for coin in closed_coins:
+                    logger.info(f"Removing state for closed position: {coin}")
+                    del self.position_states[coin]
+                
+                self._states_dirty = True
     
     def start_monitoring(self, interval: int = 2):
         """
@@ -135,6 +224,7 @@ class PositionManager:
             return
         
         self.monitoring = True
+        self._monitor_interval = interval
         self.monitor_thread = threading.Thread(
             target=self._monitor_loop,
             args=(interval,),
@@ -151,6 +241,8 @@ class PositionManager:
         self.monitoring = False
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
+        self._flush_position_states()
+        self._write_q.join()  # Let the last snapshot reach the disk
         logger.info("Position monitoring stopped")
     
     def _monitor_loop(self, interval: int):
@@ -163,6 +255,7 @@ class PositionManager:
         while self.monitoring:
             try:
                 self._check_positions()
+                self._flush_position_states()
                 time.sleep(interval)
             except Exception as e:
                 logger.error(f"Error in monitor loop: {e}")
@@ -171,36 +264,84 @@ class PositionManager:
     def _check_positions(self):
         """Check all open positions and handle exits."""
         try:
+            self.reload_settings()
+            
             # Get positions from API (returns dict: {coin: position_data})
-            positions = self.api.get_positions()
+            positions = self.api.get_cached_positions()
             
             if not positions:
                 # Clean up all states if no positions
                 if self.position_states:
                     self._cleanup_closed_positions([])
+                self._publish_exits([])
                 return
             
             # Clean up states for closed positions
             self._cleanup_closed_positions(list(positions.keys()))
             
-            # Check each position
+            # Update position states (track highest PnL)
             for coin, position_data in positions.items():
-                # Update position state (track highest PnL)
-                profit_pct = position_data.get('profit_pct', 0)
-                self._update_position_state(coin, profit_pct)
-                
-                # Check exit conditions
-                should_exit, reason = self._check_exit_conditions(coin, position_data)
-                
-                if should_exit:
-                    logger.info(f"🔴 EXIT SIGNAL: {coin} - {reason}")
-                    self._close_position(coin, reason)
+                self._update_position_state(coin, position_data.get('profit_pct', 0))
+            
+            # Check exit conditions
+            exits = self._evaluate_exits(positions)
+            self._publish_exits(exits)
+            for coin, reason in exits:
+                logger.info(f"🔴 EXIT SIGNAL: {coin} - {reason}")
+                self._close_position(coin, reason)
                 
         except Exception as e:
             logger.error(f"Error checking positions: {e}")
             import traceback
             traceback.print_exc()
     
+    def _evaluate_exits(self, positions: Dict) -> List[tuple[str, str]]:
+        """
+        Run the exit checks for a positions snapshot.
+        
+        Args:
+            positions: Positions from the API {coin: position_data}
+        
+        Returns:
+            List of tuples (coin, reason) for positions that should exit
+        """
+        exits = []
+        for coin in self._exit_candidates(positions):
+            should_exit, reason = self._check_exit_conditions(coin, positions[coin])
+            if should_exit:
+                exits.append((coin, reason))
+        return exits
+    
+    def _publish_exits(self, exits: List[tuple[str, str]]):
+        """Store the latest exit evaluation for get_positions_to_sell()."""
+        with self._states_lock:
+            self._pending_exits = exits
+            self._pending_exits_ts = time.monotonic()
+    
+    def _exit_candidates(self, positions: Dict) -> List[str]:
+        """
+        Find positions that may need to exit with one vectorized SL/TP scan.
+        
+        With position check debug on, returns every coin so that
+        _check_exit_conditions() still prints each position.
+        
+        Args:
+            positions: Positions from the API {coin: position_data}
+        
+        Returns:
+            Coins to run _check_exit_conditions() on
+        """
+        coins = list(positions)
+        if self._debug:
+            return coins
+        
+        pct = np.fromiter(
+            (positions[coin].get('profit_pct', 0) for coin in coins),
+            dtype=np.float64, count=len(coins)
+        )
+        exit_mask = (pct <= -self._sl_pct) | (pct >= self._tp_pct)
+        return [coins[i] for i in np.flatnonzero(exit_mask)]
+    
     def _check_exit_conditions(self, coin: str, position: Dict) -> tuple[bool, str]:
         """
         Check if position should be exited.
@@ -221,15 +362,17 @@ class PositionManager:
             unrealized_pnl = position.get('unrealized_pnl', 0)
             profit_pct = position.get('profit_pct', 0)  # This is ROE% from API
             
-            # Get settings
-            sl_pct = self.settings['stop_loss_percent']
-            tp_pct = self.settings['take_profit_percent']
+            # Thresholds cached by reload_settings()
+            sl_pct = self._sl_pct
+            tp_pct = self._tp_pct
             
             # Get highest PnL from state
             highest_pnl = self.position_states.get(coin, {}).get('highest_pnl_pct', profit_pct)
             
+            debug = self._debug
+            
             # DEBUG LOGGING (controlled by debug settings)
-            if get_debug_setting('position_check_debug'):
+            if debug:
                 print(f"\n{'='*70}")
                 print(f"🔍 POSITION CHECK: {coin}")
                 print(f"{'='*70}")
@@ -247,7 +390,7 @@ class PositionManager:
             # Check STOP LOSS (profit <= -X%)
             if profit_pct <= -sl_pct:
                 reason = f"STOP LOSS HIT: {profit_pct:.2f}% <= -{sl_pct}% (PnL: ${unrealized_pnl:.2f})"
-                if get_debug_setting('position_check_debug'):
+                if debug:
                     print(f"  ❌ {reason}")
                     print(f"{'='*70}\n")
                 return True, reason
@@ -255,13 +398,13 @@ class PositionManager:
             # Check TAKE PROFIT (profit >= +X%)
             if profit_pct >= tp_pct:
                 reason = f"TAKE PROFIT HIT: {profit_pct:.2f}% >= {tp_pct}% (PnL: ${unrealized_pnl:.2f})"
-                if get_debug_setting('position_check_debug'):
+                if debug:
                     print(f"  ✅ {reason}")
                     print(f"{'='*70}\n")
                 return True, reason
             
             # No exit condition met
-            if get_debug_setting('position_check_debug'):
+            if debug:
                 print(f"  ⏳ HOLDING - Profit: {profit_pct:.2f}% (need {tp_pct}% for TP or <=-{sl_pct}% for SL)")
                 print(f"{'='*70}\n")
             return False, ""
@@ -287,30 +430,40 @@ class PositionManager:
             print(f"{'='*70}\n")
             
             result = self.api.close_position(coin)
-            
-            if result and result.get('status') == 'ok':
-                print(f"\n{'='*70}")
-                print(f"✅ POSITION CLOSED SUCCESSFULLY: {coin}")
-                print(f"   Filled: {result.get('filled_size')} @ ${result.get('avg_price')}")
-                print(f"{'='*70}\n")
-                logger.info(f"Position closed successfully: {coin}")
-                
-                # Remove state for closed position
-                if coin in self.position_states:
-                    del self.position_states[coin]
-                    self._save_position_states()
-            else:
-                print(f"\n{'='*70}")
-                print(f"❌ FAILED TO CLOSE POSITION: {coin}")
-                print(f"   Result: {result}")
-                print(f"{'='*70}\n")
-                logger.error(f"Failed to close position: {result}")
+            self._handle_close_result(coin, result)
                 
         except Exception as e:
             logger.error(f"Error closing position for {coin}: {e}")
             import traceback
             traceback.print_exc()
     
+    def _handle_close_result(self, coin: str, result: Optional[Dict]):
+        """
+        Report a close order result and drop the state of a closed position.
+        
+        Args:
+            coin: Coin symbol
+            result: Close result with 'status' key from the API client
+        """
+        if result and result.get('status') == 'ok':
+            print(f"\n{'='*70}")
+            print(f"✅ POSITION CLOSED SUCCESSFULLY: {coin}")
+            print(f"   Filled: {result.get('filled_size')} @ ${result.get('avg_price')}")
+            print(f"{'='*70}\n")
+            logger.info(f"Position closed successfully: {coin}")
+            
+            # Remove state (and any pending exit) for closed position
+            with self._states_lock:
+                if self.position_states.pop(coin, None) is not None:
+                    self._states_dirty = True
+                self._pending_exits = [exit for exit in self._pending_exits if exit[0] != coin]
+        else:
+            print(f"\n{'='*70}")
+            print(f"❌ FAILED TO CLOSE POSITION: {coin}")
+            print(f"   Result: {result}")
+            print(f"{'='*70}\n")
+            logger.error(f"Failed to close position: {result}")
+    
     def get_position_status(self, coin: str) -> Optional[Dict]:
         """
         Get current status of a position.
@@ -322,7 +475,7 @@ class PositionManager:
             Position status dict or None
         """
         try:
-            positions = self.api.get_positions()
+            positions = self.api.get_cached_positions()
             return positions.get(coin)
             
         except Exception as e:
@@ -333,41 +486,38 @@ class PositionManager:
         """
         Get all open positions with state information.
         
+        Read-only: position states are only written by the monitor loop.
+        
         Returns:
             List of dicts with 'position' and 'state' keys
         """
         try:
-            positions = self.api.get_positions()
+            positions = self.api.get_cached_positions()
+            
+            debug = debug_settings.POSITION_CHECK_DEBUG
             
             result = []
             for coin, position_data in positions.items():
                 profit_pct = position_data.get('profit_pct', 0)
                 
-                # CRITICAL: Ensure state exists for this position
-                # If state doesn't exist, create it NOW with current profit as highest
-                if coin not in self.position_states:
-                    self._update_position_state(coin, profit_pct)
-                else:
-                    # IMPORTANT: Also update existing state to track highest
-                    # This ensures the monitor always gets the latest highest value
-                    self._update_position_state(coin, profit_pct)
+                # Returned as a COPY: the monitor thread keeps updating the original
+                with self._states_lock:
+                    state = dict(self.position_states.get(coin, {}))
                 
-                # Get state for this position (now guaranteed to exist and updated)
-                # Make a COPY to avoid reference issues
-                state = self.position_states.get(coin, {})
+                # CRITICAL: highest_pnl_pct must always be present; include the
+                # current profit in case the monitor hasn't seen it yet
+                state['highest_pnl_pct'] = max(state.get('highest_pnl_pct', profit_pct), profit_pct)
                 
                 # DEBUG: Check what we're returning (controlled by debug settings)
-                if get_debug_setting('position_check_debug'):
+                if debug:
                     print(f"🔧 get_all_positions() for {coin}:")
                     print(f"   State in memory: {self.position_states.get(coin)}")
                     print(f"   State being returned: {state}")
                 
-                # Add coin symbol to position data so monitor can display it
-                position_data['coin'] = coin
-                
+                # Add coin symbol (on a copy of the shared snapshot) so monitor can display it
                 result.append({
-                    'position': position_data,
-                    'state': state.copy()
+                    'position': {**position_data, 'coin': coin},
+                    'state': state
                 })
             
             return result
@@ -381,10 +531,13 @@ class PositionManager:
         try:
             logger.warning("🚨 FORCE CLOSING ALL POSITIONS 🚨")
             
-            positions = self.api.get_positions()
+            positions = self.api.get_cached_positions()
             
-            for coin in positions.keys():
-                self._close_position(coin, "EMERGENCY CLOSE")
+            # One exchange request for every position
+            results = self.api.close_positions_batch(list(positions.keys()))
+            for coin, result in results.items():
+                self._handle_close_result(coin, result)
+            self._flush_position_states()
             
             logger.info("All positions closed")
             
@@ -396,23 +549,28 @@ class PositionManager:
         Get list of positions that should be sold based on exit conditions.
         Useful for batch checking without auto-closing.
         
+        While monitoring, returns the monitor loop's latest evaluation (minus
+        positions closed since); otherwise evaluates the positions now.
+        
         Returns:
             List of tuples (coin, reason)
         """
+        with self._states_lock:
+            pending, evaluated_at = self._pending_exits, self._pending_exits_ts
+        if self.monitoring and time.monotonic() - evaluated_at < self._monitor_interval:
+            return list(pending)
+        
         positions_to_sell = []
         
         try:
-            positions = self.api.get_positions()
-            
-            for coin, position_data in positions.items():
-                should_exit, reason = self._check_exit_conditions(coin, position_data)
-                if should_exit:
-                    positions_to_sell.append((coin, reason))
+            self.reload_settings()
+            positions_to_sell = self._evaluate_exits(self.api.get_cached_positions())
+            self._publish_exits(positions_to_sell)
             
         except Exception as e:
             logger.error(f"Error getting positions to sell: {e}")
         
-        return positions_to_sell
+        return list(positions_to_sell)
     
     def get_stats(self) -> Dict:
         """
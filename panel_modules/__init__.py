@@ -2,26 +2,53 @@
 Panel Modules - Modular components for the trading panel
 """
 
-from .positions import PositionsManager
-from .orders import OrdersManager
-from .api_utils import HyperliquidAPI
-from .price_fetcher import PriceFetcher
-from .position_monitor import PositionMonitor
-from .navigation import NavigationBar
-from .header import HeaderComponent, BotStatusComponent, StatusBar
-from .pages import HomePage, SettingsPage, APISettingsPage
+import importlib
+
+# Exported name -> submodule that defines it. Submodules are imported on
+# first access (PEP 562), so importing one component does not load the rest.
+_ATTR_TO_MODULE = {
+    'PositionsManager': 'positions',
+    'OrdersManager': 'orders',
+    'HyperliquidAPI': 'api_utils',
+    'PriceFetcher': 'price_fetcher',
+    'PositionMonitor': 'position_monitor',
+    'NavigationBar': 'navigation',
+    'HeaderComponent': 'header',
+    'BotStatusComponent': 'header',
+    'StatusBar': 'header',
+    'TickScheduler': 'scheduler',
+    'HomePage': 'pages',
+    'SettingsPage': 'pages',
+    'APISettingsPage': 'pages',
+}
 
 __all__ = [
-    'PositionsManager', 
-    'OrdersManager', 
-    'HyperliquidAPI', 
-    'PriceFetcher', 
+    'PositionsManager',
+    'OrdersManager',
+    'HyperliquidAPI',
+    'PriceFetcher',
     'PositionMonitor',
     'NavigationBar',
     'HeaderComponent',
     'BotStatusComponent',
     'StatusBar',
+    'TickScheduler',
     'HomePage',
     'SettingsPage',
     'APISettingsPage'
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining name on first access and cache it."""
+    module_name = _ATTR_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,20 +2,97 @@
 API Utils - Handles Hyperliquid API connection and data fetching
 """
 
+import importlib.util
 import json
 import os
 import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 try:
-    from hyperliquid.info import Info
-    from hyperliquid.exchange import Exchange
-    import eth_account
-    from eth_account.signers.local import LocalAccount
-    HYPERLIQUID_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    HYPERLIQUID_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# The SDK (and the websocket/crypto stack behind it) is only imported in
+# connect(); find_spec checks it is installed without running it.
+HYPERLIQUID_AVAILABLE = (
+    importlib.util.find_spec('hyperliquid') is not None
+    and importlib.util.find_spec('eth_account') is not None
+)
+if not HYPERLIQUID_AVAILABLE:
     print("Warning: Hyperliquid SDK not installed")
 
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
+
+
+@dataclass
+class Position:
+    """
+    Open position as shown in the panel.
+    
+    Slotted (no per-instance __dict__) since the full list is rebuilt on
+    every refresh.
+    """
+    __slots__ = ('coin', 'size', 'entry_price', 'current_price', 'pnl', 'side')
+    
+    coin: str
+    size: float
+    entry_price: float
+    current_price: float
+    pnl: float
+    side: str  # "LONG" or "SHORT"
+    
+    def asdict(self) -> dict:
+        """Return the position as a plain dict (the old get_positions format)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_default(obj):
+    """Stdlib json fallback for the types orjson serializes natively."""
+    if isinstance(obj, Position):
+        return obj.asdict()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def to_json_bytes(obj) -> bytes:
+    """
+    Serialize API results (summaries, Position lists, numpy values) to JSON.
+    
+    Args:
+        obj: Value returned by a HyperliquidAPI getter
+    
+    Returns:
+        UTF-8 encoded JSON (orjson when installed)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default).encode()
+
+
+def _f(value, default: float = 0.0) -> float:
+    """Convert an API number (str/int/float, possibly None or '') to float."""
+    if value is None or value == '':
+        return default
+    return float(value)
+
 
 class HyperliquidAPI:
     """Handles Hyperliquid API connections and data fetching"""
@@ -27,6 +104,12 @@ class HyperliquidAPI:
         self.account = None
         self.connected = False
         
+        # Short-lived user_state / all_mids responses shared by the getters
+        # below, so one UI refresh makes one request of each
+        self.cache_ttl = 1.0
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        
         if config_path is None:
             config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'api_config.json')
         self.config_path = config_path
@@ -38,9 +121,13 @@ class HyperliquidAPI:
             return False
         
         try:
+            from hyperliquid.info import Info
+            from hyperliquid.exchange import Exchange
+            import eth_account
+            
             # Load config
-            with open(self.config_path) as f:
-                config = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                config = _loads(f.read())
             
             # Check if credentials are set (detect first-time user)
             secret_key = config.get("secret_key", "")
@@ -61,7 +148,7 @@ class HyperliquidAPI:
                 return False
             
             # Setup account
-            self.account: LocalAccount = eth_account.Account.from_key(config["secret_key"])
+            self.account: "LocalAccount" = eth_account.Account.from_key(config["secret_key"])
             self.address = config["account_address"]
             if self.address == "":
                 self.address = self.account.address
@@ -77,6 +164,10 @@ class HyperliquidAPI:
             margin_summary = user_state["marginSummary"]
             account_value = float(margin_summary["accountValue"])
             
+            # Seed the cache for this account (drops anything from a previous one)
+            with self._cache_lock:
+                self._cache = {'user_state': (time.monotonic(), user_state)}
+            
             print(f"✓ Connected! Account value: ${account_value:.2f}")
             
             self.connected = True
@@ -119,13 +210,35 @@ class HyperliquidAPI:
         print("💡 TIP: The panel will continue to load so you can configure it via the UI")
         print("="*80 + "\n")
     
+    def _cached(self, key, fetcher):
+        """
+        Return a recent API response, fetching it again once it is stale
+        
+        Args:
+            key: Cache key (e.g., 'user_state')
+            fetcher: Zero-argument callable that performs the request
+        
+        Returns:
+            The cached or freshly fetched response
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[0] < self.cache_ttl:
+                return entry[1]
+        
+        value = fetcher()
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), value)
+        return value
+    
     def get_account_value(self):
         """Get total account value"""
         if not self.connected or not self.info:
             return 0.0
         
         try:
-            user_state = self.info.user_state(self.address)
+            user_state = self._cached('user_state', lambda: self.info.user_state(self.address))
             margin_summary = user_state["marginSummary"]
             return float(margin_summary["accountValue"])
         except Exception as e:
@@ -133,13 +246,13 @@ class HyperliquidAPI:
             return 0.0
     
     def get_positions(self):
-        """Get all open positions"""
+        """Get all open positions as a list of Position objects"""
         if not self.connected or not self.info:
             return []
         
         try:
-            user_state = self.info.user_state(self.address)
-            all_mids = self.info.all_mids()
+            user_state = self._cached('user_state', lambda: self.info.user_state(self.address))
+            all_mids = self._cached('all_mids', self.info.all_mids)
             
             positions = []
             
@@ -148,21 +261,17 @@ class HyperliquidAPI:
                 coin = position.get("coin")
                 
                 if coin:
-                    size = float(position.get("szi", 0) or 0)
+                    size = _f(position.get("szi"))
                     
                     if abs(size) > 0:
-                        entry_price = float(position.get("entryPx", 0) or 0)
-                        current_price = float(all_mids.get(coin, 0) or 0)
-                        pnl = float(position.get("unrealizedPnl", 0) or 0)
+                        entry_price = _f(position.get("entryPx"))
+                        current_price = _f(all_mids.get(coin))
+                        pnl = _f(position.get("unrealizedPnl"))
                         
-                        positions.append({
-                            'coin': coin,
-                            'size': size,
-                            'entry_price': entry_price,
-                            'current_price': current_price,
-                            'pnl': pnl,
-                            'side': "LONG" if size > 0 else "SHORT"
-                        })
+                        positions.append(Position(
+                            coin, size, entry_price, current_price, pnl,
+                            "LONG" if size > 0 else "SHORT"
+                        ))
             
             return positions
             
@@ -176,9 +285,9 @@ class HyperliquidAPI:
             return None
         
         try:
-            user_state = self.info.user_state(self.address)
+            user_state = self._cached('user_state', lambda: self.info.user_state(self.address))
             margin_summary = user_state["marginSummary"]
-            all_mids = self.info.all_mids()
+            all_mids = self._cached('all_mids', self.info.all_mids)
             
             total_balance = float(margin_summary["accountValue"])
             total_margin_used = float(margin_summary["totalMarginUsed"])
@@ -193,13 +302,13 @@ class HyperliquidAPI:
                 coin = position.get("coin")
                 
                 if coin:
-                    size = abs(float(position.get("szi", 0) or 0))
+                    size = abs(_f(position.get("szi")))
                     if size > 0:
-                        current_price = float(all_mids.get(coin, 0) or 0)
+                        current_price = _f(all_mids.get(coin))
                         position_value = size * current_price
                         total_position_value += position_value
                         
-                        pnl = float(position.get("unrealizedPnl", 0) or 0)
+                        pnl = _f(position.get("unrealizedPnl"))
                         total_pnl += pnl
             
             return {
@@ -219,8 +328,8 @@ class HyperliquidAPI:
             return 0.0
         
         try:
-            all_mids = self.info.all_mids()
-            return float(all_mids.get(coin, 0) or 0)
+            all_mids = self._cached('all_mids', self.info.all_mids)
+            return _f(all_mids.get(coin))
         except Exception as e:
             print(f"Error getting price for {coin}: {e}")
             return 0.0
@@ -252,31 +361,21 @@ class HyperliquidAPI:
             today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
             today_start_ms = int(today_start.timestamp() * 1000)
             
-            # Filter today's trades
-            today_trades = []
-            total_pnl = 0.0
-            total_volume = 0.0
-            winning_trades = 0
-            losing_trades = 0
+            # Filter today's trades by timestamp first (no assumption about
+            # fill order), so only those get their numeric fields converted
+            timestamps = np.fromiter((int(f.get('time', 0)) for f in fills), dtype=np.int64, count=len(fills))
+            today_trades = [fill for fill, is_today in zip(fills, timestamps >= today_start_ms) if is_today]
             
-            for fill in fills:
-                timestamp = int(fill.get('time', 0))
-                if timestamp >= today_start_ms:
-                    today_trades.append(fill)
-                    
-                    # Calculate PNL if it's a closing trade
-                    closed_pnl = float(fill.get('closedPnl', 0) or 0)
-                    if closed_pnl != 0:
-                        total_pnl += closed_pnl
-                        if closed_pnl > 0:
-                            winning_trades += 1
-                        else:
-                            losing_trades += 1
-                    
-                    # Calculate volume
-                    px = float(fill.get('px', 0) or 0)
-                    sz = abs(float(fill.get('sz', 0) or 0))
-                    total_volume += px * sz
+            count = len(today_trades)
+            today_pnl = np.fromiter((_f(f.get('closedPnl')) for f in today_trades), dtype=np.float64, count=count)
+            px = np.fromiter((_f(f.get('px')) for f in today_trades), dtype=np.float64, count=count)
+            sz = np.fromiter((_f(f.get('sz')) for f in today_trades), dtype=np.float64, count=count)
+            
+            # PNL only comes from closing trades (closedPnl != 0)
+            total_pnl = float(today_pnl.sum())
+            winning_trades = int((today_pnl > 0).sum())
+            losing_trades = int((today_pnl < 0).sum())
+            total_volume = float((px * np.abs(sz)).sum())
             
             win_rate = (winning_trades / (winning_trades + losing_trades) * 100) if (winning_trades + losing_trades) > 0 else 0
             
@@ -2,9 +2,171 @@
 CoinGecko Price Fetcher - Gets real-time prices from CoinGecko Free API
 """
 
+import asyncio
+import importlib.util
+import json
+import threading
+import time
 import requests
-from typing import Dict, Optional
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Optional, Sequence
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# httpx needs the h2 package for HTTP/2
+HTTP2_AVAILABLE = HTTPX_AVAILABLE and importlib.util.find_spec('h2') is not None
+
+# Only advertise Brotli when a decoder is installed (requests/httpx use it
+# automatically); CoinGecko's larger responses compress best with it
+BROTLI_AVAILABLE = any(
+    importlib.util.find_spec(name) is not None for name in ('brotli', 'brotlicffi')
+)
+_ACCEPT_ENCODING = 'gzip, br, deflate' if BROTLI_AVAILABLE else 'gzip, deflate'
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_market_chart(content: bytes, fields: Optional[Sequence[str]] = None) -> Dict:
+    """
+    Parse a market_chart response, keeping only the requested series.
+    
+    The body is already in memory, so it is parsed once in full; a single
+    orjson/json pass is cheaper than rescanning it per series.
+    
+    Args:
+        content: Raw response body
+        fields: Series to keep (e.g. ['prices']), or None for all of them
+    
+    Returns:
+        Dict of series name -> list of [timestamp_ms, value] pairs
+    """
+    data = _loads(content)
+    if fields is None:
+        return data
+    
+    return {field: data.get(field, []) for field in fields}
+
+
+# Mapping of common symbols to CoinGecko IDs (shared, read-only)
+_SYMBOL_TO_ID = MappingProxyType({
+    'BTC': 'bitcoin',
+    'ETH': 'ethereum',
+    'USDT': 'tether',
+    'BNB': 'binancecoin',
+    'SOL': 'solana',
+    'XRP': 'ripple',
+    'ADA': 'cardano',
+    'DOGE': 'dogecoin',
+    'DOT': 'polkadot',
+    'MATIC': 'matic-network',
+    'LINK': 'chainlink',
+    'UNI': 'uniswap',
+    'AVAX': 'avalanche-2',
+    'ATOM': 'cosmos',
+    'LTC': 'litecoin',
+    'BCH': 'bitcoin-cash',
+    'ALGO': 'algorand',
+    'VET': 'vechain',
+    'ICP': 'internet-computer',
+    'FIL': 'filecoin',
+    'AAVE': 'aave',
+    'SAND': 'the-sandbox',
+    'MANA': 'decentraland',
+    'AXS': 'axie-infinity',
+    'THETA': 'theta-token',
+    'XTZ': 'tezos',
+    'ETC': 'ethereum-classic',
+    'EGLD': 'elrond-erd-2',
+    'FLOW': 'flow',
+    'FTM': 'fantom',
+    'HBAR': 'hedera-hashgraph',
+    'NEAR': 'near',
+    'GRT': 'the-graph',
+    'STX': 'blockstack',
+    'RUNE': 'thorchain',
+    'ZEC': 'zcash',
+    'MKR': 'maker',
+    'SNX': 'havven',
+    'COMP': 'compound-governance-token',
+    'YFI': 'yearn-finance',
+    'SUSHI': 'sushi',
+    'CRV': 'curve-dao-token',
+    '1INCH': '1inch',
+    'ENJ': 'enjincoin',
+    'BAT': 'basic-attention-token',
+    'ZRX': '0x',
+    'KNC': 'kyber-network-crystal',
+    'STORJ': 'storj',
+    'REN': 'republic-protocol',
+    'LDO': 'lido-dao',
+    'IMX': 'immutable-x',
+    'OP': 'optimism',
+    'ARB': 'arbitrum',
+    'SUI': 'sui',
+    'APT': 'aptos',
+    'INJ': 'injective-protocol',
+    'TIA': 'celestia',
+    'SEI': 'sei-network',
+    'SHIB': 'shiba-inu',
+    'TRX': 'tron',
+    'TON': 'the-open-network',
+    'CELO': 'celo',
+    'QNT': 'quant-network',
+    'CHZ': 'chiliz',
+    'PAXG': 'pax-gold',
+    'TAO': 'bittensor',
+    'ICX': 'icon',
+    'ZIL': 'zilliqa',
+    'OKB': 'okb',
+    'LEO': 'leo-token',
+    'ENA': 'ethena',
+})
+
+
+class TokenBucket:
+    """Thread-safe token bucket: rate tokens per second, up to capacity."""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def try_acquire(self) -> bool:
+        """Take one token if available; never blocks."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+# Client-side budget under the free tier's limit (~24 requests/min, bursts
+# of 10). Module-level so every fetcher in the process draws from one budget
+# rather than each new instance starting with a full burst.
+_BUCKET = TokenBucket(rate=0.4, capacity=10)
 
 
 class CoinGeckoPriceFetcher:
@@ -13,97 +175,49 @@ class CoinGeckoPriceFetcher:
     def __init__(self):
         self.base_url = "https://api.coingecko.com/api/v3"
         self.prices = {}
-        self.last_fetch = {}
+        self.last_fetch = {}  # symbol -> time.monotonic() of last fetch
         self.cache_duration = 30  # Cache for 30 seconds to avoid rate limits
+        self.tickers = {}  # symbol -> last 24h ticker
         
-        # Mapping of common symbols to CoinGecko IDs
-        self.symbol_to_id = {
-            'BTC': 'bitcoin',
-            'ETH': 'ethereum',
-            'USDT': 'tether',
-            'BNB': 'binancecoin',
-            'SOL': 'solana',
-            'XRP': 'ripple',
-            'ADA': 'cardano',
-            'DOGE': 'dogecoin',
-            'DOT': 'polkadot',
-            'MATIC': 'matic-network',
-            'LINK': 'chainlink',
-            'UNI': 'uniswap',
-            'AVAX': 'avalanche-2',
-            'ATOM': 'cosmos',
-            'LTC': 'litecoin',
-            'BCH': 'bitcoin-cash',
-            'ALGO': 'algorand',
-            'VET': 'vechain',
-            'ICP': 'internet-computer',
-            'FIL': 'filecoin',
-            'AAVE': 'aave',
-            'SAND': 'the-sandbox',
-            'MANA': 'decentraland',
-            'AXS': 'axie-infinity',
-            'THETA': 'theta-token',
-            'XTZ': 'tezos',
-            'ETC': 'ethereum-classic',
-            'EGLD': 'elrond-erd-2',
-            'FLOW': 'flow',
-            'FTM': 'fantom',
-            'HBAR': 'hedera-hashgraph',
-            'NEAR': 'near',
-            'GRT': 'the-graph',
-            'STX': 'blockstack',
-            'RUNE': 'thorchain',
-            'ZEC': 'zcash',
-            'MKR': 'maker',
-            'SNX': 'havven',
-            'COMP': 'compound-governance-token',
-            'YFI': 'yearn-finance',
-            'SUSHI': 'sushi',
-            'CRV': 'curve-dao-token',
-            '1INCH': '1inch',
-            'ENJ': 'enjincoin',
-            'BAT': 'basic-attention-token',
-            'ZRX': '0x',
-            'KNC': 'kyber-network-crystal',
-            'STORJ': 'storj',
-            'REN': 'republic-protocol',
-            'LDO': 'lido-dao',
-            'IMX': 'immutable-x',
-            'OP': 'optimism',
-            'ARB': 'arbitrum',
-            'SUI': 'sui',
-            'APT': 'aptos',
-            'INJ': 'injective-protocol',
-            'TIA': 'celestia',
-            'SEI': 'sei-network',
-            'SHIB': 'shiba-inu',
-            'TRX': 'tron',
-            'TON': 'the-open-network',
-            'CELO': 'celo',
-            'QNT': 'quant-network',
-            'CHZ': 'chiliz',
-            'PAXG': 'pax-gold',
-            'TAO': 'bittensor',
-            'ICX': 'icon',
-            'ZIL': 'zilliqa',
-            'OKB': 'okb',
-            'LEO': 'leo-token',
-            'ENA': 'ethena',
-        }
+        # Over the shared request budget, or inside a 429 Retry-After
+        # window, methods return cached data instead of calling the API.
+        self._bucket = _BUCKET
+        self._retry_after_until = 0.0
+        
+        # Keep-alive client so repeated calls reuse the TLS connection
+        self._session = self._make_session()
+        
+        # Shared async client (one connection pool per event loop)
+        self._client = None
+        self._client_loop = None
+        
+        # Symbols with a get_price request in flight; other callers wait
+        # on its event instead of sending a duplicate request
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        
+        self.symbol_to_id = _SYMBOL_TO_ID
+        
+        # Symbol -> CoinGecko ID, memoized per instance since the same few
+        # symbols are resolved on every refresh
+        self._id_cache = lru_cache(maxsize=512)(self._lookup_coingecko_id)
     
     def _is_cache_valid(self, symbol: str) -> bool:
         """Check if cached data is still valid"""
-        if symbol not in self.last_fetch:
-            return False
-        
-        time_diff = datetime.now() - self.last_fetch[symbol]
-        return time_diff.total_seconds() < self.cache_duration
+        return time.monotonic() - self.last_fetch.get(symbol, float('-inf')) < self.cache_duration
     
     def _get_coingecko_id(self, symbol: str) -> Optional[str]:
         """Convert trading symbol to CoinGecko ID"""
-        # Remove USDT suffix if present
-        clean_symbol = symbol.replace('USDT', '').replace('USD', '')
-        return self.symbol_to_id.get(clean_symbol)
+        return self._id_cache(symbol)
+    
+    def _lookup_coingecko_id(self, symbol: str) -> Optional[str]:
+        """Uncached symbol -> CoinGecko ID conversion"""
+        # Remove USDT/USD quote suffix if present
+        if symbol.endswith('USDT'):
+            symbol = symbol[:-4]
+        elif symbol.endswith('USD'):
+            symbol = symbol[:-3]
+        return self.symbol_to_id.get(symbol)
     
     def get_price(self, symbol: str) -> Optional[float]:
         """
@@ -124,22 +238,45 @@ class CoinGeckoPriceFetcher:
             print(f"Unknown symbol: {symbol}")
             return self.prices.get(symbol)
         
+        with self._inflight_lock:
+            event = self._inflight.get(symbol)
+            leader = event is None
+            if leader:
+                # Another caller may have just finished refreshing it
+                if self._is_cache_valid(symbol) and symbol in self.prices:
+                    return self.prices[symbol]
+                event = self._inflight[symbol] = threading.Event()
+        
+        if not leader:
+            event.wait()
+            return self.prices.get(symbol)
+        
         try:
-            response = requests.get(
+            return self._fetch_price(symbol, coin_id)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[symbol]
+            event.set()
+    
+    def _fetch_price(self, symbol: str, coin_id: str) -> Optional[float]:
+        """Request one price from the API and update the cache"""
+        try:
+            response = self._get(
                 f"{self.base_url}/simple/price",
                 params={
                     'ids': coin_id,
                     'vs_currencies': 'usd'
-                },
-                timeout=10
+                }
             )
+            if response is None:
+                return self.prices.get(symbol)  # Rate limited: use cached price
             
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if coin_id in data and 'usd' in data[coin_id]:
                     price = float(data[coin_id]['usd'])
                     self.prices[symbol] = price
-                    self.last_fetch[symbol] = datetime.now()
+                    self.last_fetch[symbol] = time.monotonic()
                     return price
             else:
                 print(f"CoinGecko API error: {response.status_code}")
@@ -165,32 +302,21 @@ class CoinGeckoPriceFetcher:
             return None
         
         try:
-            response = requests.get(
-                f"{self.base_url}/coins/{coin_id}",
+            response = self._get(
+                f"{self.base_url}/coins/markets",
                 params={
-                    'localization': 'false',
-                    'tickers': 'false',
-                    'market_data': 'true',
-                    'community_data': 'false',
-                    'developer_data': 'false',
-                    'sparkline': 'false'
-                },
-                timeout=10
+                    'vs_currency': 'usd',
+                    'ids': coin_id
+                }
             )
+            if response is None:
+                return self.tickers.get(symbol)
             
             if response.status_code == 200:
-                data = response.json()
-                market_data = data.get('market_data', {})
-                
-                return {
-                    'price': float(market_data.get('current_price', {}).get('usd', 0)),
-                    'high_24h': float(market_data.get('high_24h', {}).get('usd', 0)),
-                    'low_24h': float(market_data.get('low_24h', {}).get('usd', 0)),
-                    'volume_24h': float(market_data.get('total_volume', {}).get('usd', 0)),
-                    'price_change_pct': float(market_data.get('price_change_percentage_24h', 0)),
-                    'market_cap': float(market_data.get('market_cap', {}).get('usd', 0)),
-                    'circulating_supply': float(market_data.get('circulating_supply', 0))
-                }
+                ticker = self._parse_ticker(_loads(response.content))
+                if ticker:
+                    self.tickers[symbol] = ticker
+                return ticker
             else:
                 print(f"CoinGecko API error: {response.status_code}")
                 return None
@@ -209,40 +335,35 @@ class CoinGeckoPriceFetcher:
         Returns:
             Dict of symbol -> price
         """
-        # Convert symbols to CoinGecko IDs
-        coin_ids = []
-        symbol_map = {}
-        
-        for symbol in symbols:
-            coin_id = self._get_coingecko_id(symbol)
-            if coin_id:
-                coin_ids.append(coin_id)
-                symbol_map[coin_id] = symbol
+        # Convert symbols to CoinGecko IDs (keyed by symbol: BTC and BTCUSDT
+        # share an ID but both need a price)
+        symbol_map = {symbol: coin_id for symbol in symbols
+                      if (coin_id := self._get_coingecko_id(symbol))}
         
-        if not coin_ids:
+        if not symbol_map:
             return {}
         
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.base_url}/simple/price",
                 params={
-                    'ids': ','.join(coin_ids),
+                    'ids': ','.join(set(symbol_map.values())),
                     'vs_currencies': 'usd'
-                },
-                timeout=10
+                }
             )
+            if response is None:
+                return {symbol: self.prices[symbol] for symbol in symbol_map if symbol in self.prices}
             
             if response.status_code == 200:
-                data = response.json()
-                prices = {}
-                
-                for coin_id, symbol in symbol_map.items():
-                    if coin_id in data and 'usd' in data[coin_id]:
-                        price = float(data[coin_id]['usd'])
-                        prices[symbol] = price
-                        self.prices[symbol] = price
-                        self.last_fetch[symbol] = datetime.now()
+                data = _loads(response.content)
+                prices = {
+                    symbol: float(data[coin_id]['usd'])
+                    for symbol, coin_id in symbol_map.items()
+                    if 'usd' in data.get(coin_id, ())
+                }
                 
+                self.prices.update(prices)
+                self.last_fetch.update(dict.fromkeys(prices, time.monotonic()))
                 return prices
             else:
                 print(f"CoinGecko API error: {response.status_code}")
@@ -252,14 +373,202 @@ class CoinGeckoPriceFetcher:
             print(f"Error fetching multiple prices: {e}")
             return {}
     
-    def get_market_chart(self, symbol: str, days: int = 1) -> Optional[Dict]:
+    def get_market_chart(self, symbol: str, days: int = 1,
+                         fields: Optional[Sequence[str]] = None) -> Optional[Dict]:
         """
         Get historical market data (price, volume, market cap)
         
         Args:
             symbol: Trading symbol
             days: Number of days of data (1, 7, 14, 30, 90, 180, 365, max)
+            fields: Series to return (e.g. ['prices']); None returns all of
+                prices, market_caps and total_volumes
+            
+        Returns:
+            Dict with historical data or None
+        """
+        coin_id = self._get_coingecko_id(symbol)
+        if not coin_id:
+            print(f"Unknown symbol: {symbol}")
+            return None
+        
+        try:
+            response = self._get(
+                f"{self.base_url}/coins/{coin_id}/market_chart",
+                params={
+                    'vs_currency': 'usd',
+                    'days': days
+                }
+            )
+            if response is None:
+                return None
+            
+            if response.status_code == 200:
+                return _parse_market_chart(response.content, fields)
+            else:
+                print(f"CoinGecko API error: {response.status_code}")
+                return None
+                
+        except Exception as e:
+            print(f"Error fetching market chart for {symbol}: {e}")
+            return None
+    
+    @staticmethod
+    def _parse_ticker(data: list) -> Optional[Dict]:
+        """
+        Extract 24h ticker fields from a /coins/markets response
+        
+        /coins/markets returns the same numbers as /coins/{id} market_data
+        in ~1KB instead of ~100KB. Missing values (null) become 0.
+        """
+        if not data:
+            return None
+        market = data[0]
+        
+        return {
+            'price': float(market.get('current_price') or 0),
+            'high_24h': float(market.get('high_24h') or 0),
+            'low_24h': float(market.get('low_24h') or 0),
+            'volume_24h': float(market.get('total_volume') or 0),
+            'price_change_pct': float(market.get('price_change_percentage_24h') or 0),
+            'market_cap': float(market.get('market_cap') or 0),
+            'circulating_supply': float(market.get('circulating_supply') or 0)
+        }
+    
+    @staticmethod
+    def _make_session():
+        """
+        Create the HTTP client used by the sync methods
+        
+        Uses httpx (HTTP/2 when h2 is installed) if available, otherwise a
+        requests.Session. Both take get(url, params=..., timeout=...) and
+        return responses with status_code and content.
+        """
+        if HTTPX_AVAILABLE:
+            return httpx.Client(
+                headers={'Accept-Encoding': _ACCEPT_ENCODING},
+                transport=httpx.HTTPTransport(http2=HTTP2_AVAILABLE, retries=3)
+            )
+        
+        # Gateway errors are retried with backoff (429s start a cooldown in
+        # _get instead); the final response is returned, not raised, so
+        # callers still see the status.
+        session = requests.Session()
+        session.headers.update({'Accept-Encoding': _ACCEPT_ENCODING})
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False
+        )
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        return session
+    
+    def _allow_request(self) -> bool:
+        """Check the Retry-After cooldown and the request budget"""
+        if time.monotonic() < self._retry_after_until:
+            return False
+        return self._bucket.try_acquire()
+    
+    def _note_rate_limit(self, response):
+        """Start a cooldown when the API answers 429 Too Many Requests"""
+        if response.status_code != 429:
+            return
+        try:
+            delay = float(response.headers.get('Retry-After', 60))
+        except ValueError:
+            delay = 60.0  # HTTP-date form; not worth parsing
+        self._retry_after_until = time.monotonic() + delay
+    
+    def _get(self, url: str, params: Dict):
+        """
+        Rate-limited GET through the sync client
+        
+        Returns:
+            Response, or None if the request was skipped for rate limiting
+        """
+        if not self._allow_request():
+            return None
+        response = self._session.get(url, params=params, timeout=10)
+        self._note_rate_limit(response)
+        return response
+    
+    async def _aget(self, url: str, params: Dict):
+        """Async version of _get"""
+        if not self._allow_request():
+            return None
+        response = await self._get_async_client().get(url, params=params)
+        self._note_rate_limit(response)
+        return response
+    
+    def close(self):
+        """Close the HTTP session"""
+        self._session.close()
+    
+    def _get_async_client(self):
+        """Return the shared httpx client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(http2=HTTP2_AVAILABLE, timeout=10)
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared async client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+    
+    async def aget_ticker_24h(self, symbol: str) -> Optional[Dict]:
+        """
+        Async version of get_ticker_24h
+        
+        Args:
+            symbol: Trading symbol (e.g., 'BTC', 'BTCUSDT')
+        
+        Returns:
+            Dict with ticker data or None
+        """
+        coin_id = self._get_coingecko_id(symbol)
+        if not coin_id:
+            print(f"Unknown symbol: {symbol}")
+            return None
+        
+        try:
+            response = await self._aget(
+                f"{self.base_url}/coins/markets",
+                params={
+                    'vs_currency': 'usd',
+                    'ids': coin_id
+                }
+            )
+            if response is None:
+                return self.tickers.get(symbol)
             
+            if response.status_code == 200:
+                ticker = self._parse_ticker(_loads(response.content))
+                if ticker:
+                    self.tickers[symbol] = ticker
+                return ticker
+            else:
+                print(f"CoinGecko API error: {response.status_code}")
+                return None
+                
+        except Exception as e:
+            print(f"Error fetching 24h ticker for {symbol}: {e}")
+            return None
+    
+    async def aget_market_chart(self, symbol: str, days: int = 1,
+                                fields: Optional[Sequence[str]] = None) -> Optional[Dict]:
+        """
+        Async version of get_market_chart
+        
+        Args:
+            symbol: Trading symbol
+            days: Number of days of data (1, 7, 14, 30, 90, 180, 365, max)
+            fields: Series to return; None returns all of them
+        
         Returns:
             Dict with historical data or None
         """
@@ -269,17 +578,18 @@ class CoinGeckoPriceFetcher:
             return None
         
         try:
-            response = requests.get(
+            response = await self._aget(
                 f"{self.base_url}/coins/{coin_id}/market_chart",
                 params={
                     'vs_currency': 'usd',
                     'days': days
-                },
-                timeout=10
+                }
             )
+            if response is None:
+                return None
             
             if response.status_code == 200:
-                return response.json()
+                return _parse_market_chart(response.content, fields)
             else:
                 print(f"CoinGecko API error: {response.status_code}")
                 return None
@@ -287,3 +597,38 @@ class CoinGeckoPriceFetcher:
         except Exception as e:
             print(f"Error fetching market chart for {symbol}: {e}")
             return None
+    
+    async def aget_many_tickers(self, symbols: list) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch 24h tickers for several symbols concurrently
+        
+        Args:
+            symbols: List of trading symbols
+        
+        Returns:
+            Dict of symbol -> ticker data (None on error)
+        """
+        tickers = await asyncio.gather(*(self.aget_ticker_24h(s) for s in symbols))
+        return dict(zip(symbols, tickers))
+    
+    def get_many_tickers(self, symbols: list) -> Dict[str, Optional[Dict]]:
+        """
+        Get 24h tickers for several symbols (concurrent when httpx is installed)
+        
+        Args:
+            symbols: List of trading symbols
+        
+        Returns:
+            Dict of symbol -> ticker data (None on error)
+        """
+        if not HTTPX_AVAILABLE:
+            return {symbol: self.get_ticker_24h(symbol) for symbol in symbols}
+        
+        async def fetch():
+            try:
+                return await self.aget_many_tickers(symbols)
+            finally:
+                # The client is tied to this event loop, which asyncio.run closes
+                await self.aclose()
+        
+        return asyncio.run(fetch())
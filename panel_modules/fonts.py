@@ -0,0 +1,26 @@
+"""
+Fonts - Shared Tk font objects for the trading panel widgets
+"""
+import tkinter.font as tkfont
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def courier(size, *styles):
+    """
+    Get the shared Courier font for a size and style
+    
+    Tk parses a font tuple such as ('Courier', 9, 'bold') on every widget
+    that is given one; a Font object is parsed once and then referenced by
+    name. Fonts are created on first use because they need a Tk root.
+    
+    Args:
+        size: Point size
+        *styles: Any of 'bold' and 'underline'
+    
+    Returns:
+        tkinter.font.Font, kept alive by the cache
+    """
+    return tkfont.Font(family='Courier', size=size,
+                       weight='bold' if 'bold' in styles else 'normal',
+                       underline='underline' in styles)
@@ -1,10 +1,21 @@
 """
 Header and status components for the trading panel
 """
+import time
 import tkinter as tk
-from datetime import datetime
+import webbrowser
+from datetime import datetime, timezone
 import pytz
 
+from panel_modules.fonts import courier
+
+# Timezones shown in the header clock, built once instead of every tick
+CET_TZ = pytz.timezone('Europe/Paris')  # CET/CEST
+US_TZ = pytz.timezone('America/New_York')  # EST/EDT
+
+# Opened by the status bar's exchange link
+EXCHANGE_URL = "https://app.hyperliquid.xyz/join/BONUS500"
+
 
 class HeaderComponent:
     """Handles the header display with title and time"""
@@ -20,6 +31,8 @@ class HeaderComponent:
         self.parent = parent
         self.colors = colors
         self.time_label = None
+        self._time_var = tk.StringVar(master=parent)
+        self._last_time_text = None
         
     def create_header(self):
         """Create the header with title and time display"""
@@ -28,7 +41,7 @@ class HeaderComponent:
         
         title = tk.Label(header_frame, text="⬤ AUTOMATED TRADING BOT v0.1", 
                         bg=self.colors['bg_dark'], fg=self.colors['green'],
-                        font=('Courier', 16, 'bold'))
+                        font=courier(16, 'bold'))
         title.pack(side=tk.LEFT)
         
         # Time display container
@@ -37,39 +50,30 @@ class HeaderComponent:
         
         # Store time label reference for updates
         self.time_label = tk.Label(time_container, 
-                             text="",
+                             textvariable=self._time_var,
                              bg=self.colors['bg_dark'], fg=self.colors['white'],
-                             font=('Courier', 10))
+                             font=courier(10))
         self.time_label.pack()
-        
-        # Start time updates
-        self.update_time_display()
     
     def update_time_display(self):
-        """Update time display with CET and US Eastern time"""
+        """Update time display with CET and US Eastern time (called by the TickScheduler)"""
         try:
-            # Get current time in CET
-            cet_tz = pytz.timezone('Europe/Paris')  # CET/CEST
-            cet_time = datetime.now(cet_tz)
-            
-            # Get current time in US Eastern
-            us_tz = pytz.timezone('America/New_York')  # EST/EDT
-            us_time = datetime.now(us_tz)
+            # Read the clock once and derive CET and US Eastern from it
+            now_utc = datetime.now(timezone.utc)
+            cet_time = now_utc.astimezone(CET_TZ)
+            us_time = now_utc.astimezone(US_TZ)
             
             # Format the display
             time_text = f"LIVE | CET: {cet_time.strftime('%Y-%m-%d %H:%M:%S')} | US: {us_time.strftime('%H:%M:%S %Z')}"
             
-            if self.time_label and self.time_label.winfo_exists():
-                self.time_label.config(text=time_text)
+            # Skip the Tcl round-trip when the text has not changed
+            if time_text != self._last_time_text:
+                self._time_var.set(time_text)
+                self._last_time_text = time_text
         except Exception as e:
             print(f"Error updating time display: {e}")
             # Fallback to simple display
-            if self.time_label and self.time_label.winfo_exists():
-                self.time_label.config(text=f"LIVE | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        # Schedule next update (every second)
-        if self.time_label and self.time_label.winfo_exists():
-            self.parent.after(1000, self.update_time_display)
+            self._time_var.set(f"LIVE | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 
 class BotStatusComponent:
@@ -91,7 +95,13 @@ class BotStatusComponent:
         self.bot_control_btn = None
         self.uptime_label = None
         self.positions_count_label = None
-        self.start_time = datetime.now()
+        # Label texts that change at runtime are bound through variables
+        self._bot_status_var = tk.StringVar(master=parent, value="● STOPPED")
+        self._uptime_var = tk.StringVar(master=parent, value="0h 0m 0s")
+        self._positions_var = tk.StringVar(master=parent, value="0/10")
+        self._running = False
+        self.start_time = time.monotonic()  # unaffected by wall-clock/DST changes
+        self._last_uptime = ""
         
     def create_bot_status(self):
         """Create the bot status display"""
@@ -99,82 +109,90 @@ class BotStatusComponent:
         status_container.pack(fill=tk.X, padx=10, pady=(0, 10))
         
         # Bot Status with START/STOP button
-        bot_frame = tk.Frame(status_container, bg=self.colors['bg_panel'], 
-                            relief=tk.SOLID, borderwidth=1)
-        bot_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
-        
-        tk.Label(bot_frame, text="BOT STATUS", bg=self.colors['bg_panel'], 
-                fg=self.colors['gray'], font=('Courier', 9)).pack(pady=(5, 2))
-        
-        self.bot_status_label = tk.Label(bot_frame, text="● STOPPED", 
-                                         bg=self.colors['bg_panel'], fg=self.colors['red'],
-                                         font=('Courier', 12, 'bold'))
-        self.bot_status_label.pack(pady=(0, 5))
+        self.bot_status_label = self._make_card(status_container, "BOT STATUS", self.colors['red'],
+                                                padx=(0, 5), compact=True,
+                                                textvariable=self._bot_status_var)
         
         # Start/Stop button
-        self.bot_control_btn = tk.Button(bot_frame, text="START BOT", 
+        self.bot_control_btn = tk.Button(self.bot_status_label.master, text="START BOT", 
                                          command=self.toggle_callback,
                                          bg=self.colors['green'], fg=self.colors['bg_dark'],
-                                         font=('Courier', 9, 'bold'),
+                                         font=courier(9, 'bold'),
                                          cursor="hand2", relief=tk.RAISED)
         self.bot_control_btn.pack(pady=(0, 10))
         
         # Strategy
-        strat_frame = tk.Frame(status_container, bg=self.colors['bg_panel'], 
-                              relief=tk.SOLID, borderwidth=1)
-        strat_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-        
-        tk.Label(strat_frame, text="STRATEGY", bg=self.colors['bg_panel'], 
-                fg=self.colors['gray'], font=('Courier', 9)).pack(pady=(10, 2))
-        tk.Label(strat_frame, text="MULTI-ALGO", bg=self.colors['bg_panel'], 
-                fg=self.colors['blue'], font=('Courier', 12, 'bold')).pack(pady=(0, 10))
+        self._make_card(status_container, "STRATEGY", self.colors['blue'], text="MULTI-ALGO")
         
         # Uptime
-        uptime_frame = tk.Frame(status_container, bg=self.colors['bg_panel'], 
-                               relief=tk.SOLID, borderwidth=1)
-        uptime_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-        
-        tk.Label(uptime_frame, text="UPTIME", bg=self.colors['bg_panel'], 
-                fg=self.colors['gray'], font=('Courier', 9)).pack(pady=(10, 2))
-        self.uptime_label = tk.Label(uptime_frame, text="0h 0m 0s", 
-                                     bg=self.colors['bg_panel'], fg=self.colors['white'],
-                                     font=('Courier', 12, 'bold'))
-        self.uptime_label.pack(pady=(0, 10))
+        self.uptime_label = self._make_card(status_container, "UPTIME", self.colors['white'],
+                                            textvariable=self._uptime_var)
         
         # Total Trades
-        trades_frame = tk.Frame(status_container, bg=self.colors['bg_panel'], 
-                               relief=tk.SOLID, borderwidth=1)
-        trades_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
-        
-        tk.Label(trades_frame, text="OPEN POSITIONS", bg=self.colors['bg_panel'], 
-                fg=self.colors['gray'], font=('Courier', 9)).pack(pady=(10, 2))
-        self.positions_count_label = tk.Label(trades_frame, text="0/10", 
-                                             bg=self.colors['bg_panel'], fg=self.colors['white'],
-                                             font=('Courier', 14, 'bold'))
-        self.positions_count_label.pack(pady=(0, 10))
+        self.positions_count_label = self._make_card(status_container, "OPEN POSITIONS", self.colors['white'],
+                                                     padx=(5, 0), value_size=14,
+                                                     textvariable=self._positions_var)
+    
+    def _make_card(self, parent, title, value_fg, padx=5, value_size=12, compact=False, **value_options):
+        """
+        Create one status card: a bordered frame with a title and a value label
+        
+        Args:
+            parent: Container the card is packed into (left to right)
+            title: Small gray heading
+            value_fg: Value text color
+            padx: Horizontal padding of the card
+            value_size: Value font size (bold)
+            compact: Use tighter vertical padding (for cards with a button below)
+            **value_options: text or textvariable for the value label
+        
+        Returns:
+            The value label (its master is the card frame)
+        """
+        bg = self.colors['bg_panel']
+        pad = 5 if compact else 10
+        
+        frame = tk.Frame(parent, bg=bg, relief=tk.SOLID, borderwidth=1)
+        frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=padx)
+        
+        tk.Label(frame, text=title, bg=bg, fg=self.colors['gray'],
+                 font=courier(9)).pack(pady=(pad, 2))
+        value_label = tk.Label(frame, bg=bg, fg=value_fg, font=courier(value_size, 'bold'),
+                               **value_options)
+        value_label.pack(pady=(0, pad))
+        return value_label
     
     def update_bot_status(self, running):
         """Update bot status display"""
+        # Colors only change on a state transition
+        if running == self._running:
+            return
+        self._running = running
+        
         if running:
-            self.bot_status_label.config(text="● RUNNING", fg=self.colors['green'])
+            self._bot_status_var.set("● RUNNING")
+            self.bot_status_label.config(fg=self.colors['green'])
             self.bot_control_btn.config(text="STOP BOT", bg=self.colors['red'])
         else:
-            self.bot_status_label.config(text="● STOPPED", fg=self.colors['red'])
+            self._bot_status_var.set("● STOPPED")
+            self.bot_status_label.config(fg=self.colors['red'])
             self.bot_control_btn.config(text="START BOT", bg=self.colors['green'])
     
     def update_uptime(self):
-        """Update uptime display"""
-        if self.uptime_label and self.uptime_label.winfo_exists():
-            uptime = datetime.now() - self.start_time
-            hours = int(uptime.total_seconds() // 3600)
-            minutes = int((uptime.total_seconds() % 3600) // 60)
-            seconds = int(uptime.total_seconds() % 60)
-            self.uptime_label.config(text=f"{hours}h {minutes}m {seconds}s")
+        """Update uptime display (called by the TickScheduler)"""
+        secs = int(time.monotonic() - self.start_time)
+        minutes, seconds = divmod(secs, 60)
+        hours, minutes = divmod(minutes, 60)
+        text = f"{hours}h {minutes}m {seconds}s"
+        
+        # Skip the Tcl round-trip when the text has not changed
+        if text != self._last_uptime:
+            self._uptime_var.set(text)
+            self._last_uptime = text
     
     def update_positions_count(self, count, max_count):
         """Update positions count display"""
-        if self.positions_count_label and self.positions_count_label.winfo_exists():
-            self.positions_count_label.config(text=f"{count}/{max_count}")
+        self._positions_var.set(f"{count}/{max_count}")
 
 
 class StatusBar:
@@ -193,6 +211,7 @@ class StatusBar:
         self.colors = colors
         self.api = api
         self.status_label = None
+        self._status_var = tk.StringVar(master=parent, value="● BOT STOPPED")
         self.bot_running = False
         
     def create_status_bar(self):
@@ -202,31 +221,26 @@ class StatusBar:
         status_frame.pack_propagate(False)
         
         # Bot status label (will be updated with real status)
-        self.status_label = tk.Label(status_frame, text="● BOT STOPPED", 
+        self.status_label = tk.Label(status_frame, textvariable=self._status_var, 
                                      bg=self.colors['green'], 
                                      fg=self.colors['bg_dark'], 
-                                     font=('Courier', 9, 'bold'))
+                                     font=courier(9, 'bold'))
         self.status_label.pack(side=tk.LEFT, padx=10)
         
         # Exchange link label
         exchange_label = tk.Label(status_frame, text="EXCHANGE: HYPERLIQUID", 
                                  bg=self.colors['green'], 
                                  fg=self.colors['bg_dark'], 
-                                 font=('Courier', 9, 'underline'),
+                                 font=courier(9, 'underline'),
                                  cursor="hand2")
         exchange_label.pack(side=tk.RIGHT, padx=10)
         exchange_label.bind("<Button-1>", lambda e: self._open_exchange_link())
     
     def _open_exchange_link(self):
         """Open Hyperliquid exchange with bonus link"""
-        import webbrowser
-        webbrowser.open("https://app.hyperliquid.xyz/join/BONUS500")
+        webbrowser.open(EXCHANGE_URL)
     
     def update_bot_status(self, running):
         """Update the bot status display with real status"""
-        if self.status_label and self.status_label.winfo_exists():
-            self.bot_running = running
-            if running:
-                self.status_label.config(text="● BOT RUNNING")
-            else:
-                self.status_label.config(text="● BOT STOPPED")
+        self.bot_running = running
+        self._status_var.set("● BOT RUNNING" if running else "● BOT STOPPED")
@@ -3,6 +3,8 @@ Navigation bar component for the trading panel
 """
 import tkinter as tk
 
+from panel_modules.fonts import courier
+
 
 class NavigationBar:
     """Handles the navigation bar and page switching"""
@@ -35,10 +37,18 @@ class NavigationBar:
             btn_fg = self.colors['bg_dark'] if i == 0 else self.colors['white']
             
             btn = tk.Label(nav_frame, text=item, bg=btn_bg, fg=btn_fg,
-                          font=('Courier', 10, 'bold'), padx=20, pady=10, cursor="hand2")
+                          font=courier(10, 'bold'), padx=20, pady=10, cursor="hand2")
             btn.pack(side=tk.LEFT, padx=5)
-            btn.bind("<Button-1>", lambda e, page=item.lower(): self.switch_page(page))
+            btn._page = item.lower()
+            btn.bindtags(('NavBtn',) + btn.bindtags())
             self.nav_buttons[item.lower()] = btn
+        
+        # One class binding serves every button; the page is read off the widget
+        nav_frame.bind_class('NavBtn', '<Button-1>', self._on_nav_click)
+    
+    def _on_nav_click(self, event):
+        """Switch to the page of the clicked nav button"""
+        self.switch_page(event.widget._page)
     
     def switch_page(self, page):
         """
@@ -47,14 +57,13 @@ class NavigationBar:
         Args:
             page: Page name to switch to
         """
-        self.current_page = page
+        if page == self.current_page:
+            return
         
-        # Update button colors
-        for nav_page, btn in self.nav_buttons.items():
-            if nav_page == page:
-                btn.config(bg=self.colors['green'], fg=self.colors['bg_dark'])
-            else:
-                btn.config(bg=self.colors['bg_panel'], fg=self.colors['white'])
+        # Only the old and new active buttons change color
+        self.nav_buttons[self.current_page].config(bg=self.colors['bg_panel'], fg=self.colors['white'])
+        self.nav_buttons[page].config(bg=self.colors['green'], fg=self.colors['bg_dark'])
+        self.current_page = page
         
         # Call the switch callback
         self.switch_callback(page)
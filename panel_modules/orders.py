@@ -2,8 +2,103 @@
 Orders Module - Handles order display and management
 """
 
+import threading
+import time
 import tkinter as tk
-from datetime import datetime
+from collections import deque, namedtuple
+from functools import lru_cache
+
+from panel_modules.fonts import courier
+
+
+# Activity columns: (width, anchor, bold) for time, action, coin, size, price, P&L
+_COLUMNS = (
+    (9, 'w', False),
+    (5, 'w', True),
+    (7, 'w', True),
+    (10, 'e', False),
+    (11, 'e', False),
+    (10, 'e', True),
+)
+
+# One API fill, normalized once: key identifies the trade, ts is Unix seconds
+Fill = namedtuple('Fill', 'key ts side coin sz px pnl')
+
+
+def _parse_fill(fill):
+    """
+    Normalize an API fill dict into a Fill
+    
+    Args:
+        fill: Fill dict from get_user_fills()
+    
+    Returns:
+        Fill with numeric fields cast to int/float
+    """
+    coin = fill.get('coin', 'N/A')
+    return Fill(
+        key=fill.get('tid') or (fill.get('time'), coin, fill.get('px')),
+        ts=int(fill.get('time', 0)) // 1000,
+        side=fill.get('side', 'N/A'),
+        coin=coin,
+        sz=abs(float(fill.get('sz', 0))),
+        px=float(fill.get('px', 0)),
+        pnl=float(fill.get('closedPnl', 0) or 0)
+    )
+
+
+@lru_cache(maxsize=256)
+def _clock_time(secs):
+    """Format Unix seconds as local HH:MM:SS (fills recur across refreshes)"""
+    tm = time.localtime(secs)
+    return f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+
+
+class ActivityRow:
+    """One reusable activity row: six labels in a grid row, updated in place"""
+    
+    def __init__(self, parent, bg):
+        # Labels sit directly in the shared grid container; no per-row frame
+        self.labels = [
+            tk.Label(parent, bg=bg, font=courier(8, 'bold') if bold else courier(8),
+                     width=width, anchor=anchor, padx=2)
+            for width, anchor, bold in _COLUMNS
+        ]
+        self._cells = [None] * len(_COLUMNS)
+        self.index = None  # grid row while shown, None while hidden
+    
+    def set(self, cells):
+        """
+        Update the row, reconfiguring only the cells that changed
+        
+        Args:
+            cells: Six (text, fg) tuples
+        """
+        for i, cell in enumerate(cells):
+            if cell != self._cells[i]:
+                self.labels[i].config(text=cell[0], fg=cell[1])
+                self._cells[i] = cell
+    
+    def place(self, index):
+        """
+        Grid the row at a row index (no-op if it is already there)
+        
+        Returns:
+            True if the row was gridded or moved
+        """
+        if index == self.index:
+            return False
+        for column, label in enumerate(self.labels):
+            label.grid(row=index, column=column, sticky='ew', pady=2)
+        self.index = index
+        return True
+    
+    def hide(self):
+        """Remove the row from the grid but keep its widgets for reuse"""
+        if self.index is not None:
+            for label in self.labels:
+                label.grid_remove()
+            self.index = None
 
 
 class OrdersManager:
@@ -12,8 +107,15 @@ class OrdersManager:
     def __init__(self, parent_frame, colors, api=None):
         self.parent = parent_frame
         self.colors = colors
-        self.orders = []
+        self.orders = deque(maxlen=20)  # newest first, keeps only last 20 orders
         self.api = api
+        self.activity_container = None
+        self._alive = False  # activity_container exists (cleared on <Destroy>)
+        self._rows = {}  # row key (trade id) -> pooled ActivityRow
+        self._free_rows = []  # hidden rows ready for reuse
+        self._inflight = False  # a fills fetch is running in the background
+        self._last_sig = None  # identity of the fills currently displayed
+        self._dirty = False  # a refresh was skipped while the panel was hidden
         
     def create_orders_display(self):
         """Create the recent activity/orders display panel"""
@@ -23,11 +125,19 @@ class OrdersManager:
         
         tk.Label(activity_frame, text="═══ RECENT ACTIVITY ═══", 
                 bg=self.colors['bg_panel'], fg=self.colors['white'],
-                font=('Courier', 11, 'bold')).pack(pady=10)
+                font=courier(11, 'bold')).pack(pady=10)
         
-        # Container for activity rows
+        # Container for activity rows: one grid, a row per trade
         self.activity_container = tk.Frame(activity_frame, bg=self.colors['bg_panel'])
         self.activity_container.pack(fill=tk.BOTH, expand=True, padx=10)
+        for column in range(len(_COLUMNS)):
+            self.activity_container.columnconfigure(column, weight=1)
+        self.activity_container.bind('<Map>', self._on_map)
+        self.activity_container.bind('<Destroy>', self._on_destroy)
+        self._alive = True
+        self._rows = {}  # pooled ActivityRow widgets in this container
+        self._free_rows = []
+        self._last_sig = None
         
         return activity_frame
     
@@ -40,130 +150,187 @@ class OrdersManager:
             'details': details,
             'color': self.colors['green'] if action == "BUY" else self.colors['red']
         }
-        self.orders.insert(0, order)  # Add to beginning
-        
-        # Keep only last 20 orders
-        if len(self.orders) > 20:
-            self.orders = self.orders[:20]
+        self.orders.appendleft(order)  # Add to beginning, dropping the oldest
         
         self.update_display()
     
     def update_display(self):
-        """Update the orders display with last 10 trades from API"""
-        # Clear existing
-        for widget in self.activity_container.winfo_children():
-            widget.destroy()
+        """
+        Refresh the orders display with the last 10 trades from the API
+        
+        The fetch runs in a background thread so the window stays responsive
+        during the HTTP round-trip; the rows are rendered on the Tk thread
+        once it returns. Calls made while a fetch is in flight are ignored,
+        and calls made while the panel is hidden are deferred until it is
+        shown again.
+        """
+        if not self._is_visible():
+            self._dirty = True
+            return
+        self._dirty = False
         
-        # Try to get real trades from API
-        if self.api and hasattr(self.api, 'get_user_fills'):
+        if not (self.api and hasattr(self.api, 'get_user_fills')):
+            # Fallback to demo data if API not available
+            self._show_demo_orders()
+            return
+        
+        if self._inflight:
+            return
+        self._inflight = True
+        
+        thread = threading.Thread(target=self._fetch_fills, daemon=True)
+        thread.start()
+    
+    def _is_visible(self):
+        """Check whether the activity panel is currently on screen"""
+        return self._alive and bool(self.activity_container.winfo_viewable())
+    
+    def _on_destroy(self, event):
+        """Note that the container is gone (its page was switched away)"""
+        if event.widget is self.activity_container:
+            self._alive = False
+    
+    def _on_map(self, event):
+        """Run a refresh that was skipped while the panel was hidden"""
+        if self._dirty:
+            self.activity_container.after_idle(self.update_display)
+    
+    def _fetch_fills(self):
+        """Fetch and parse recent fills (runs in a background thread)"""
+        try:
+            fills = self.api.get_user_fills(limit=10)  # Get last 10 trades
+            fills = [_parse_fill(fill) for fill in fills] if fills else None
+        except Exception as e:
+            print(f"Error fetching recent trades: {e}")
+            fills = None
+        
+        # Tk widgets may only be touched from the Tk thread
+        try:
+            self.activity_container.after_idle(self._apply_fills, fills)
+        except (RuntimeError, tk.TclError):
+            self._inflight = False  # window closed while fetching
+    
+    def _apply_fills(self, fills):
+        """
+        Render fetched fills (runs on the Tk thread)
+        
+        Args:
+            fills: Parsed Fill tuples, or None to show demo data
+        """
+        self._inflight = False
+        
+        # The page may have been switched away while fetching
+        if not self._is_visible():
+            self._dirty = True
+            return
+        
+        if fills:
+            # Same trades as last time: nothing to redraw
+            sig = tuple(fills)
+            if sig == self._last_sig:
+                return
+            
+            c = self.colors
+            white, gray, green, red = c['white'], c['gray'], c['green'], c['red']
             try:
-                fills = self.api.get_user_fills(limit=10)  # Get last 10 trades
+                rows = []
+                for fill in fills:
+                    # Action (Buy/Sell)
+                    action = "BUY" if fill.side == 'B' else "SELL"
+                    color = green if fill.side == 'B' else red
+                    
+                    # P&L (if closed position, else empty for alignment)
+                    pnl = fill.pnl
+                    if pnl != 0:
+                        pnl_color = green if pnl > 0 else red
+                        pnl_text = f"+${pnl:.2f}" if pnl > 0 else f"${pnl:.2f}"
+                    else:
+                        pnl_text, pnl_color = "", white
+                    
+                    rows.append((fill.key, (
+                        (_clock_time(fill.ts), gray),
+                        (action, color),
+                        (fill.coin, white),
+                        (f"{fill.sz:.4f}", white),
+                        (f"@{fill.px:,.2f}", white),
+                        (pnl_text, pnl_color)
+                    )))
                 
-                if fills:
-                    for fill in fills:
-                        activity_row = tk.Frame(self.activity_container, bg=self.colors['bg_dark'])
-                        activity_row.pack(fill=tk.X, pady=2)
-                        
-                        # Time
-                        timestamp = int(fill.get('time', 0)) / 1000
-                        time_str = datetime.fromtimestamp(timestamp).strftime('%H:%M:%S')
-                        tk.Label(activity_row, text=time_str, bg=self.colors['bg_dark'], 
-                                fg=self.colors['gray'], font=('Courier', 8), 
-                                width=9, anchor='w').pack(side=tk.LEFT, padx=2)
-                        
-                        # Action (Buy/Sell)
-                        side = fill.get('side', 'N/A')
-                        action = "BUY" if side == 'B' else "SELL"
-                        color = self.colors['green'] if side == 'B' else self.colors['red']
-                        tk.Label(activity_row, text=action, bg=self.colors['bg_dark'], 
-                                fg=color, font=('Courier', 8, 'bold'), 
-                                width=5, anchor='w').pack(side=tk.LEFT, padx=2)
-                        
-                        # Coin
-                        coin = fill.get('coin', 'N/A')
-                        tk.Label(activity_row, text=coin, bg=self.colors['bg_dark'], 
-                                fg=self.colors['white'], font=('Courier', 8, 'bold'), 
-                                width=7, anchor='w').pack(side=tk.LEFT, padx=2)
-                        
-                        # Size
-                        size = abs(float(fill.get('sz', 0)))
-                        tk.Label(activity_row, text=f"{size:.4f}", bg=self.colors['bg_dark'], 
-                                fg=self.colors['white'], font=('Courier', 8), 
-                                width=10, anchor='e').pack(side=tk.LEFT, padx=2)
-                        
-                        # Price
-                        price = float(fill.get('px', 0))
-                        tk.Label(activity_row, text=f"@{price:,.2f}", bg=self.colors['bg_dark'], 
-                                fg=self.colors['white'], font=('Courier', 8), 
-                                width=11, anchor='e').pack(side=tk.LEFT, padx=2)
-                        
-                        # P&L (if closed position)
-                        closed_pnl = float(fill.get('closedPnl', 0) or 0)
-                        if closed_pnl != 0:
-                            pnl_color = self.colors['green'] if closed_pnl > 0 else self.colors['red']
-                            pnl_text = f"+${closed_pnl:.2f}" if closed_pnl > 0 else f"${closed_pnl:.2f}"
-                            tk.Label(activity_row, text=pnl_text, bg=self.colors['bg_dark'], 
-                                    fg=pnl_color, font=('Courier', 8, 'bold'), 
-                                    width=10, anchor='e').pack(side=tk.LEFT, padx=2)
-                        else:
-                            # Empty space for alignment
-                            tk.Label(activity_row, text="", bg=self.colors['bg_dark'], 
-                                    width=10).pack(side=tk.LEFT, padx=2)
-                    return
+                self._render_rows(rows)
+                self._last_sig = sig
+                return
             except Exception as e:
-                print(f"Error fetching recent trades: {e}")
+                print(f"Error displaying recent trades: {e}")
         
-        # Fallback to demo data if API not available or no trades
+        # Fallback to demo data if the fetch failed or there are no trades
         self._show_demo_orders()
     
+    def _render_rows(self, rows):
+        """
+        Show keyed rows of (text, fg) cells, reusing pooled row widgets
+        
+        Rows are matched by key (like Treeview item ids), so when a new trade
+        arrives only its row is filled in; the rows that shift down keep
+        their contents and are only moved to their new grid row.
+        
+        Args:
+            rows: (key, cells) pairs, top to bottom; cells are six (text, fg)
+        """
+        keys = {key for key, _ in rows}
+        moved = False
+        
+        # Rows whose trade scrolled off are hidden and recycled
+        free = self._free_rows
+        for key in [k for k in self._rows if k not in keys]:
+            row = self._rows.pop(key)
+            row.hide()
+            free.append(row)
+            moved = True
+        
+        for i, (key, cells) in enumerate(rows):
+            row = self._rows.get(key)
+            if row is None:
+                row = free.pop() if free else ActivityRow(self.activity_container, self.colors['bg_dark'])
+                self._rows[key] = row
+            row.set(cells)
+            moved = row.place(i) or moved
+        
+        # Settle the batch's grid changes in one layout pass
+        if moved:
+            self.activity_container.update_idletasks()
+    
     def _show_demo_orders(self):
         """Show demo orders with enhanced details"""
+        c = self.colors
+        white, gray, green, red = c['white'], c['gray'], c['green'], c['red']
         demo_orders = [
-            ("14:32:15", "BUY", "BTC", "0.0250", "43,240.00", "+12.50", self.colors['green']),
-            ("14:28:42", "SELL", "ETH", "1.5000", "2,287.00", "-5.20", self.colors['red']),
-            ("14:25:11", "BUY", "XRP", "500.0000", "0.6234", "+8.75", self.colors['green']),
-            ("14:19:33", "SELL", "SOL", "5.0000", "98.50", "+15.30", self.colors['green']),
-            ("14:15:20", "BUY", "BNB", "2.5000", "312.00", "", self.colors['green']),
-            ("14:12:08", "SELL", "BTC", "0.0180", "43,180.00", "-3.40", self.colors['red']),
-            ("14:08:45", "BUY", "ETH", "2.0000", "2,275.00", "+22.10", self.colors['green']),
-            ("14:05:22", "SELL", "XRP", "800.0000", "0.6198", "+6.85", self.colors['green'])
+            ("14:32:15", "BUY", "BTC", "0.0250", "43,240.00", "+12.50", green),
+            ("14:28:42", "SELL", "ETH", "1.5000", "2,287.00", "-5.20", red),
+            ("14:25:11", "BUY", "XRP", "500.0000", "0.6234", "+8.75", green),
+            ("14:19:33", "SELL", "SOL", "5.0000", "98.50", "+15.30", green),
+            ("14:15:20", "BUY", "BNB", "2.5000", "312.00", "", green),
+            ("14:12:08", "SELL", "BTC", "0.0180", "43,180.00", "-3.40", red),
+            ("14:08:45", "BUY", "ETH", "2.0000", "2,275.00", "+22.10", green),
+            ("14:05:22", "SELL", "XRP", "800.0000", "0.6198", "+6.85", green)
         ]
         
+        rows = []
         for time, action, coin, size, price, pnl, color in demo_orders:
-            activity_row = tk.Frame(self.activity_container, bg=self.colors['bg_dark'])
-            activity_row.pack(fill=tk.X, pady=2)
-            
-            # Time
-            tk.Label(activity_row, text=time, bg=self.colors['bg_dark'], 
-                    fg=self.colors['gray'], font=('Courier', 8), 
-                    width=9, anchor='w').pack(side=tk.LEFT, padx=2)
-            
-            # Action
-            tk.Label(activity_row, text=action, bg=self.colors['bg_dark'], 
-                    fg=color, font=('Courier', 8, 'bold'), 
-                    width=5, anchor='w').pack(side=tk.LEFT, padx=2)
-            
-            # Coin
-            tk.Label(activity_row, text=coin, bg=self.colors['bg_dark'], 
-                    fg=self.colors['white'], font=('Courier', 8, 'bold'), 
-                    width=7, anchor='w').pack(side=tk.LEFT, padx=2)
-            
-            # Size
-            tk.Label(activity_row, text=size, bg=self.colors['bg_dark'], 
-                    fg=self.colors['white'], font=('Courier', 8), 
-                    width=10, anchor='e').pack(side=tk.LEFT, padx=2)
-            
-            # Price
-            tk.Label(activity_row, text=f"@{price}", bg=self.colors['bg_dark'], 
-                    fg=self.colors['white'], font=('Courier', 8), 
-                    width=11, anchor='e').pack(side=tk.LEFT, padx=2)
-            
             # P&L
             if pnl:
-                pnl_color = self.colors['green'] if pnl.startswith('+') else self.colors['red']
-                tk.Label(activity_row, text=f"${pnl}", bg=self.colors['bg_dark'], 
-                        fg=pnl_color, font=('Courier', 8, 'bold'), 
-                        width=10, anchor='e').pack(side=tk.LEFT, padx=2)
+                pnl_color = green if pnl.startswith('+') else red
+                pnl_cell = (f"${pnl}", pnl_color)
             else:
-                tk.Label(activity_row, text="", bg=self.colors['bg_dark'], 
-                        width=10).pack(side=tk.LEFT, padx=2)
+                pnl_cell = ("", white)
+            
+            rows.append(((time, coin), (
+                (time, gray),
+                (action, color),
+                (coin, white),
+                (size, white),
+                (f"@{price}", white),
+                pnl_cell
+            )))
+        
+        self._render_rows(rows)
+        self._last_sig = None  # demo rows replaced any fills
@@ -5,7 +5,37 @@ import tkinter as tk
 from tkinter import messagebox
 import json
 import os
+import re
 import webbrowser
+from functools import lru_cache, partial
+
+from panel_modules.fonts import courier
+
+# Hex credentials: a 20-byte wallet address and a 32-byte private key
+_ADDR_RE = re.compile(r'^0x[0-9a-fA-F]{40}$')
+_KEY_RE = re.compile(r'^0x[0-9a-fA-F]{64}$')
+
+# Config fields this page shows and edits (the only ones it caches)
+_CONFIG_FIELDS = ('account_address', 'secret_key')
+
+# Setup instructions as (text, color key) rows
+_INSTRUCTIONS = (
+    ("1. Create your Hyperliquid trading account using the link below", 'gray'),
+    ("2. Set up your API credentials (wallet address + secret key)", 'gray'),
+    ("3. Enter your credentials below and click 'Save Changes'", 'gray'),
+    ("4. Your credentials are stored locally in config/api_config.json", 'gray'),
+    ("", 'gray'),
+    ("⚠️  SECURITY NOTICE:", 'yellow'),
+    ("• Never share your secret key with anyone", 'gray'),
+    ("• Keep your config file secure and backed up", 'gray'),
+    ("• Use the referral code BONUS500 for 4% discount", 'gray'),
+)
+
+
+@lru_cache(maxsize=None)
+def _default_browser():
+    """Resolve the default browser controller once per process"""
+    return webbrowser.get()
 
 
 class APISettingsPage:
@@ -23,27 +53,40 @@ class APISettingsPage:
         self.colors = colors
         self.config_file = "config/api_config.json"
         
-        # Entry widgets for editing
+        # Credential fields of the config, reused while the file's mtime is unchanged
+        self._config_cache = None
+        self._config_mtime = None
+        
+        # Entry widgets for editing and the variables bound to them
         self.account_entry = None
         self.key_entry = None
+        self._account_var = None
+        self._key_var = None
+        
+        # Values shown before entering edit mode, restored on cancel
+        self._orig_account = ""
+        self._orig_key = ""
         
         # Edit mode tracking
         self.edit_mode = False
         
     def create_page(self):
         """Create the API settings page"""
+        c = self.colors
+        bg_dark, bg_panel, white = c['bg_dark'], c['bg_panel'], c['white']
+        
         # Main container
-        main_frame = tk.Frame(self.parent, bg=self.colors['bg_dark'])
+        main_frame = tk.Frame(self.parent, bg=bg_dark)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Title
-        title_frame = tk.Frame(main_frame, bg=self.colors['bg_panel'], relief=tk.SOLID, borderwidth=1)
+        title_frame = tk.Frame(main_frame, bg=bg_panel, relief=tk.SOLID, borderwidth=1)
         title_frame.pack(fill=tk.X, pady=(0, 10))
-        tk.Label(title_frame, text="═══ API SETTINGS ═══", bg=self.colors['bg_panel'], 
-                fg=self.colors['white'], font=('Courier', 14, 'bold')).pack(pady=15)
+        tk.Label(title_frame, text="═══ API SETTINGS ═══", bg=bg_panel, 
+                fg=white, font=courier(14, 'bold')).pack(pady=15)
         
         # Grid container - 2 columns layout
-        grid_container = tk.Frame(main_frame, bg=self.colors['bg_dark'])
+        grid_container = tk.Frame(main_frame, bg=bg_dark)
         grid_container.pack(fill=tk.BOTH, expand=True, padx=10)
         
         # Configure grid weights for responsive layout
@@ -53,54 +96,74 @@ class APISettingsPage:
         grid_container.grid_rowconfigure(1, weight=1)
         
         # Left column - top: Info section
-        info_container = tk.Frame(grid_container, bg=self.colors['bg_dark'])
+        info_container = tk.Frame(grid_container, bg=bg_dark)
         info_container.grid(row=0, column=0, sticky='nsew', padx=(0, 5), pady=(0, 5))
-        self._create_info_section(info_container)
+        self._build_when_mapped(info_container, self._create_info_section)
         
         # Right column - top: Credentials section
-        creds_container = tk.Frame(grid_container, bg=self.colors['bg_dark'])
+        creds_container = tk.Frame(grid_container, bg=bg_dark)
         creds_container.grid(row=0, column=1, sticky='nsew', padx=(5, 0), pady=(0, 5))
         self._create_credentials_section(creds_container)
         
         # Bottom row - spanning both columns: External Links section
-        links_container = tk.Frame(grid_container, bg=self.colors['bg_dark'])
+        links_container = tk.Frame(grid_container, bg=bg_dark)
         links_container.grid(row=1, column=0, columnspan=2, sticky='nsew', pady=(5, 0))
-        self._create_external_links_section(links_container)
+        self._build_when_mapped(links_container, self._create_external_links_section)
+    
+    def _build_when_mapped(self, container, builder):
+        """
+        Defer building a static section until its container is first shown
+        
+        The credentials panel is built right away; the static info and link
+        sections fill in on the container's first <Map>, so the page switch
+        itself only pays for the widgets the user interacts with.
+        
+        Args:
+            container: Empty frame that will hold the section
+            builder: Section creator taking the container as parent
+        """
+        def build(event):
+            if event.widget is container:
+                container.unbind('<Map>', funcid)
+                builder(container)
+        
+        funcid = container.bind('<Map>', build)
     
     def _create_info_section(self, parent):
         """Create information section"""
-        info_frame = tk.Frame(parent, bg=self.colors['bg_panel'], relief=tk.SOLID, borderwidth=1)
+        c = self.colors
+        bg_panel, blue, gray = c['bg_panel'], c['blue'], c['gray']
+        
+        info_frame = tk.Frame(parent, bg=bg_panel, relief=tk.SOLID, borderwidth=1)
         info_frame.pack(fill=tk.BOTH, expand=True)
         
-        tk.Label(info_frame, text="ℹ️  SETUP INSTRUCTIONS", bg=self.colors['bg_panel'], 
-                fg=self.colors['blue'], font=('Courier', 11, 'bold')).pack(pady=(15, 10), anchor='w', padx=15)
-        
-        instructions = [
-            "1. Create your Hyperliquid trading account using the link below",
-            "2. Set up your API credentials (wallet address + secret key)",
-            "3. Enter your credentials below and click 'Save Changes'",
-            "4. Your credentials are stored locally in config/api_config.json",
-            "",
-            "⚠️  SECURITY NOTICE:",
-            "• Never share your secret key with anyone",
-            "• Keep your config file secure and backed up",
-            "• Use the referral code BONUS500 for 4% discount"
-        ]
-        
-        for instruction in instructions:
-            color = self.colors['yellow'] if instruction.startswith('⚠️') else self.colors['gray']
-            tk.Label(info_frame, text=instruction, bg=self.colors['bg_panel'], 
-                    fg=color, font=('Courier', 9), anchor='w').pack(pady=2, padx=20, anchor='w')
-        
-        tk.Label(info_frame, text="", bg=self.colors['bg_panel']).pack(pady=5)
+        tk.Label(info_frame, text="ℹ️  SETUP INSTRUCTIONS", bg=bg_panel, 
+                fg=blue, font=courier(11, 'bold')).pack(pady=(15, 10), anchor='w', padx=15)
+        
+        # One read-only Text widget for all lines, colored through tags
+        instructions = tk.Text(info_frame, bg=bg_panel, fg=gray,
+                               font=courier(9), height=len(_INSTRUCTIONS),
+                               width=max(len(text) for text, _ in _INSTRUCTIONS),
+                               wrap=tk.WORD, spacing1=2, spacing3=2, cursor='arrow',
+                               borderwidth=0, highlightthickness=0)
+        for color_key in {color_key for _, color_key in _INSTRUCTIONS}:
+            instructions.tag_configure(color_key, foreground=self.colors[color_key])
+        for instruction, color_key in _INSTRUCTIONS:
+            instructions.insert(tk.END, instruction + "\n", color_key)
+        instructions.config(state=tk.DISABLED)
+        instructions.pack(padx=20, pady=(0, 20), anchor='w')
     
     def _create_credentials_section(self, parent):
         """Create credentials management section"""
-        creds_frame = tk.Frame(parent, bg=self.colors['bg_panel'], relief=tk.SOLID, borderwidth=1)
+        c = self.colors
+        bg_dark, bg_panel, white, gray = c['bg_dark'], c['bg_panel'], c['white'], c['gray']
+        green, blue = c['green'], c['blue']
+        
+        creds_frame = tk.Frame(parent, bg=bg_panel, relief=tk.SOLID, borderwidth=1)
         creds_frame.pack(fill=tk.BOTH, expand=True)
         
-        tk.Label(creds_frame, text="🔐 API CREDENTIALS", bg=self.colors['bg_panel'], 
-                fg=self.colors['green'], font=('Courier', 11, 'bold')).pack(pady=(15, 10), anchor='w', padx=15)
+        tk.Label(creds_frame, text="🔐 API CREDENTIALS", bg=bg_panel, 
+                fg=green, font=courier(11, 'bold')).pack(pady=(15, 10), anchor='w', padx=15)
         
         # Load current credentials
         config = self._load_config()
@@ -108,121 +171,179 @@ class APISettingsPage:
         secret_key = config.get('secret_key', '')
         
         # Account Address
-        account_frame = tk.Frame(creds_frame, bg=self.colors['bg_panel'])
-        account_frame.pack(fill=tk.X, padx=20, pady=5)
-        
-        tk.Label(account_frame, text="Account Address:", bg=self.colors['bg_panel'], 
-                fg=self.colors['white'], font=('Courier', 10, 'bold'), width=20, anchor='w').pack(side=tk.LEFT, padx=(0, 10))
-        
-        self.account_entry = tk.Entry(account_frame, bg=self.colors['bg_dark'], fg=self.colors['white'],
-                                      font=('Courier', 10), insertbackground=self.colors['white'],
-                                      relief=tk.SOLID, borderwidth=1)
-        self.account_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.account_entry.insert(0, account if account else "0x...")
-        self.account_entry.config(state='readonly')
+        self._account_var = tk.StringVar(value=account if account else "0x...")
+        self.account_entry = self._make_cred_row(creds_frame, "Account Address:", self._account_var)
         
         # Secret Key (masked)
-        key_frame = tk.Frame(creds_frame, bg=self.colors['bg_panel'])
-        key_frame.pack(fill=tk.X, padx=20, pady=5)
-        
-        tk.Label(key_frame, text="Secret Key:", bg=self.colors['bg_panel'], 
-                fg=self.colors['white'], font=('Courier', 10, 'bold'), width=20, anchor='w').pack(side=tk.LEFT, padx=(0, 10))
-        
-        self.key_entry = tk.Entry(key_frame, bg=self.colors['bg_dark'], fg=self.colors['white'],
-                                  font=('Courier', 10), insertbackground=self.colors['white'],
-                                  relief=tk.SOLID, borderwidth=1, show='*')
-        self.key_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.key_entry.insert(0, secret_key if secret_key else "0x...")
-        self.key_entry.config(state='readonly')
+        self._key_var = tk.StringVar(value=secret_key if secret_key else "0x...")
+        self.key_entry = self._make_cred_row(creds_frame, "Secret Key:", self._key_var, show='*')
         
         # Buttons frame
-        buttons_frame = tk.Frame(creds_frame, bg=self.colors['bg_panel'])
+        buttons_frame = tk.Frame(creds_frame, bg=bg_panel)
         buttons_frame.pack(fill=tk.X, padx=20, pady=15)
         
         # Edit/Cancel button
         self.edit_btn = tk.Button(buttons_frame, text="✏️  EDIT CREDENTIALS", 
-                                  bg=self.colors['blue'], fg=self.colors['bg_dark'],
-                                  font=('Courier', 10, 'bold'), cursor="hand2",
+                                  bg=blue, fg=bg_dark,
+                                  font=courier(10, 'bold'), cursor="hand2",
                                   relief=tk.RAISED, borderwidth=2, padx=20, pady=8,
                                   command=self._toggle_edit_mode)
         self.edit_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         # Save button (initially hidden)
         self.save_btn = tk.Button(buttons_frame, text="💾 SAVE CHANGES", 
-                                  bg=self.colors['green'], fg=self.colors['bg_dark'],
-                                  font=('Courier', 10, 'bold'), cursor="hand2",
+                                  bg=green, fg=bg_dark,
+                                  font=courier(10, 'bold'), cursor="hand2",
                                   relief=tk.RAISED, borderwidth=2, padx=20, pady=8,
                                   command=self._save_credentials)
         # Don't pack initially
         
         # Status label
-        self.status_label = tk.Label(creds_frame, text="", bg=self.colors['bg_panel'], 
-                                    fg=self.colors['gray'], font=('Courier', 9))
+        self.status_label = tk.Label(creds_frame, text="", bg=bg_panel, 
+                                    fg=gray, font=courier(9))
         self.status_label.pack(pady=(0, 10))
     
+    def _make_cred_row(self, parent, label, var, show=''):
+        """
+        Create one labelled, read-only credential entry row
+        
+        Args:
+            parent: Credentials frame
+            label: Field caption
+            var: StringVar bound to the entry
+            show: Mask character ('' shows the text)
+        
+        Returns:
+            The Entry widget
+        """
+        c = self.colors
+        bg_panel, white = c['bg_panel'], c['white']
+        
+        row = tk.Frame(parent, bg=bg_panel)
+        row.pack(fill=tk.X, padx=20, pady=5)
+        row.columnconfigure(1, weight=1)
+        
+        tk.Label(row, text=label, bg=bg_panel, fg=white, font=courier(10, 'bold'),
+                 width=20, anchor='w').grid(row=0, column=0, sticky='w', padx=(0, 10))
+        entry = tk.Entry(row, textvariable=var, bg=c['bg_dark'], fg=white,
+                         font=courier(10), insertbackground=white,
+                         relief=tk.SOLID, borderwidth=1, show=show, state='readonly')
+        entry.grid(row=0, column=1, sticky='ew')
+        return entry
+    
     def _create_external_links_section(self, parent):
         """Create external links section"""
-        links_frame = tk.Frame(parent, bg=self.colors['bg_panel'], relief=tk.SOLID, borderwidth=1)
+        c = self.colors
+        bg_dark, bg_panel, white, gray = c['bg_dark'], c['bg_panel'], c['white'], c['gray']
+        green, blue, yellow = c['green'], c['blue'], c['yellow']
+        
+        links_frame = tk.Frame(parent, bg=bg_panel, relief=tk.SOLID, borderwidth=1)
         links_frame.pack(fill=tk.BOTH, expand=True)
         
-        tk.Label(links_frame, text="🔗 QUICK LINKS", bg=self.colors['bg_panel'], 
-                fg=self.colors['yellow'], font=('Courier', 11, 'bold')).pack(pady=(15, 10), anchor='w', padx=15)
+        tk.Label(links_frame, text="🔗 QUICK LINKS", bg=bg_panel, 
+                fg=yellow, font=courier(11, 'bold')).pack(pady=(15, 10), anchor='w', padx=15)
         
         # Link 1: Create Account
-        link1_frame = tk.Frame(links_frame, bg=self.colors['bg_dark'], relief=tk.SOLID, borderwidth=1)
+        link1_frame = tk.Frame(links_frame, bg=bg_dark, relief=tk.SOLID, borderwidth=1)
         link1_frame.pack(fill=tk.X, padx=20, pady=5)
         
         tk.Label(link1_frame, text="📝 Create Your Free Trading Account", 
-                bg=self.colors['bg_dark'], fg=self.colors['white'], 
-                font=('Courier', 10, 'bold')).pack(pady=(10, 5), padx=10, anchor='w')
+                bg=bg_dark, fg=white, 
+                font=courier(10, 'bold')).pack(pady=(10, 5), padx=10, anchor='w')
         
         tk.Label(link1_frame, text="Use referral code: BONUS500 for 4% discount", 
-                bg=self.colors['bg_dark'], fg=self.colors['green'], 
-                font=('Courier', 9)).pack(pady=(0, 5), padx=10, anchor='w')
+                bg=bg_dark, fg=green, 
+                font=courier(9)).pack(pady=(0, 5), padx=10, anchor='w')
         
         link1_btn = tk.Button(link1_frame, text="🌐 Open Hyperliquid Registration", 
-                             bg=self.colors['green'], fg=self.colors['bg_dark'],
-                             font=('Courier', 9, 'bold'), cursor="hand2",
+                             bg=green, fg=bg_dark,
+                             font=courier(9, 'bold'), cursor="hand2",
                              relief=tk.RAISED, borderwidth=2, padx=15, pady=5,
-                             command=lambda: self._open_url("https://app.hyperliquid.xyz/join/BONUS500"))
+                             command=partial(self._open_url, "https://app.hyperliquid.xyz/join/BONUS500"))
         link1_btn.pack(pady=(0, 10), padx=10, anchor='w')
         
         # Link 2: Create API
-        link2_frame = tk.Frame(links_frame, bg=self.colors['bg_dark'], relief=tk.SOLID, borderwidth=1)
-        link2_frame.pack(fill=tk.X, padx=20, pady=5)
+        link2_frame = tk.Frame(links_frame, bg=bg_dark, relief=tk.SOLID, borderwidth=1)
+        link2_frame.pack(fill=tk.X, padx=20, pady=(5, 20))
         
         tk.Label(link2_frame, text="🔑 Create Your Trading Bot Wallet / API Credentials", 
-                bg=self.colors['bg_dark'], fg=self.colors['white'], 
-                font=('Courier', 10, 'bold')).pack(pady=(10, 5), padx=10, anchor='w')
+                bg=bg_dark, fg=white, 
+                font=courier(10, 'bold')).pack(pady=(10, 5), padx=10, anchor='w')
         
         tk.Label(link2_frame, text="Generate your API wallet and secret key", 
-                bg=self.colors['bg_dark'], fg=self.colors['gray'], 
-                font=('Courier', 9)).pack(pady=(0, 5), padx=10, anchor='w')
+                bg=bg_dark, fg=gray, 
+                font=courier(9)).pack(pady=(0, 5), padx=10, anchor='w')
         
         link2_btn = tk.Button(link2_frame, text="🌐 Open API Management", 
-                             bg=self.colors['blue'], fg=self.colors['bg_dark'],
-                             font=('Courier', 9, 'bold'), cursor="hand2",
+                             bg=blue, fg=bg_dark,
+                             font=courier(9, 'bold'), cursor="hand2",
                              relief=tk.RAISED, borderwidth=2, padx=15, pady=5,
-                             command=lambda: self._open_url("https://app.hyperliquid.xyz/API"))
+                             command=partial(self._open_url, "https://app.hyperliquid.xyz/API"))
         link2_btn.pack(pady=(0, 10), padx=10, anchor='w')
-        
-        tk.Label(links_frame, text="", bg=self.colors['bg_panel']).pack(pady=5)
     
     def _load_config(self):
-        """Load configuration from file"""
+        """
+        Load the credential fields from the config file
+        
+        Only the fields in _CONFIG_FIELDS are kept (cached until the file
+        changes), so a large config is not held in memory by the page.
+        
+        Returns:
+            Dictionary with every _CONFIG_FIELDS key ('' if missing)
+        """
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+            mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            mtime = None  # no config file yet
+        
+        if self._config_cache is not None and mtime == self._config_mtime:
+            return self._config_cache.copy()
+        
+        config = self._read_config() if mtime is not None else {}
+        if config is None:
+            return {key: '' for key in _CONFIG_FIELDS}
+        
+        self._config_cache = {key: config.get(key, '') for key in _CONFIG_FIELDS}
+        self._config_mtime = mtime
+        return self._config_cache.copy()
+    
+    def _read_config(self):
+        """Read the full configuration file (None if it cannot be parsed)"""
+        try:
+            with open(self.config_file, 'r') as f:
+                return json.load(f)
         except Exception as e:
             print(f"Error loading config: {e}")
-        return {}
+            return None
     
     def _save_config(self, config):
-        """Save configuration to file"""
+        """
+        Save configuration to file
+        
+        The config is not rewritten when its credential fields match the
+        file. Otherwise the JSON goes to a temporary file that replaces the
+        config in one step, so a crash mid-write never leaves a truncated
+        config behind.
+        
+        Args:
+            config: Full configuration dictionary
+        """
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
+            fields = {key: config.get(key, '') for key in _CONFIG_FIELDS}
+            if fields == self._load_config():
+                return True
+            
+            text = json.dumps(config, indent=4)
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            
+            # What was just written is the new cached config
+            self._config_cache = fields
+            self._config_mtime = os.stat(self.config_file).st_mtime_ns
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -230,56 +351,53 @@ class APISettingsPage:
     
     def _toggle_edit_mode(self):
         """Toggle between view and edit mode"""
+        c = self.colors
+        red, yellow, blue, gray = c['red'], c['yellow'], c['blue'], c['gray']
+        
         if not self.edit_mode:
-            # Enter edit mode
+            # Enter edit mode, remembering the values to restore on cancel
             self.edit_mode = True
+            self._orig_account = self._account_var.get()
+            self._orig_key = self._key_var.get()
             self.account_entry.config(state='normal')
             self.key_entry.config(state='normal', show='')
-            self.edit_btn.config(text="❌ CANCEL", bg=self.colors['red'])
+            self.edit_btn.config(text="❌ CANCEL", bg=red)
             self.save_btn.pack(side=tk.LEFT, padx=(0, 10))
             self.status_label.config(text="✏️  Edit mode enabled - modify credentials and click Save", 
-                                   fg=self.colors['yellow'])
+                                   fg=yellow)
         else:
             # Exit edit mode (cancel)
             self.edit_mode = False
             
-            # Reload original values
-            config = self._load_config()
-            account = config.get('account_address', '')
-            secret_key = config.get('secret_key', '')
-            
-            self.account_entry.config(state='normal')
-            self.key_entry.config(state='normal', show='*')
-            
-            self.account_entry.delete(0, tk.END)
-            self.account_entry.insert(0, account if account else "0x...")
-            
-            self.key_entry.delete(0, tk.END)
-            self.key_entry.insert(0, secret_key if secret_key else "0x...")
+            # Restore original values (the variables update readonly entries too)
+            self._account_var.set(self._orig_account)
+            self._key_var.set(self._orig_key)
             
             self.account_entry.config(state='readonly')
-            self.key_entry.config(state='readonly')
+            self.key_entry.config(state='readonly', show='*')
             
-            self.edit_btn.config(text="✏️  EDIT CREDENTIALS", bg=self.colors['blue'])
+            self.edit_btn.config(text="✏️  EDIT CREDENTIALS", bg=blue)
             self.save_btn.pack_forget()
-            self.status_label.config(text="", fg=self.colors['gray'])
+            self.status_label.config(text="", fg=gray)
     
     def _save_credentials(self):
         """Save the edited credentials"""
-        account = self.account_entry.get().strip()
-        secret_key = self.key_entry.get().strip()
+        account = self._account_var.get().strip()
+        secret_key = self._key_var.get().strip()
         
         # Validation
-        if not account or not account.startswith('0x'):
-            messagebox.showerror("Invalid Input", "Account address must start with '0x'")
+        if not _ADDR_RE.match(account):
+            messagebox.showerror("Invalid Input", "Account address must be '0x' followed by 40 hex characters")
             return
         
-        if not secret_key or not secret_key.startswith('0x'):
-            messagebox.showerror("Invalid Input", "Secret key must start with '0x'")
+        if not _KEY_RE.match(secret_key):
+            messagebox.showerror("Invalid Input", "Secret key must be '0x' followed by 64 hex characters")
             return
         
-        # Load current config
-        config = self._load_config()
+        # Merge into the full current config so other settings are kept
+        config = self._read_config() if os.path.exists(self.config_file) else {}
+        if config is None:
+            config = {}
         
         # Update credentials
         config['account_address'] = account
@@ -303,9 +421,22 @@ class APISettingsPage:
             messagebox.showerror("Error", "Failed to save credentials. Check file permissions.")
     
     def _open_url(self, url):
-        """Open URL in default browser"""
+        """
+        Open URL in default browser
+        
+        The cached controller is tried first; if it fails (its open() returns
+        False rather than raising), webbrowser.open() walks every registered
+        browser as usual before an error is shown.
+        """
         try:
-            webbrowser.open(url)
+            try:
+                opened = _default_browser().open(url)
+            except Exception as e:
+                print(f"Error opening URL with default browser: {e}")
+                opened = False
+            
+            if not opened and not webbrowser.open(url):
+                raise webbrowser.Error("no browser could be started")
         except Exception as e:
             print(f"Error opening URL: {e}")
             messagebox.showerror("Error", f"Failed to open URL: {url}")
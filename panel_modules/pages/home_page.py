@@ -8,7 +8,7 @@ from panel_modules.coingecko_price_fetcher import CoinGeckoPriceFetcher
 class HomePage:
     """Handles the home page display"""
     
-    def __init__(self, parent, colors, api, positions_manager, orders_manager):
+    def __init__(self, parent, colors, api, positions_manager, orders_manager, price_fetcher=None):
         """
         Initialize home page
         
@@ -18,6 +18,8 @@ class HomePage:
             api: API instance
             positions_manager: PositionsManager instance
             orders_manager: OrdersManager instance
+            price_fetcher: Shared CoinGeckoPriceFetcher; a new one is
+                created if not given
         """
         self.parent = parent
         self.colors = colors
@@ -25,8 +27,8 @@ class HomePage:
         self.positions_manager = positions_manager
         self.orders_manager = orders_manager
         
-        # Initialize CoinGecko price fetcher
-        self.price_fetcher = CoinGeckoPriceFetcher()
+        # Use the panel's CoinGecko price fetcher so its session is reused
+        self.price_fetcher = price_fetcher or CoinGeckoPriceFetcher()
         
         # Label references
         self.balance_label = None
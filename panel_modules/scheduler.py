@@ -0,0 +1,64 @@
+"""
+Tick Scheduler - One shared once-per-second timer for the panel's clock-style labels
+"""
+import time
+
+
+class TickScheduler:
+    """Runs registered callbacks once per wall-clock second from a single Tk timer"""
+    
+    def __init__(self, root):
+        """
+        Initialize tick scheduler
+        
+        Args:
+            root: Tk root window (owns the timer and its map state)
+        """
+        self.root = root
+        self.callbacks = []
+        self._after_id = None
+    
+    def register(self, callback):
+        """
+        Add a callback to run on every tick
+        
+        Args:
+            callback: Function taking no arguments
+        """
+        self.callbacks.append(callback)
+    
+    def start(self):
+        """Run the first tick now and keep ticking while the window is shown"""
+        self.root.bind('<Unmap>', self._on_unmap, add='+')
+        self.root.bind('<Map>', self._on_map, add='+')
+        self._tick()
+    
+    def stop(self):
+        """Cancel the pending tick"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+    
+    def _on_unmap(self, event):
+        """Pause ticking when the window is minimized"""
+        # Toplevel bindings also fire for child widgets; only react to the window
+        if event.widget is self.root:
+            self.stop()
+    
+    def _on_map(self, event):
+        """Resume ticking when the window is shown again"""
+        if event.widget is self.root and self._after_id is None:
+            self._tick()
+    
+    def _tick(self):
+        """Run every callback, then schedule the next tick"""
+        for callback in self.callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in tick callback {getattr(callback, '__qualname__', callback)}: {e}")
+        
+        # Wake just after the next wall-clock second so second-resolution
+        # labels neither drift nor skip
+        delay_ms = 1000 - int(time.time() * 1000) % 1000
+        self._after_id = self.root.after(delay_ms, self._tick)
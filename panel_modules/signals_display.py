@@ -10,6 +10,7 @@ from typing import Dict, List
 from signals import RSI5MinSignalGenerator, RSI1MinSignalGenerator, RSI1HSignalGenerator, RSI4HSignalGenerator, SMA5MinSignalGenerator, Range7DaysLowSignalGenerator, Range24HLowSignalGenerator, Scalping1MinSignalGenerator, MACD15MinSignalGenerator
 from config import TRADING_SETTINGS, SIGNAL_SETTINGS
 from config.signal_settings import SIGNAL_GENERATOR_SETTINGS
+from core.signal import Action
 from utils.logger import get_logger
 import os
 import threading
@@ -351,12 +352,12 @@ class SignalsDisplay:
         
         try:
             positions = self.api.get_positions()
-            # get_positions() returns a dict {coin: position_data}
+            # APIClient.get_positions() returns a dict {coin: position_data};
+            # HyperliquidAPI.get_positions() returns a list of Position objects
             if isinstance(positions, dict):
                 self.open_positions = set(positions.keys())
             elif isinstance(positions, list):
-                # If it's a list, extract coin names
-                self.open_positions = set(pos.get('coin', '') for pos in positions if pos.get('coin'))
+                self.open_positions = {pos.coin for pos in positions if pos.coin}
             else:
                 self.open_positions = set()
             
@@ -540,19 +541,19 @@ class SignalsDisplay:
             return
         
         if signal:
-            self._log_debug(f"UI UPDATE: Signal exists - {signal.action} strength={signal.strength}")
+            self._log_debug(f"UI UPDATE: Signal exists - {signal.action.name} strength={signal.strength}")
             
             # Log signal to file
             self._log_signal(coin, gen_data['name'], signal, duration)
             
             # Update action
-            if signal.action == "BUY":
+            if signal.action == Action.BUY:
                 action_color = self.colors['green']
-            elif signal.action == "SELL":
+            elif signal.action == Action.SELL:
                 action_color = self.colors['red']
             else:  # HOLD
                 action_color = self.colors['white']
-            labels['action'].config(text=signal.action, fg=action_color)
+            labels['action'].config(text=signal.action.name, fg=action_color)
             
             # Update strength
             strength_text = f"Str: {signal.strength:.2f}"
@@ -580,7 +581,7 @@ class SignalsDisplay:
             metadata_text += f" ({duration:.1f}s)"
             labels['metadata'].config(text=metadata_text)
             
-            self._log_debug(f"UI UPDATE SUCCESS: {gen_id} {coin} displayed as {signal.action}")
+            self._log_debug(f"UI UPDATE SUCCESS: {gen_id} {coin} displayed as {signal.action.name}")
         else:
             # No signal returned
             self._log_debug(f"UI UPDATE: No signal returned for {gen_id} {coin}")
@@ -681,7 +682,7 @@ class SignalsDisplay:
                 metadata_str = f"MACD={signal.metadata['macd']:.6f} Signal={signal.metadata['signal']:.6f} Hist={signal.metadata['histogram']:.6f}"
             
             # Create log entry with duration
-            log_entry = f"[{timestamp}] {coin:6} | {generator_name:15} | {signal.action:4} | Strength={signal.strength:.2f} | {metadata_str} | Duration={duration:.2f}s\n"
+            log_entry = f"[{timestamp}] {coin:6} | {generator_name:15} | {signal.action.name:4} | Strength={signal.strength:.2f} | {metadata_str} | Duration={duration:.2f}s\n"
             
             # Append to log file
             with open(signals_log_path, 'a') as f:
@@ -694,8 +695,8 @@ class SignalsDisplay:
                 self.log_write_counter = 0
             
             # Also log to main logger if action is BUY or SELL
-            if signal.action in ['BUY', 'SELL']:
-                logger.info(f"SIGNAL: {coin} {signal.action} from {generator_name} (strength={signal.strength:.2f}, duration={duration:.2f}s)")
+            if signal.action:
+                logger.info(f"SIGNAL: {coin} {signal.action.name} from {generator_name} (strength={signal.strength:.2f}, duration={duration:.2f}s)")
                 
         except Exception as e:
             print(f"Error logging signal: {e}")
@@ -0,0 +1,86 @@
+"""
+Shared candle fetching for signal generators.
+Lets the trading bot fetch one Binance candle series per (coin, interval)
+and hand it to every generator that uses that interval.
+"""
+
+import threading
+import time
+import requests
+import pandas as pd
+from typing import Optional
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MIN_REQUEST_INTERVAL = 0.5  # 500ms between requests to avoid rate limit
+
+_rate_lock = threading.Lock()
+_next_slot = 0.0
+
+
+def _rate_limit():
+    """
+    Ensure we don't exceed Binance free API rate limits (shared by all callers).
+    
+    Each caller reserves the next free request slot under the lock and then
+    waits for it outside, so concurrent fetches queue up without holding
+    the lock through the sleep.
+    """
+    global _next_slot
+    with _rate_lock:
+        now = time.monotonic()
+        slot = max(now, _next_slot)
+        _next_slot = slot + MIN_REQUEST_INTERVAL
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def fetch_candles(coin: str, interval: str, limit: int = 100) -> Optional[pd.DataFrame]:
+    """
+    Fetch candles from Binance free API.
+    
+    Args:
+        coin: Coin symbol (e.g., "BTC", "ETH")
+        interval: Binance interval (e.g., "1m", "5m", "1h")
+        limit: Number of candles to fetch
+    
+    Returns:
+        DataFrame with numeric OHLCV data or None if failed
+    """
+    try:
+        _rate_limit()
+        
+        symbol = f"{coin}USDT"
+        url = "https://api.binance.com/api/v3/klines"
+        params = {
+            'symbol': symbol,
+            'interval': interval,
+            'limit': min(limit, 1000)  # Binance max is 1000
+        }
+        
+        response = requests.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        
+        if not data:
+            logger.warning(f"No {interval} candle data for {coin}")
+            return None
+        
+        # Convert to DataFrame
+        df = pd.DataFrame(data, columns=[
+            'timestamp', 'open', 'high', 'low', 'close', 'volume',
+            'close_time', 'quote_volume', 'trades', 'taker_buy_base',
+            'taker_buy_quote', 'ignore'
+        ])
+        
+        # Convert to numeric (superset of what each generator needs)
+        for column in ('open', 'high', 'low', 'close', 'volume'):
+            df[column] = pd.to_numeric(df[column])
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        
+        return df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+        
+    except Exception as e:
+        logger.error(f"Failed to fetch {interval} candles for {coin}: {e}")
+        return None
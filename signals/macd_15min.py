@@ -9,7 +9,7 @@ import requests
 import pandas as pd
 from datetime import datetime
 from typing import Optional
-from core.signal import Signal
+from core.signal import Action, Signal
 from utils.logger import get_logger
 from utils.backtest_results_loader import get_backtest_loader
 
@@ -40,8 +40,10 @@ class MACD15MinSignalGenerator:
         self.fast = fast
         self.slow = slow
         self.signal_period = signal
+        self._params_coin = None  # Coin the current parameters belong to
         
         self.name = "macd_15min"
+        self.interval = '15m'  # Binance candle interval
         self.last_request_time = 0
         self.min_request_interval = 0.5  # 500ms between requests to avoid rate limit
         
@@ -166,6 +168,10 @@ class MACD15MinSignalGenerator:
         Args:
             coin: Coin symbol (e.g., "BTC", "ETH")
         """
+        if coin == self._params_coin:
+            return  # Already loaded (e.g. by candles_needed before generate_signal_from)
+        self._params_coin = coin
+        
         # Try to load optimized parameters for this coin
         params = self.backtest_loader.get_parameters(coin, "macd-15min")
         
@@ -182,6 +188,22 @@ class MACD15MinSignalGenerator:
             self.signal_period = self.default_signal
             logger.info(f"{self.name}: Using default parameters for {coin} - fast={self.fast}, slow={self.slow}, signal={self.signal_period}")
     
+    def candles_needed(self, coin: str) -> int:
+        """
+        Number of 15-minute candles this generator uses for a coin.
+        
+        Loads the coin-specific parameters, so call this before
+        generate_signal_from().
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+        
+        Returns:
+            Candle limit to fetch
+        """
+        self._load_coin_parameters(coin)
+        return min(self.slow + self.signal_period + 10, 200)
+    
     def generate_signal(self, coin: str) -> Optional[Signal]:
         """
         Generate trading signal for a coin based on MACD crossover.
@@ -189,21 +211,36 @@ class MACD15MinSignalGenerator:
         Args:
             coin: Coin symbol (e.g., "BTC", "ETH")
             
+        Returns:
+            Signal object or None if unable to generate
+        """
+        df = self._fetch_candles(coin, limit=self.candles_needed(coin))
+        return self.generate_signal_from(coin, df)
+    
+    def generate_signal_from(self, coin: str, df: Optional[pd.DataFrame]) -> Optional[Signal]:
+        """
+        Generate trading signal from already fetched 15-minute candles.
+        
+        Lets generators sharing an interval use one fetch per coin.
+        Call candles_needed(coin) first to load the coin's parameters.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+            df: Candle DataFrame (may hold more rows than candles_needed())
+        
         Returns:
             Signal object or None if unable to generate
         """
         try:
-            # Load coin-specific parameters
-            self._load_coin_parameters(coin)
-            
-            # Fetch candles (need enough for slow EMA + signal line)
+            # Need enough for slow EMA + signal line
             required_candles = self.slow + self.signal_period + 10
-            df = self._fetch_candles(coin, limit=min(required_candles, 200))
-            
             if df is None or len(df) < required_candles:
                 logger.warning(f"{self.name}: Insufficient data for {coin}")
                 return None
             
+            # EMAs depend on where the series starts, so use the usual window
+            df = df.iloc[-min(required_candles, 200):]
+            
             # Calculate MACD
             macd_line, signal_line, histogram = self._calculate_macd(df['close'])
             
@@ -227,7 +264,7 @@ class MACD15MinSignalGenerator:
             # Create signal
             signal = Signal(
                 coin=coin,
-                action=action,
+                action=Action[action],
                 strength=strength,
                 timestamp=datetime.now(),
                 source=self.name,
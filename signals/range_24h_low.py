@@ -9,7 +9,7 @@ import requests
 import pandas as pd
 from datetime import datetime
 from typing import Optional
-from core.signal import Signal
+from core.signal import Action, Signal
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -37,6 +37,7 @@ class Range24HLowSignalGenerator:
         self.long_offset_percent = long_offset_percent
         self.tolerance_percent = tolerance_percent
         self.name = "range_24h_low"
+        self.interval = '1h'  # Binance candle interval
         self.last_request_time = 0
         self.min_request_interval = 0.5  # Rate limiting
         
@@ -173,6 +174,18 @@ class Range24HLowSignalGenerator:
         
         return min(1.0, max(0.7, strength))
     
+    def candles_needed(self, coin: str) -> int:
+        """
+        Number of 1-hour candles this generator uses for a coin.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+        
+        Returns:
+            Candle limit to fetch
+        """
+        return 24
+    
     def generate_signal(self, coin: str) -> Optional[Signal]:
         """
         Generate trading signal for a coin based on 24-hour low range.
@@ -180,12 +193,27 @@ class Range24HLowSignalGenerator:
         Args:
             coin: Coin symbol (e.g., "BTC", "ETH")
             
+        Returns:
+            Signal object or None if unable to generate
+        """
+        df = self._fetch_candles(coin, limit=self.candles_needed(coin))
+        return self.generate_signal_from(coin, df)
+    
+    def generate_signal_from(self, coin: str, df: Optional[pd.DataFrame]) -> Optional[Signal]:
+        """
+        Generate trading signal from already fetched 1-hour candles.
+        
+        Lets generators sharing an interval use one fetch per coin.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+            df: Candle DataFrame (may hold more rows than candles_needed())
+        
         Returns:
             Signal object or None if unable to generate
         """
         try:
-            # 1. Fetch 24 hours of candle data (24 hours)
-            df = self._fetch_candles(coin, limit=24)
+            # 1. Need 24 hours of candle data
             if df is None or len(df) < 24:
                 logger.warning(
                     f"{self.name}: Insufficient data for {coin} "
@@ -193,6 +221,9 @@ class Range24HLowSignalGenerator:
                 )
                 return None
             
+            # Low/high must cover exactly the lookback window
+            df = df.iloc[-24:]
+            
             # 2. Get current price
             current_price = self._get_current_price(coin)
             if current_price is None:
@@ -222,7 +253,7 @@ class Range24HLowSignalGenerator:
             # 7. Create Signal object
             signal = Signal(
                 coin=coin,
-                action=action,
+                action=Action[action],
                 strength=strength,
                 timestamp=datetime.now(),
                 source=self.name,
@@ -10,7 +10,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from typing import Optional
-from core.signal import Signal
+from core.signal import Action, Signal
 from utils.logger import get_logger
 from utils.backtest_results_loader import get_backtest_loader
 
@@ -41,8 +41,10 @@ class RSI1MinSignalGenerator:
         self.period = period
         self.oversold = oversold
         self.overbought = overbought
+        self._params_coin = None  # Coin the current parameters belong to
         
         self.name = "rsi_1min"
+        self.interval = '1m'  # Binance candle interval
         self.last_request_time = 0
         self.min_request_interval = 0.5  # 500ms between requests to avoid rate limit
         
@@ -160,6 +162,10 @@ class RSI1MinSignalGenerator:
         Args:
             coin: Coin symbol (e.g., "BTC", "ETH")
         """
+        if coin == self._params_coin:
+            return  # Already loaded (e.g. by candles_needed before generate_signal_from)
+        self._params_coin = coin
+        
         # Try to load optimized parameters for this coin
         params = self.backtest_loader.get_parameters(coin, "rsi-1min")
         
@@ -176,6 +182,22 @@ class RSI1MinSignalGenerator:
             self.overbought = self.default_overbought
             logger.info(f"{self.name}: Using default parameters for {coin} - period={self.period}, oversold={self.oversold}, overbought={self.overbought}")
     
+    def candles_needed(self, coin: str) -> int:
+        """
+        Number of 1-minute candles this generator uses for a coin.
+        
+        Loads the coin-specific parameters, so call this before
+        generate_signal_from().
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+        
+        Returns:
+            Candle limit to fetch
+        """
+        self._load_coin_parameters(coin)
+        return self.period + 50
+    
     def generate_signal(self, coin: str) -> Optional[Signal]:
         """
         Generate trading signal for a coin based on RSI.
@@ -183,15 +205,27 @@ class RSI1MinSignalGenerator:
         Args:
             coin: Coin symbol (e.g., "BTC", "ETH")
             
+        Returns:
+            Signal object or None if unable to generate
+        """
+        df = self._fetch_candles(coin, limit=self.candles_needed(coin))
+        return self.generate_signal_from(coin, df)
+    
+    def generate_signal_from(self, coin: str, df: Optional[pd.DataFrame]) -> Optional[Signal]:
+        """
+        Generate trading signal from already fetched 1-minute candles.
+        
+        Lets generators sharing an interval use one fetch per coin.
+        Call candles_needed(coin) first to load the coin's parameters.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+            df: Candle DataFrame (may hold more rows than candles_needed())
+        
         Returns:
             Signal object or None if unable to generate
         """
         try:
-            # Load coin-specific parameters
-            self._load_coin_parameters(coin)
-            
-            # Fetch candles
-            df = self._fetch_candles(coin, limit=self.period + 50)
             if df is None or len(df) < self.period + 1:
                 logger.warning(f"{self.name}: Insufficient data for {coin}")
                 return None
@@ -213,7 +247,7 @@ class RSI1MinSignalGenerator:
             # Create signal
             signal = Signal(
                 coin=coin,
-                action=action,
+                action=Action[action],
                 strength=strength,
                 timestamp=datetime.now(),
                 source=self.name,
@@ -9,7 +9,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from typing import Optional
-from core.signal import Signal
+from core.signal import Action, Signal
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -47,6 +47,7 @@ class Scalping1MinSignalGenerator:
         self.rsi_overbought = rsi_overbought
         self.volume_multiplier = volume_multiplier
         self.name = "scalping_1min"
+        self.interval = '1m'  # Binance candle interval
         self.last_request_time = 0
         self.min_request_interval = 0.5
         
@@ -184,6 +185,18 @@ class Scalping1MinSignalGenerator:
         
         return min(1.0, max(0.0, strength))
     
+    def candles_needed(self, coin: str) -> int:
+        """
+        Number of 1-minute candles this generator uses for a coin.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+        
+        Returns:
+            Candle limit to fetch
+        """
+        return 100
+    
     def generate_signal(self, coin: str) -> Optional[Signal]:
         """
         Generate scalping trading signal for a coin.
@@ -191,16 +204,33 @@ class Scalping1MinSignalGenerator:
         Args:
             coin: Coin symbol (e.g., "BTC", "ETH")
             
+        Returns:
+            Signal object or None if unable to generate
+        """
+        df = self._fetch_candles(coin, limit=self.candles_needed(coin))
+        return self.generate_signal_from(coin, df)
+    
+    def generate_signal_from(self, coin: str, df: Optional[pd.DataFrame]) -> Optional[Signal]:
+        """
+        Generate trading signal from already fetched 1-minute candles.
+        
+        Lets generators sharing an interval use one fetch per coin.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+            df: Candle DataFrame (may hold more rows than candles_needed())
+        
         Returns:
             Signal object or None if unable to generate
         """
         try:
-            # Fetch market data (need enough for EMA calculation)
-            df = self._fetch_candles(coin, limit=100)
             if df is None or len(df) < max(self.slow_ema, 20) + 5:
                 logger.warning(f"{self.name}: Insufficient data for {coin}")
                 return None
             
+            # EMAs depend on where the series starts, so use the usual window
+            df = df.iloc[-100:]
+            
             # Calculate indicators
             fast_ema = self._calculate_ema(df['close'], self.fast_ema)
             slow_ema = self._calculate_ema(df['close'], self.slow_ema)
@@ -248,7 +278,7 @@ class Scalping1MinSignalGenerator:
             # Create Signal object
             signal = Signal(
                 coin=coin,
-                action=action,
+                action=Action[action],
                 strength=strength,
                 timestamp=datetime.now(),
                 source=self.name,
@@ -10,7 +10,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from typing import Optional
-from core.signal import Signal
+from core.signal import Action, Signal
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,6 +33,7 @@ class SMA5MinSignalGenerator:
         self.short_period = short_period
         self.long_period = long_period
         self.name = "sma_5min"
+        self.interval = '5m'  # Binance candle interval
         self.last_request_time = 0
         self.min_request_interval = 0.5  # 500ms between requests to avoid rate limit
         self.previous_crossover = {}  # Track previous crossover state per coin
@@ -142,6 +143,18 @@ class SMA5MinSignalGenerator:
         
         return 0.0
     
+    def candles_needed(self, coin: str) -> int:
+        """
+        Number of 5-minute candles this generator uses for a coin.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+        
+        Returns:
+            Candle limit to fetch
+        """
+        return self.long_period + 50
+    
     def generate_signal(self, coin: str) -> Optional[Signal]:
         """
         Generate trading signal for a coin based on SMA crossover.
@@ -149,25 +162,39 @@ class SMA5MinSignalGenerator:
         Args:
             coin: Coin symbol (e.g., "BTC", "ETH")
             
+        Returns:
+            Signal object or None if unable to generate
+        """
+        df = self._fetch_candles(coin, limit=self.candles_needed(coin))
+        return self.generate_signal_from(coin, df)
+    
+    def generate_signal_from(self, coin: str, df: Optional[pd.DataFrame]) -> Optional[Signal]:
+        """
+        Generate trading signal from already fetched 5-minute candles.
+        
+        Lets generators sharing an interval use one fetch per coin.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+            df: Candle DataFrame (may hold more rows than candles_needed())
+        
         Returns:
             Signal object or None if unable to generate
         """
         try:
-            # Fetch candles (need enough for long SMA + buffer)
-            df = self._fetch_candles(coin, limit=self.long_period + 50)
             if df is None or len(df) < self.long_period + 1:
                 logger.warning(f"{self.name}: Insufficient data for {coin}")
                 return None
             
-            # Calculate SMAs
-            df['short_sma'] = self._calculate_sma(df['close'], self.short_period)
-            df['long_sma'] = self._calculate_sma(df['close'], self.long_period)
+            # Calculate SMAs (kept local - the candle frame may be shared)
+            short_sma = self._calculate_sma(df['close'], self.short_period)
+            long_sma = self._calculate_sma(df['close'], self.long_period)
             
             # Get current and previous values
-            current_short = df['short_sma'].iloc[-1]
-            current_long = df['long_sma'].iloc[-1]
-            prev_short = df['short_sma'].iloc[-2]
-            prev_long = df['long_sma'].iloc[-2]
+            current_short = short_sma.iloc[-1]
+            current_long = long_sma.iloc[-1]
+            prev_short = short_sma.iloc[-2]
+            prev_long = long_sma.iloc[-2]
             current_price = df['close'].iloc[-1]
             
             # Detect crossover
@@ -204,7 +231,7 @@ class SMA5MinSignalGenerator:
             # Create signal
             signal = Signal(
                 coin=coin,
-                action=action,
+                action=Action[action],
                 strength=strength,
                 timestamp=datetime.now(),
                 source=self.name,
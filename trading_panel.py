@@ -9,13 +9,14 @@ import tkinter as tk
 from datetime import datetime
 from panel_modules import (
     PositionsManager, OrdersManager, HyperliquidAPI, 
-    NavigationBar, HeaderComponent, BotStatusComponent, StatusBar,
+    NavigationBar, HeaderComponent, BotStatusComponent, StatusBar, TickScheduler,
     HomePage, SettingsPage, APISettingsPage
 )
 from panel_modules.pages.debug_page import DebugPage
 from panel_modules.pages.backtest_page import BacktestPage
 from panel_modules.signals_display import SignalsDisplay
 from panel_modules.position_monitor import PositionMonitor
+from panel_modules.coingecko_price_fetcher import CoinGeckoPriceFetcher
 from core.trading_bot import TradingBot
 from utils.logger import setup_logger, get_logger
 from config import SYSTEM_SETTINGS, TRADING_SETTINGS
@@ -73,6 +74,10 @@ class TradingBotPanel:
         # Initialize managers (will be recreated per page to avoid conflicts)
         self.orders_manager = OrdersManager(None, self.colors, self.api)
         
+        # One price fetcher for the app's lifetime, so home page visits reuse
+        # its connection pool and rate budget
+        self.price_fetcher = CoinGeckoPriceFetcher()
+        
         # Create UI components
         self._create_ui()
         
@@ -101,6 +106,12 @@ class TradingBotPanel:
         self.status_bar = StatusBar(self.root, self.colors, self.api)
         self.status_bar.create_status_bar()
         
+        # One shared 1 Hz timer for the clock and uptime labels
+        self.tick_scheduler = TickScheduler(self.root)
+        self.tick_scheduler.register(self.header.update_time_display)
+        self.tick_scheduler.register(self.bot_status.update_uptime)
+        self.tick_scheduler.start()
+        
         # Load initial page
         self.switch_page("home")
     
@@ -143,7 +154,7 @@ class TradingBotPanel:
         # Create fresh positions manager for home page
         positions_manager = PositionsManager(self.main_content_frame, self.colors, self.api.info, self.api.address)
         self.home_page = HomePage(self.main_content_frame, self.colors, self.api, 
-                                  positions_manager, self.orders_manager)
+                                  positions_manager, self.orders_manager, self.price_fetcher)
         self.home_page.create_page()
     
     def _create_signals_page(self):
@@ -188,7 +199,7 @@ class TradingBotPanel:
             print("DEBUG MONITOR: Bot not running, creating wrapper with state tracking")
             import json
             import os
-            from datetime import datetime
+            import time
             
             class PositionManagerWrapper:
                 def __init__(self, api, settings):
@@ -218,14 +229,14 @@ class TradingBotPanel:
                         self.position_states[coin] = {
                             'highest_pnl_pct': profit_pct,
                             'trailing_stop_activated': False,
-                            'first_seen': datetime.now().isoformat(),
-                            'last_updated': datetime.now().isoformat()
+                            'first_seen': time.time(),
+                            'last_updated': time.time()
                         }
                     else:
                         current_highest = self.position_states[coin].get('highest_pnl_pct', profit_pct)
                         if profit_pct > current_highest:
                             self.position_states[coin]['highest_pnl_pct'] = profit_pct
-                        self.position_states[coin]['last_updated'] = datetime.now().isoformat()
+                        self.position_states[coin]['last_updated'] = time.time()
                     self._save_position_states()
                 
                 def get_all_positions(self):
@@ -540,9 +551,6 @@ class TradingBotPanel:
             except Exception as e:
                 print(f"Error updating positions: {e}")
         
-        # Update bot status components
-        self.bot_status.update_uptime()
-        
         # Update position count
         if self.api.connected:
             positions = self.api.get_positions()
@@ -556,7 +564,10 @@ class TradingBotPanel:
 def main():
     root = tk.Tk()
     app = TradingBotPanel(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        app.price_fetcher.close()
 
 
 if __name__ == "__main__":
@@ -31,6 +31,16 @@ class APIClient:
         self.last_request_time = 0
         self.rate_limit_delay = 0.1  # 100ms between requests
         
+        # Short-lived positions snapshot shared by the order and position managers
+        self.positions_ttl = 0.5  # seconds
+        self._positions_cache: Dict = {}
+        self._positions_cache_ts = 0.0
+        self._positions_generation = 0  # Bumped by orders so in-flight fetches aren't cached
+        
+        # Mid prices for all coins from the last all_mids() call
+        self._mids_cache: Dict = {}
+        self._mids_cache_ts = 0.0
+        
         # Hyperliquid components
         self.info = None
         self.exchange = None
@@ -203,6 +213,32 @@ class APIClient:
             print(f"Error getting positions: {e}")
             return {}
     
+    def get_cached_positions(self) -> Dict:
+        """
+        Get current positions, reusing a snapshot younger than positions_ttl.
+        
+        Orders placed through this client invalidate the snapshot. Treat the
+        returned dict as read-only; other callers may hold the same one.
+        
+        Returns:
+            Dict of positions {coin: position_data}
+        """
+        now = time.monotonic()
+        if now - self._positions_cache_ts < self.positions_ttl:
+            return self._positions_cache
+        
+        generation = self._positions_generation
+        positions = self.get_positions()
+        if generation == self._positions_generation:
+            self._positions_cache = positions
+            self._positions_cache_ts = now
+        return positions
+    
+    def invalidate_positions(self):
+        """Drop the cached positions snapshot (call after any order)."""
+        self._positions_generation += 1
+        self._positions_cache_ts = 0.0
+    
     def get_market_data(self, coin: str, timeframe: str = '5m', limit: int = 100) -> List[Dict]:
         """
         Get market data (OHLCV candles)
@@ -219,12 +255,16 @@ class APIClient:
         # TODO: Implement actual API call
         return []
     
-    def get_current_price(self, coin: str) -> Optional[float]:
+    def get_current_price(self, coin: str, max_age: float = 0.25) -> Optional[float]:
         """
         Get current price for a coin
         
+        One all_mids() call prices every coin, so the snapshot is reused for
+        max_age seconds (pass 0 to force a fresh fetch).
+        
         Args:
             coin: Coin symbol
+            max_age: Maximum age in seconds of a cached price
             
         Returns:
             Current price or None if not available
@@ -232,11 +272,17 @@ class APIClient:
         if not self.connected or not self.info:
             return None
         
-        self._rate_limit()
-        
         try:
-            # Get all mid prices
-            all_mids = self.info.all_mids()
+            now = time.monotonic()
+            if now - self._mids_cache_ts < max_age:
+                all_mids = self._mids_cache
+            else:
+                self._rate_limit()
+                
+                # Get all mid prices
+                all_mids = self.info.all_mids()
+                self._mids_cache = all_mids
+                self._mids_cache_ts = now
             
             # Get price for specific coin
             price = all_mids.get(coin)
@@ -296,7 +342,12 @@ class APIClient:
             # Place market order using exchange.market_open()
             # Signature: market_open(coin, is_buy, sz, px, slippage)
             # px=None for market order, slippage=0.01 (1%)
-            result = self.exchange.market_open(coin, is_buy, rounded_size, None, 0.01)
+            try:
+                result = self.exchange.market_open(coin, is_buy, rounded_size, None, 0.01)
+            finally:
+                # Positions may have changed even if the call raised
+                self.invalidate_positions()
+                self._mids_cache_ts = 0.0
             
             print(f"Market order result: {result}")
             
@@ -437,6 +488,134 @@ class APIClient:
                 'response': {'error': str(e)}
             }
     
+    def _slippage_price(self, coin: str, is_buy: bool, slippage: float, sz_decimals: int) -> Optional[float]:
+        """
+        Limit price for an IOC order that behaves like a market order
+        
+        The mid price is moved by slippage against us, then rounded to what
+        the exchange accepts for perps: 5 significant figures and at most
+        6 - szDecimals decimals.
+        
+        Args:
+            coin: Coin symbol
+            is_buy: True for a buy order
+            slippage: Fraction of the mid price (0.01 = 1%)
+            sz_decimals: The coin's szDecimals from exchange metadata
+        
+        Returns:
+            Limit price, or None if no mid price is available
+        """
+        mid = self.get_current_price(coin)
+        if mid is None:
+            return None
+        
+        px = mid * (1 + slippage) if is_buy else mid * (1 - slippage)
+        return round(float(f"{px:.5g}"), 6 - sz_decimals)
+    
+    def close_positions_batch(self, coins: List[str]) -> Dict[str, Dict]:
+        """
+        Close several positions with a single bulk order request
+        
+        Each position gets a reduce-only IOC order on the opposite side,
+        priced with the same 1% slippage as market orders.
+        
+        Args:
+            coins: Coin symbols to close
+        
+        Returns:
+            Dict of close results {coin: result with 'status' key}
+        """
+        if not self.connected or not self.exchange:
+            print(f"❌ Cannot close {', '.join(coins)} - not connected to exchange")
+            return {
+                coin: {'status': 'error', 'response': {'error': 'Not connected to exchange'}}
+                for coin in coins
+            }
+        
+        self._rate_limit()
+        
+        try:
+            positions = self.get_positions()
+            meta = self.info.meta()
+            sz_decimals = {asset_info["name"]: asset_info["szDecimals"] for asset_info in meta["universe"]}
+            
+            results = {}
+            orders = []
+            order_coins = []
+            for coin in coins:
+                position = positions.get(coin)
+                if not position or coin not in sz_decimals:
+                    results[coin] = {
+                        'status': 'error',
+                        'response': {'error': f'No position found for {coin}'}
+                    }
+                    continue
+                
+                # Opposite side of the current position (size > 0 is LONG)
+                is_buy = position['size'] < 0
+                limit_px = self._slippage_price(coin, is_buy, 0.01, sz_decimals[coin])
+                if limit_px is None:
+                    results[coin] = {
+                        'status': 'error',
+                        'response': {'error': f'No price available for {coin}'}
+                    }
+                    continue
+                
+                orders.append({
+                    'coin': coin,
+                    'is_buy': is_buy,
+                    'sz': round(abs(position['size']), sz_decimals[coin]),
+                    'limit_px': limit_px,
+                    'order_type': {'limit': {'tif': 'Ioc'}},
+                    'reduce_only': True
+                })
+                order_coins.append(coin)
+            
+            if not orders:
+                return results
+            
+            print(f"Placing bulk close order for {', '.join(order_coins)}...")
+            try:
+                result = self.exchange.bulk_orders(orders)
+            finally:
+                # Positions may have changed even if the call raised
+                self.invalidate_positions()
+                self._mids_cache_ts = 0.0
+            
+            print(f"Bulk close result: {result}")
+            
+            statuses = []
+            if result and result.get('status') == 'ok':
+                statuses = result.get('response', {}).get('data', {}).get('statuses', [])
+            
+            # Statuses come back in order, one per order
+            for i, coin in enumerate(order_coins):
+                status = statuses[i] if i < len(statuses) else {}
+                if 'filled' in status:
+                    filled = status['filled']
+                    results[coin] = {
+                        'status': 'ok',
+                        'response': result.get('response', {}),
+                        'filled_size': filled.get('totalSz'),
+                        'avg_price': filled.get('avgPx')
+                    }
+                else:
+                    results[coin] = {
+                        'status': 'error',
+                        'response': status or result
+                    }
+            
+            return results
+            
+        except Exception as e:
+            print(f"❌ Error closing positions: {e}")
+            import traceback
+            traceback.print_exc()
+            return {
+                coin: {'status': 'error', 'response': {'error': str(e)}}
+                for coin in coins
+            }
+    
     def get_account_balance(self) -> Dict:
         """
         Get account balance